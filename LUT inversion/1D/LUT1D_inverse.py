@@ -1,6 +1,6 @@
 import numpy as np, colour
 from colour.algebra import LinearInterpolator
-from colour.constants import DEFAULT_INT_DTYPE
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities.deprecation import handle_arguments_deprecation
 
 
@@ -22,11 +22,604 @@ def inverse(self):
     return table_i
 
 
+def piecewise_linear_nodes(x, y, inverse=False):
+    """
+    Returns the nodes of the piecewise linear function through given
+    monotonic abscissae and given ordinates, or of its inverse, as evaluated
+    by :func:`evaluate_piecewise_linear` definition.
+
+    Parameters
+    ----------
+    x : array_like
+        Monotonic abscissae, e.g. *LUT* samples.
+    y : array_like
+        Ordinates, e.g. *LUT* table values.
+    inverse : bool, optional
+        Whether to return the nodes of the inverse function, i.e. swapping
+        the abscissae and the ordinates, which must then be monotonic.
+
+    Returns
+    -------
+    tuple
+        Increasing abscissae, ordinates, slopes of the segments and uniform
+        buckets of the abscissae locating the segments.
+    """
+
+    values, samples = (np.copy(y), np.copy(x)) if inverse else (np.copy(x),
+                                                                np.copy(y))
+    if values[-1] < values[0]:
+        values, samples = values[::-1], samples[::-1]
+
+    if np.any(np.diff(values) < 0):
+        colour.utilities.usage_warning(
+            'LUT is not monotonic, its inverse is not unique!')
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slopes = np.diff(samples) / np.diff(values)
+    slopes[~np.isfinite(slopes)] = 0
+
+    # Uniform buckets of the abscissae: a bucket holding at most one
+    # abscissa locates the segment of any value in it with a single
+    # comparison, the values of the other buckets are binary searched.
+    count = min(4 * len(values), 2 ** 16)
+    scale = (count / (values[-1] - values[0])
+             if values[-1] > values[0] else 0)
+    buckets = np.minimum(
+        np.floor((values - values[0]) * scale), count - 1).astype(np.intp)
+    starts = np.clip(
+        np.searchsorted(buckets, np.arange(count)) - 1, 0, len(values) - 2)
+    dense = np.bincount(buckets, minlength=count) > 1
+
+    return values, samples, slopes, (scale, starts, dense)
+
+
+def piecewise_linear_inverse(self):
+    """
+    Returns the nodes of the exact piecewise linear inverse of the *LUT*,
+    i.e. its table values and the samples they are reached at, sorted by
+    increasing table values.
+
+    The nodes are cached on the *LUT* and only recomputed when its table or
+    domain changes.
+
+    Returns
+    -------
+    tuple
+        Table values, samples, slopes of the inverse segments and uniform
+        buckets of the table values locating the segments, see
+        :func:`evaluate_piecewise_linear` definition.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT1D(colour.LUT1D.linear_table(5) ** 2)
+    >>> piecewise_linear_inverse(LUT)[1]
+    array([ 0.  ,  0.25,  0.5 ,  0.75,  1.  ])
+    """
+
+    cache = getattr(self, '_inverse_cache', None)
+    if (cache is not None and np.array_equal(cache[0], self._table) and
+            np.array_equal(cache[1], self._domain)):
+        return cache[2]
+
+    if self.is_domain_explicit():
+        samples = np.copy(self.domain)
+    else:
+        domain_min, domain_max = self.domain
+        samples = np.linspace(domain_min, domain_max, self._table.size)
+
+    nodes = piecewise_linear_nodes(samples, self._table, True)
+    self._inverse_cache = (np.copy(self._table), np.copy(self._domain), nodes)
+
+    return nodes
+
+
+def evaluate_piecewise_linear(nodes, x, chunk_size=8192, out=None,
+                              dtype=None):
+    """
+    Evaluates given piecewise linear function nodes at given values, the
+    first and last segments being linearly extrapolated.
+
+    Parameters
+    ----------
+    nodes : tuple
+        Increasing abscissae, ordinates, segments slopes and abscissae
+        buckets as returned by :func:`piecewise_linear_inverse` definition.
+    x : array_like
+        Values to evaluate the function at.
+    chunk_size : int, optional
+        Values count evaluated at once, keeping the intermediate arrays in
+        the processor cache.
+    out : ndarray, optional
+        C-contiguous array of the shape of the values to write the function
+        values into.
+    dtype : object, optional
+        Floating point type the function is evaluated in, see
+        :func:`float_dtype` definition.
+
+    Returns
+    -------
+    ndarray
+        Function values, *NaN* at the non-finite values.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT1D(np.array([0, 1, 3]), domain=np.array([0, 2, 3]))
+    >>> nodes = piecewise_linear_inverse(LUT)
+    >>> evaluate_piecewise_linear(nodes, np.array([-1, 0.5, 2, 5]))
+    array([-2. ,  1. ,  2.5,  4. ])
+    """
+
+    x = np.asarray(x)
+    dtype = float_dtype(x, dtype, out)
+    x = x.astype(dtype, copy=False)
+    x_p, y_p, slopes = (a.astype(dtype, copy=False) for a in nodes[:3])
+    scale, starts, dense = nodes[3]
+    scale = dtype.type(scale)
+    out, y = _output(x, out)
+    x = np.ravel(x)
+
+    for start in range(0, len(x), chunk_size):
+        x_c = x[start:start + chunk_size]
+        bucket, non_finite = _cells((x_c - x_p[0]) * scale, len(starts))
+        i = starts[bucket]
+        i += x_c >= x_p[i + 1]
+        np.minimum(i, len(x_p) - 2, out=i)
+
+        search = np.nonzero(dense[bucket])[0]
+        if len(search):
+            i[search] = np.clip(
+                np.searchsorted(x_p, x_c[search], 'right') - 1, 0,
+                len(x_p) - 2)
+
+        y_c = y[start:start + chunk_size]
+        np.subtract(x_c, x_p[i], out=y_c)
+        y_c *= slopes[i]
+        y_c += y_p[i]
+        if non_finite is not None:
+            y_c[non_finite] = np.nan
+
+    return out
+
+
+def float_dtype(x, dtype=None, out=None):
+    """
+    Returns the floating point type given values are processed in, tables,
+    intermediate arrays and outputs being cast to it so that nothing is
+    silently upcast.
+
+    Parameters
+    ----------
+    x : ndarray
+        Values to process.
+    dtype : object, optional
+        Floating point type, defaults to the type of given output array, or
+        of the values if they are floating point, or
+        :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute otherwise.
+    out : ndarray, optional
+        Output array, whose type must be the floating point type.
+
+    Returns
+    -------
+    dtype
+        Floating point type.
+
+    Raises
+    ------
+    ValueError
+        If the type is not a floating point type, or is not the output array
+        type.
+
+    Notes
+    -----
+    -   Processing in *np.float32* halves the memory traffic of
+        *np.float32* images, a piecewise linear or cubic evaluation is then
+        within a few units in the last place of the output, i.e. within
+        :math:`10^{-6}` of the *np.float64* evaluation for tables and values
+        in domain [0, 1], the values and the tables being rounded to
+        *np.float32* first.
+
+    Examples
+    --------
+    >>> float_dtype(np.zeros(3, dtype=np.float32))
+    dtype('float32')
+    >>> float_dtype(np.zeros(3, dtype=np.int32))
+    dtype('float64')
+    """
+
+    if dtype is None:
+        if out is not None:
+            dtype = out.dtype
+        elif np.issubdtype(x.dtype, np.floating):
+            dtype = x.dtype
+        else:
+            dtype = DEFAULT_FLOAT_DTYPE
+
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError('"{0}" type is not a floating point type!'.format(
+            dtype))
+
+    if out is not None and out.dtype != dtype:
+        raise ValueError(
+            '"{0}" output array type is not "{1}" processing type!'.format(
+                out.dtype, dtype))
+
+    return dtype
+
+
+def _output(x, out=None):
+    """
+    Returns given output array, allocated with the shape and type of given
+    values if not given, and a flat view of it.
+    """
+
+    if out is None:
+        out = np.empty(x.shape, dtype=x.dtype)
+
+    # Assigning the shape of a view raises instead of copying if the output
+    # array is not contiguous.
+    y = out.view()
+    y.shape = (-1, )
+
+    return out, y
+
+
+def _validate_range(x, coordinates, lower, upper):
+    """
+    Raises a *ValueError* if given values interpolation range coordinates are
+    below given lower or above given upper coordinates, *NaN* values being in
+    range.
+    """
+
+    if np.any(coordinates < lower):
+        raise ValueError('"{0}" is below interpolation range.'.format(x))
+    if np.any(coordinates > upper):
+        raise ValueError('"{0}" is above interpolation range.'.format(x))
+
+
+def _cells(coordinates, count):
+    """
+    Returns the cells, clipped to [0, count - 1], of given cells coordinates,
+    and the mask of the non-finite coordinates or *None* if all of them are
+    finite, the non-finite coordinates being replaced in place with zeros as
+    casting them to indexes is undefined.
+    """
+
+    non_finite = ~np.isfinite(coordinates)
+    if np.any(non_finite):
+        coordinates[non_finite] = 0
+    else:
+        non_finite = None
+
+    return np.clip(coordinates, 0, count - 1).astype(np.intp), non_finite
+
+
+def uniform_linear_interpolation(table,
+                                 domain,
+                                 x,
+                                 extrapolate=False,
+                                 chunk_size=8192,
+                                 out=None,
+                                 dtype=None):
+    """
+    Linearly interpolates given table uniformly sampled over given domain at
+    given values, the cells being indexed with arithmetic rather than
+    searched.
+
+    Parameters
+    ----------
+    table : array_like
+        Table values.
+    domain : array_like
+        Implicit domain, i.e. minimum and maximum samples.
+    x : array_like
+        Values to interpolate the table at.
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the end cells of the table beyond its
+        domain, a *ValueError* being raised otherwise, like
+        :class:`colour.algebra.LinearInterpolator` class does.
+    chunk_size : int, optional
+        Values count interpolated at once, keeping the intermediate arrays in
+        the processor cache.
+    out : ndarray, optional
+        C-contiguous array of the shape of the values to write the
+        interpolated values into.
+    dtype : object, optional
+        Floating point type the table is interpolated in, see
+        :func:`float_dtype` definition.
+
+    Returns
+    -------
+    ndarray
+        Interpolated values.
+
+    Notes
+    -----
+    -   Non-finite values are interpolated as *NaN*, infinite values being
+        outside the domain when not extrapolating.
+
+    Examples
+    --------
+    >>> table = np.array([0, 0.25, 1])
+    >>> uniform_linear_interpolation(table, np.array([0, 2]), [0.5, 1.5])
+    array([ 0.125,  0.625])
+    >>> uniform_linear_interpolation(table, np.array([0, 2]), 3, True)
+    array(1.75)
+    """
+
+    x = np.asarray(x)
+    dtype = float_dtype(x, dtype, out)
+    x = x.astype(dtype, copy=False)
+    table = np.asarray(table, dtype=dtype)
+    domain_min, domain_max = dtype.type(domain[0]), dtype.type(domain[-1])
+    out, y = _output(x, out)
+    x = np.ravel(x)
+
+    size = len(table)
+    scale = dtype.type((size - 1) / (domain_max - domain_min))
+    slopes = np.diff(table)
+
+    for start in range(0, len(x), chunk_size):
+        x_c = x[start:start + chunk_size]
+        y_c = y[start:start + chunk_size]
+
+        np.subtract(x_c, domain_min, out=y_c)
+        y_c *= scale
+        if not extrapolate:
+            _validate_range(x_c, y_c, 0, size - 1)
+
+        i, non_finite = _cells(y_c, size - 1)
+        y_c -= i
+        y_c *= slopes[i]
+        y_c += table[i]
+        if non_finite is not None:
+            y_c[non_finite] = np.nan
+
+    return out
+
+
+def monotone_cubic_coefficients(x, y):
+    """
+    Returns the coefficients of the monotone piecewise cubic *Hermite*
+    interpolant through given increasing abscissae and given ordinates, the
+    derivatives at the nodes being chosen with the *Fritsch-Carlson* method,
+    as used by *PCHIP*, so that the interpolant is monotonic wherever the
+    ordinates are.
+
+    Parameters
+    ----------
+    x : array_like
+        Increasing abscissae.
+    y : array_like
+        Ordinates.
+
+    Returns
+    -------
+    ndarray
+        Coefficients of shape (size - 1, 4) of the cubic polynomials of the
+        segments in the unit parameter :math:`t` of each segment, i.e.
+        :math:`y = c_0 + t (c_1 + t (c_2 + t c_3))`, the coefficients of a
+        segment being contiguous in memory.
+
+    Examples
+    --------
+    >>> monotone_cubic_coefficients([0, 1, 2], [0, 1, 2])
+    array([[ 0.,  1.,  0.,  0.],
+           [ 1.,  1.,  0.,  0.]])
+    """
+
+    x = np.asarray(x, dtype=np.float_)
+    y = np.asarray(y, dtype=np.float_)
+
+    h = np.diff(x)
+    delta = np.diff(y) / h
+
+    d = np.zeros(len(x))
+    if len(x) == 2:
+        d[:] = delta
+    else:
+        # Weighted harmonic mean of the adjacent secants where they have the
+        # same sign, a zero derivative otherwise.
+        w_1 = 2 * h[1:] + h[:-1]
+        w_2 = h[1:] + 2 * h[:-1]
+        same_sign = delta[:-1] * delta[1:] > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d[1:-1] = np.where(
+                same_sign, (w_1 + w_2) / (w_1 / delta[:-1] + w_2 / delta[1:]),
+                0)
+
+        # Non-centered three-points end derivatives, clamped to preserve the
+        # shape of the end segments.
+        for end, h_0, h_1, delta_0, delta_1 in (
+            (0, h[0], h[1], delta[0], delta[1]),
+            (-1, h[-1], h[-2], delta[-1], delta[-2])):
+            d_e = ((2 * h_0 + h_1) * delta_0 - h_0 * delta_1) / (h_0 + h_1)
+            if np.sign(d_e) != np.sign(delta_0):
+                d_e = 0
+            elif (np.sign(delta_0) != np.sign(delta_1) and
+                  abs(d_e) > abs(3 * delta_0)):
+                d_e = 3 * delta_0
+            d[end] = d_e
+
+    d_0, d_1 = h * d[:-1], h * d[1:]
+    y_d = np.diff(y)
+
+    return np.column_stack([
+        y[:-1], d_0, 3 * y_d - 2 * d_0 - d_1, d_0 + d_1 - 2 * y_d
+    ])
+
+
+def _evaluate_cubic(coefficients, i, t):
+    """
+    Evaluates in place at given unit parameters given segments cubic
+    polynomials, see :func:`monotone_cubic_coefficients` definition.
+    """
+
+    c = coefficients[i]
+
+    y = c[:, 3] * t
+    y += c[:, 2]
+    y *= t
+    y += c[:, 1]
+    y *= t
+    y += c[:, 0]
+
+    return y
+
+
+class MonotoneCubicInterpolator:
+    """
+    Interpolates a 1-D function with a monotone piecewise cubic *Hermite*
+    interpolant, see :func:`monotone_cubic_coefficients` definition.
+
+    The class has the interface of :class:`colour.algebra.LinearInterpolator`
+    class, and can be given to the *LUT* *apply* methods as *interpolator*.
+
+    Parameters
+    ----------
+    x : array_like
+        Increasing independent :math:`x` variable values.
+    y : array_like
+        Dependent and already known :math:`y` variable values to
+        interpolate.
+
+    Examples
+    --------
+    >>> interpolator = MonotoneCubicInterpolator([0, 1, 2], [0, 0.5, 2])
+    >>> interpolator([0.5, 1.5])
+    array([ 0.15625,  1.09375])
+    """
+
+    def __init__(self, x, y):
+        self.x = np.asarray(x, dtype=np.float_)
+        self.y = np.asarray(y, dtype=np.float_)
+        self.coefficients = monotone_cubic_coefficients(self.x, self.y)
+
+    def __call__(self, x, chunk_size=8192):
+        """
+        Evaluates the interpolating polynomial at given point(s).
+
+        Parameters
+        ----------
+        x : numeric or array_like
+            Point(s) to evaluate the interpolant at.
+        chunk_size : int, optional
+            Values count interpolated at once.
+
+        Returns
+        -------
+        float or ndarray
+            Interpolated value(s).
+
+        Raises
+        ------
+        ValueError
+            If the point(s) are outside the interpolation range.
+        """
+
+        x = np.asarray(x, dtype=np.float_)
+        out, y = _output(x, None)
+        x = np.ravel(x)
+
+        size = len(self.x)
+        for start in range(0, len(x), chunk_size):
+            x_c = x[start:start + chunk_size]
+            _validate_range(x_c, x_c, self.x[0], self.x[-1])
+
+            i = np.clip(
+                np.searchsorted(self.x, x_c, 'right') - 1, 0, size - 2)
+            t = (x_c - self.x[i]) / (self.x[i + 1] - self.x[i])
+            y[start:start + chunk_size] = _evaluate_cubic(
+                self.coefficients, i, t)
+
+        return out[()] if out.ndim == 0 else out
+
+
+def uniform_monotone_cubic_interpolation(table,
+                                         domain,
+                                         x,
+                                         chunk_size=8192,
+                                         out=None,
+                                         dtype=None):
+    """
+    Interpolates given table uniformly sampled over given domain at given
+    values with a monotone piecewise cubic *Hermite* interpolant, the cells
+    being indexed with arithmetic rather than searched.
+
+    Parameters
+    ----------
+    table : array_like
+        Table values.
+    domain : array_like
+        Implicit domain, i.e. minimum and maximum samples.
+    x : array_like
+        Values to interpolate the table at.
+    chunk_size : int, optional
+        Values count interpolated at once, keeping the intermediate arrays in
+        the processor cache.
+    out : ndarray, optional
+        C-contiguous array of the shape of the values to write the
+        interpolated values into.
+    dtype : object, optional
+        Floating point type the table is interpolated in, see
+        :func:`float_dtype` definition.
+
+    Returns
+    -------
+    ndarray
+        Interpolated values, *NaN* at the *NaN* values.
+
+    Raises
+    ------
+    ValueError
+        If the values are outside the domain, infinite values included, like
+        :class:`MonotoneCubicInterpolator` class does.
+
+    Examples
+    --------
+    >>> table = np.array([0, 0.5, 2])
+    >>> uniform_monotone_cubic_interpolation(table, np.array([0, 2]),
+    ...                                      [0.5, 1.5])
+    array([ 0.15625,  1.09375])
+    """
+
+    x = np.asarray(x)
+    dtype = float_dtype(x, dtype, out)
+    x = x.astype(dtype, copy=False)
+    table = np.asarray(table, dtype=np.float_)
+    domain_min, domain_max = dtype.type(domain[0]), dtype.type(domain[-1])
+    out, y = _output(x, out)
+    x = np.ravel(x)
+
+    size = len(table)
+    scale = dtype.type((size - 1) / (domain_max - domain_min))
+    coefficients = monotone_cubic_coefficients(np.arange(size),
+                                               table).astype(dtype)
+
+    for start in range(0, len(x), chunk_size):
+        x_c = x[start:start + chunk_size]
+        y_c = y[start:start + chunk_size]
+
+        np.subtract(x_c, domain_min, out=y_c)
+        y_c *= scale
+        _validate_range(x_c, y_c, 0, size - 1)
+
+        i, non_finite = _cells(y_c, size - 1)
+        y_c -= i
+        y_c[...] = _evaluate_cubic(coefficients, i, y_c)
+        if non_finite is not None:
+            y_c[non_finite] = np.nan
+
+    return out
+
+
 def apply(self,
           RGB,
           inverse=False,
           interpolator=LinearInterpolator,
           interpolator_kwargs=None,
+          out=None,
+          dtype=None,
           **kwargs):
     """
     Applies the *LUT* to given *RGB* colourspace array using given method.
@@ -41,6 +634,14 @@ def apply(self,
         Interpolator class type to use as interpolating function.
     interpolator_kwargs : dict_like, optional
         Arguments to use when instantiating the interpolating function.
+    out : ndarray, optional
+        Array of the shape of the *RGB* colourspace array to write the
+        interpolated values into, it must be C-contiguous unless a custom
+        interpolator is used.
+    dtype : object, optional
+        Floating point type the *LUT* is applied in, see
+        :func:`float_dtype` definition, e.g. *np.float32* to keep
+        *np.float32* images in *np.float32* end to end.
     Other Parameters
     ----------------
     \\**kwargs : dict, optional
@@ -49,6 +650,17 @@ def apply(self,
     -------
     ndarray
         Interpolated *RGB* colourspace array.
+    Notes
+    -----
+    -   The backward direction evaluates the exact piecewise linear inverse
+        of the *LUT*, which is cached on the *LUT* by
+        :func:`piecewise_linear_inverse` definition, the *interpolator* is
+        only used in the forward direction.
+    -   With an implicit domain, the default linear interpolation indexes
+        the table cells with arithmetic, see
+        :func:`uniform_linear_interpolation` definition.
+    -   A custom interpolator computes in its own type, its output being
+        cast to the floating point type.
     """
 
     interpolator_kwargs = handle_arguments_deprecation({
@@ -58,24 +670,177 @@ def apply(self,
     if interpolator_kwargs is None:
         interpolator_kwargs = {}
 
+    RGB = np.asarray(RGB)
+    dtype = float_dtype(RGB, dtype, out)
+
     if inverse:
-        SIZE = len(self._table)
-        LUT_inverse = colour.LUT1D(size=SIZE)
-        LUT_inverse.table = colour.Extrapolator(
-            colour.LinearInterpolator(self._table, LUT_inverse.table))(LUT_inverse.table)
-        RGB_i = LUT_inverse.apply(RGB)
-        
-        return RGB_i
-
-    else:    
-        if self.is_domain_explicit():
-            samples = self.domain
-        else:
-            domain_min, domain_max = self.domain
+        return evaluate_piecewise_linear(
+            piecewise_linear_inverse(self), RGB, out=out, dtype=dtype)
+
+    if (not self.is_domain_explicit() and
+            interpolator is LinearInterpolator and not interpolator_kwargs):
+        return uniform_linear_interpolation(
+            self._table, self.domain, RGB, out=out, dtype=dtype)
+
+    if self.is_domain_explicit():
+        samples = self.domain
+    else:
+        domain_min, domain_max = self.domain
 
         samples = np.linspace(domain_min, domain_max, self._table.size)
 
-        RGB_interpolator = interpolator(samples, self._table,
-                                            **interpolator_kwargs)
-        return RGB_interpolator(RGB)
+    RGB_interpolator = interpolator(samples, self._table,
+                                    **interpolator_kwargs)
+    if out is None:
+        return np.asarray(RGB_interpolator(RGB), dtype=dtype)
+
+    out[...] = RGB_interpolator(RGB)
+
+    return out
+
+
+def _stack_samples(tables, domains=None):
+    """
+    Returns the samples of given stack of *LUT* tables, i.e. an array of
+    shape (N, size) built from given implicit domains of shape (2, ) or
+    (N, 2), or given explicit domains of shape (N, size).
+    """
+
+    if domains is None:
+        domains = np.array([0, 1])
+
+    domains = np.asarray(domains, dtype=np.float_)
+    if domains.shape[-1] != 2 or domains.shape == tables.shape:
+        return np.broadcast_to(domains, tables.shape)
+
+    domains = np.broadcast_to(domains, (len(tables), 2))
+    t = np.linspace(0, 1, tables.shape[-1])
+
+    return domains[:, :1] + t * (domains[:, 1:] - domains[:, :1])
+
+
+def inverse_stack(tables, domains=None, size=None):
+    """
+    Generates the inverse tables of given stack of monotonic 1D *LUT* tables
+    in one call.
+
+    Parameters
+    ----------
+    tables : array_like
+        Monotonic tables of shape (N, size).
+    domains : array_like, optional
+        Implicit domains of shape (2, ) or (N, 2), or explicit domains of
+        shape (N, size), defaults to [0, 1].
+    size : int, optional
+        Inverse tables size, defaults to the tables size.
+
+    Returns
+    -------
+    tuple
+        Inverse tables of shape (N, size) and their implicit domains of shape
+        (N, 2), i.e. the extents of the tables domains.
+
+    Notes
+    -----
+    -   The inverse tables sample the exact piecewise linear inverses of the
+        tables, linearly extrapolated beyond the tables extents.
+    -   The tables are interpolated row by row with :func:`numpy.interp`
+        definition, a row being small enough to stay in the processor cache,
+        which is faster than searching all the rows at once.
+
+    Examples
+    --------
+    >>> tables = np.array([np.linspace(0, 1, 5) ** 2, np.linspace(1, 0, 5)])
+    >>> tables_inverse, domains_inverse = inverse_stack(tables)
+    >>> tables_inverse
+    array([[ 0.        ,  0.5       ,  0.7       ,  0.85714286,  1.        ],
+           [ 1.        ,  0.75      ,  0.5       ,  0.25      ,  0.        ]])
+    """
+
+    tables = np.asarray(tables, dtype=np.float_)
+    samples = _stack_samples(tables, domains)
+    size = tables.shape[-1] if size is None else size
+
+    domains_inverse = np.sort(
+        np.stack([samples[:, 0], samples[:, -1]], -1), axis=-1)
+    x = domains_inverse[:, :1] + np.linspace(0, 1, size) * (
+        domains_inverse[:, 1:] - domains_inverse[:, :1])
+
+    tables_inverse = np.empty(x.shape)
+    for i in range(len(tables)):
+        table, samples_i = tables[i], samples[i]
+        if table[-1] < table[0]:
+            table, samples_i = table[::-1], samples_i[::-1]
+
+        tables_inverse[i] = np.interp(x[i], table, samples_i)
+
+        # Linear extrapolation from the end segments.
+        for end, outside in ((slice(0, 2), x[i] < table[0]),
+                             (slice(-2, None), x[i] > table[-1])):
+            if np.any(outside):
+                (x_0, x_1), (y_0, y_1) = table[end], samples_i[end]
+                slope = (y_1 - y_0) / (x_1 - x_0) if x_1 != x_0 else 0
+                tables_inverse[i, outside] = y_0 + (x[i, outside] -
+                                                    x_0) * slope
+
+    return tables_inverse, domains_inverse
+
+
+def apply_stack(tables, RGB, domains=None, inverse=False, dtype=None):
+    """
+    Applies given stack of N monotonic 1D *LUT* tables to given stack of N
+    *RGB* colourspace arrays, i.e. each table to its own array, in one call.
+
+    Parameters
+    ----------
+    tables : array_like
+        Tables of shape (N, size).
+    RGB : array_like
+        *RGB* colourspace arrays of shape (N, ...).
+    domains : array_like, optional
+        Implicit domains of shape (2, ) or (N, 2), or explicit domains of
+        shape (N, size), defaults to [0, 1].
+    inverse : boolean, optional
+        Whether to apply the exact piecewise linear inverses of the tables.
+    dtype : object, optional
+        Floating point type the tables are applied in, see
+        :func:`float_dtype` definition.
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace arrays of shape (N, ...).
+
+    Notes
+    -----
+    -   Each array is evaluated with :func:`evaluate_piecewise_linear`
+        definition, the values beyond the tables domains, or beyond the
+        tables extents in the backward direction, being linearly
+        extrapolated from the end segments.
+
+    Examples
+    --------
+    >>> tables = np.array([np.linspace(0, 1, 5) ** 2, np.linspace(1, 0, 5)])
+    >>> RGB = np.array([[0.25, 0.5, 1.0], [0.25, 0.5, 1.0]])
+    >>> apply_stack(tables, RGB)
+    array([[ 0.0625,  0.25  ,  1.    ],
+           [ 0.75  ,  0.5   ,  0.    ]])
+    >>> apply_stack(tables, apply_stack(tables, RGB), inverse=True)
+    array([[ 0.25,  0.5 ,  1.  ],
+           [ 0.25,  0.5 ,  1.  ]])
+    """
+
+    tables = np.asarray(tables, dtype=np.float_)
+    samples = _stack_samples(tables, domains)
+    RGB = np.asarray(RGB)
+    dtype = float_dtype(RGB, dtype)
+
+    RGB_i = np.empty(RGB.shape, dtype=dtype)
+    for i in range(len(tables)):
+        evaluate_piecewise_linear(
+            piecewise_linear_nodes(samples[i], tables[i], inverse),
+            RGB[i],
+            out=RGB_i[i],
+            dtype=dtype)
 
+    return RGB_i
@@ -1,16 +1,157 @@
-import colour, numpy as np
+import colour, numpy as np, threading
 from colour.algebra import (LinearInterpolator, table_interpolation_trilinear,
                             Extrapolator)
 from colour.utilities.deprecation import handle_arguments_deprecation
 
-def invert(self):
+from LUT1D_inverse import (MonotoneCubicInterpolator, float_dtype,
+                           uniform_linear_interpolation,
+                           uniform_monotone_cubic_interpolation)
+
+_INVERSE_TABLE_LOCK = threading.Lock()
+"""
+Lock serialising the lazy builds of the inverse tables.
+"""
+
+
+def inverse_table(self):
+    """
+    Returns the samples and the table of the inverse of the *LUT*.
+
+    The inverse table is built lazily, cached on the *LUT* and rebuilt only
+    when the *LUT* table or domain changes. Its arrays are read-only so that
+    a *LUT* can be shared by threads applying it in both directions.
+
+    Returns
+    -------
+    tuple
+        Read-only samples and inverse table.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT1D(colour.LUT1D.linear_table(5) ** 2)
+    >>> inverse_table(LUT)[1]
+    array([ 0.        ,  0.5       ,  0.7       ,  0.85714286,  1.        ])
+    """
+
+    def is_current(cache):
+        return (cache is not None and np.array_equal(cache[0], self.table) and
+                np.array_equal(cache[1], self.domain))
+
+    cache = getattr(self, '_inverse_table', None)
+    if not is_current(cache):
+        with _INVERSE_TABLE_LOCK:
+            cache = getattr(self, '_inverse_table', None)
+            if not is_current(cache):
+                table, domain = np.copy(self.table), np.copy(self.domain)
+                if self.is_domain_explicit():
+                    samples = np.copy(domain)
+                else:
+                    samples = np.linspace(domain[0], domain[1], len(table))
+
+                table_inverse = Extrapolator(LinearInterpolator(
+                    table, samples))(samples)
+
+                for array in (table, domain, samples, table_inverse):
+                    array.setflags(write=False)
+
+                cache = (table, domain, samples, table_inverse)
+                self._inverse_table = cache
+
+    return cache[2], cache[3]
+
+
+def _inverse_nodes(self):
+    """
+    Returns the nodes of the exact piecewise linear inverse of the *LUT*,
+    i.e. its table values and the samples they are reached at, sorted by
+    increasing table values.
+    """
+
+    if self.is_domain_explicit():
+        samples = self.domain
+    else:
+        domain_min, domain_max = self.domain
+        samples = np.linspace(domain_min, domain_max, self.size)
+
+    order = np.argsort(self.table, kind='stable')
+
+    return self.table[order], samples[order]
+
+
+def _round_trip_error(values,
+                      samples,
+                      domain,
+                      table_inverse,
+                      interpolation='Linear'):
+    """
+    Returns the maximum round-trip error of given inverse table sampled at
+    given domain, i.e. its maximum deviation from the exact inverse given by
+    its nodes.
+
+    With linear interpolation, both functions being piecewise linear, their
+    deviation is maximum at the nodes of the exact inverse, the inverse table
+    being exact at its own samples. With cubic interpolation, the deviation
+    is also evaluated inside the cells of the inverse table.
+    """
+
+    inside = np.logical_and(values >= domain[0], values <= domain[-1])
+
+    if interpolation.lower() == 'linear':
+        return np.max(
+            np.abs(
+                np.interp(values[inside], domain, table_inverse) -
+                samples[inside]),
+            initial=0)
+
+    t = np.linspace(0, 1, 9)[1:-1]
+    x = np.hstack([
+        values[inside],
+        np.ravel(domain[:-1, None] + t * np.diff(domain)[:, None])
+    ])
+
+    return np.max(
+        np.abs(
+            MonotoneCubicInterpolator(domain, table_inverse)(x) -
+            np.interp(x, values, samples)),
+        initial=0)
+
+
+def invert(self,
+           tolerance=None,
+           method='Uniform',
+           size_maximum=65536,
+           interpolation='Linear'):
     """
     Computes and returns the inverse of the *LUT*.
 
+    Parameters
+    ----------
+    tolerance : numeric, optional
+        Maximum round-trip error of the inverse *LUT*, i.e. its maximum
+        deviation from the exact inverse of the *LUT*. If not given, the
+        inverse *LUT* has the size and domain of the *LUT*.
+    method : unicode, optional
+        **{'Uniform', 'Adaptive'}**,
+        Sampling of the inverse *LUT* when a tolerance is given: *Uniform*
+        returns the smallest uniformly sampled inverse *LUT* meeting it,
+        *Adaptive* returns an inverse *LUT* with an explicit domain whose
+        samples are concentrated where the *LUT* slope is steep.
+    size_maximum : int, optional
+        Maximum size of the uniformly sampled inverse *LUT*.
+    interpolation : unicode, optional
+        **{'Linear', 'Cubic'}**,
+        Interpolation the inverse *LUT* is applied with, and its round-trip
+        error is measured with. *Cubic* is the monotone piecewise cubic
+        interpolation of :class:`LUT1D_inverse.MonotoneCubicInterpolator`
+        class, reaching the tolerance with a much smaller *Uniform* inverse
+        *LUT*, it does not support the *Adaptive* method.
+
     Returns
     -------
     LUT1D
-        Inverse *LUT* class instance.
+        Inverse *LUT* class instance, a *Cubic* inverse *LUT* must be applied
+        with :class:`LUT1D_inverse.MonotoneCubicInterpolator` class as
+        *interpolator*.
 
     Warning
     -------
@@ -18,6 +159,18 @@ def invert(self):
     possible, use the :meth:`colour.io.luts.lut.AbstractLUT.apply` method
     with the ``inverse`` argument.
 
+    Notes
+    -----
+    -   The uniform size is searched by bisection, assuming that the error
+        decreases with the size, and a warning is issued if the tolerance is
+        still exceeded at the maximum size.
+    -   The adaptive samples are a subset of the *LUT* table values and
+        domain bounds selected by recursive subdivision, the error being
+        evaluated exactly at the dropped values.
+    -   The cubic interpolant preserves the monotonicity of the inverse
+        table, its error is evaluated at the exact inverse nodes and at 7
+        points inside each cell of the inverse table.
+
     Examples
     --------
     >>> LUT = LUT1D(LUT1D.linear_table(1024) ** (1 / 2.2))
@@ -26,24 +179,102 @@ def invert(self):
     0.1800000...
     """
 
-    if self.is_domain_explicit():
-        samples = self.domain
-    else:
-        domain_min, domain_max = self.domain
-        samples = np.linspace(domain_min, domain_max, self.size)
+    if interpolation.lower() not in ('linear', 'cubic'):
+        raise ValueError(
+            'Undefined interpolation used: "{0}", must be one of the '
+            'following: "{1}".'.format(interpolation,
+                                       ', '.join(['Linear', 'Cubic'])))
+
+    if tolerance is None:
+        samples, table_inverse = inverse_table(self)
+
+        return colour.LUT1D(
+            np.copy(table_inverse), '{0} Inverse'.format(self.name),
+            self.domain)
+
+    values, samples = _inverse_nodes(self)
+    inverse = Extrapolator(LinearInterpolator(values, samples))
+
+    if method.lower() == 'uniform':
+        domain_min, domain_max = self.domain[0], self.domain[-1]
+
+        def table(size):
+            domain = np.linspace(domain_min, domain_max, size)
+            table_inverse = inverse(domain)
+
+            return table_inverse, _round_trip_error(
+                values, samples, domain, table_inverse, interpolation)
 
-    table_inverse = Extrapolator(LinearInterpolator(self.table,
-                                                        samples))(samples)
+        size_lower, size_upper = 1, 2
+        while (table(size_upper)[1] > tolerance and
+               size_upper < size_maximum):
+            size_lower, size_upper = size_upper, min(2 * size_upper,
+                                                     size_maximum)
 
-    LUT_inverse = LUT1D(table_inverse, '{0} Inverse'.format(self.name), self.domain)
+        if table(size_upper)[1] > tolerance:
+            colour.utilities.usage_warning(
+                'Inverse LUT exceeds the tolerance at maximum size!')
+
+        while size_upper - size_lower > 1:
+            size = (size_lower + size_upper) // 2
+            if table(size)[1] > tolerance:
+                size_lower = size
+            else:
+                size_upper = size
+
+        return colour.LUT1D(
+            table(size_upper)[0], '{0} Inverse'.format(self.name),
+            np.array([domain_min, domain_max]))
+    elif method.lower() == 'adaptive':
+        if interpolation.lower() != 'linear':
+            raise ValueError(
+                '"Adaptive" method only supports "Linear" interpolation!')
+
+        domain = np.unique(
+            np.hstack([values, self.domain[0], self.domain[-1]]))
+        table_inverse = inverse(domain)
+
+        # Recursive subdivision of all the segments at once, a segment being
+        # split at its value deviating the most from its chord.
+        kept = np.zeros(len(domain), dtype=bool)
+        kept[[0, -1]] = True
+        while True:
+            indexes = np.where(kept)[0]
+            segment = np.searchsorted(indexes, np.arange(len(domain)),
+                                      'right') - 1
+            segment = np.minimum(segment, len(indexes) - 2)
+            start, end = indexes[segment], indexes[segment + 1]
+            chord = table_inverse[start] + (
+                domain - domain[start]) * (table_inverse[end] - table_inverse[
+                    start]) / (domain[end] - domain[start])
+            error = np.abs(chord - table_inverse)
+            error[kept] = 0
+
+            order = np.lexsort([-error, segment])
+            split = order[np.searchsorted(segment[order],
+                                          np.arange(len(indexes) - 1))]
+            split = split[error[split] > tolerance]
+            if len(split) == 0:
+                break
+
+            kept[split] = True
+
+        return colour.LUT1D(
+            table_inverse[kept], '{0} Inverse'.format(self.name),
+            domain[kept])
+    else:
+        raise ValueError(
+            'Undefined method used: "{0}", must be one of the following: '
+            '"{1}".'.format(method, ', '.join(['Uniform', 'Adaptive'])))
 
-    return LUT_inverse
 
 def apply(self,
             RGB,
             interpolator=LinearInterpolator,
             interpolator_kwargs=None,
             inverse=False,
+            out=None,
+            dtype=None,
             **kwargs):
     """
     Applies the *LUT* to given *RGB* colourspace array using given method.
@@ -59,6 +290,14 @@ def apply(self,
     inverse : boolean, optional
         Checks if the LUT has to be applied in forward or backward
         direction.
+    out : ndarray, optional
+        Array of the shape of the *RGB* colourspace array to write the
+        interpolated values into, it must be C-contiguous unless a custom
+        interpolator is used.
+    dtype : object, optional
+        Floating point type the *LUT* is applied in, see
+        :func:`LUT1D_inverse.float_dtype` definition, e.g. *np.float32* to
+        keep *np.float32* images in *np.float32* end to end.
 
     Other Parameters
     ----------------
@@ -70,6 +309,18 @@ def apply(self,
     ndarray
         Interpolated *RGB* colourspace array.
 
+    Notes
+    -----
+    -   The *LUT* is not modified: the backward direction interpolates the
+        inverse table returned by :func:`inverse_table` definition.
+    -   With an implicit domain, the default linear interpolation and the
+        :class:`LUT1D_inverse.MonotoneCubicInterpolator` class interpolation
+        index the table cells with arithmetic, see
+        :func:`LUT1D_inverse.uniform_linear_interpolation` and
+        :func:`LUT1D_inverse.uniform_monotone_cubic_interpolation`
+        definitions, in the floating point type, the cached tables being cast
+        to it.
+
     Examples
     --------
     >>> LUT = LUT1D(LUT1D.linear_table() ** (1 / 2.2))
@@ -93,17 +344,34 @@ def apply(self,
     if interpolator_kwargs is None:
         interpolator_kwargs = {}
 
-    if self.is_domain_explicit():
-        samples = self.domain    
-    else:
-        domain_min, domain_max = self.domain
+    RGB = np.asarray(RGB)
+    dtype = float_dtype(RGB, dtype, out)
 
-        samples = np.linspace(domain_min, domain_max, self.size)
-    
     if inverse:
-        self.table = Extrapolator(LinearInterpolator(self.table, samples))(samples)
+        samples, table = inverse_table(self)
+    else:
+        samples, table = None, self.table
+
+    if not self.is_domain_explicit() and not interpolator_kwargs:
+        if interpolator is LinearInterpolator:
+            return uniform_linear_interpolation(
+                table, self.domain, RGB, out=out, dtype=dtype)
+        elif interpolator is MonotoneCubicInterpolator:
+            return uniform_monotone_cubic_interpolation(
+                table, self.domain, RGB, out=out, dtype=dtype)
+
+    if samples is None:
+        if self.is_domain_explicit():
+            samples = self.domain
+        else:
+            domain_min, domain_max = self.domain
+
+            samples = np.linspace(domain_min, domain_max, self.size)
+
+    RGB_i = interpolator(samples, table, **interpolator_kwargs)(RGB)
+    if out is None:
+        return np.asarray(RGB_i, dtype=dtype)
 
-    RGB_i = interpolator(samples, self.table,
-                                    **interpolator_kwargs)(RGB)
+    out[...] = RGB_i
 
-    return RGB_i
\ No newline at end of file
+    return out
\ No newline at end of file
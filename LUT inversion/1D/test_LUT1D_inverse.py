@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`LUT1D_inverse` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+import colour
+from colour.utilities import ignore_numpy_errors
+from scipy.interpolate import PchipInterpolator
+
+from LUT1D_inverse import (MonotoneCubicInterpolator, apply, apply_stack,
+                           float_dtype, inverse_stack,
+                           piecewise_linear_inverse,
+                           uniform_linear_interpolation,
+                           uniform_monotone_cubic_interpolation)
+
+__all__ = [
+    'TestPiecewiseLinearInverse', 'TestFloatDtype',
+    'TestUniformLinearInterpolation',
+    'TestMonotoneCubicInterpolator', 'TestUniformMonotoneCubicInterpolation',
+    'TestApply', 'TestInverseStack', 'TestApplyStack'
+]
+
+
+class TestPiecewiseLinearInverse(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inverse.piecewise_linear_inverse` definition unit
+    tests methods.
+    """
+
+    def test_piecewise_linear_inverse(self):
+        """
+        Tests :func:`LUT1D_inverse.piecewise_linear_inverse` definition
+        caching.
+        """
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(16) ** 2)
+        nodes = piecewise_linear_inverse(LUT)
+
+        self.assertIs(piecewise_linear_inverse(LUT), nodes)
+
+        LUT.table[8] += 0.01
+        self.assertIsNot(piecewise_linear_inverse(LUT), nodes)
+
+        nodes = piecewise_linear_inverse(LUT)
+        LUT.domain = np.array([0, 2])
+        np.testing.assert_almost_equal(
+            piecewise_linear_inverse(LUT)[1], nodes[1] * 2, decimal=7)
+
+
+class TestFloatDtype(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inverse.float_dtype` definition unit tests methods.
+    """
+
+    def test_float_dtype(self):
+        """
+        Tests :func:`LUT1D_inverse.float_dtype` definition.
+        """
+
+        x = np.zeros(3, dtype=np.float32)
+
+        self.assertEqual(float_dtype(x), np.float32)
+        self.assertEqual(float_dtype(x, np.float64), np.float64)
+        self.assertEqual(float_dtype(x, out=np.zeros(3)), np.float64)
+        self.assertEqual(float_dtype(np.zeros(3, dtype=np.int_)), np.float64)
+
+    def test_raise_exception_float_dtype(self):
+        """
+        Tests :func:`LUT1D_inverse.float_dtype` definition raised exception.
+        """
+
+        x = np.zeros(3, dtype=np.float32)
+
+        self.assertRaises(ValueError, float_dtype, x, np.int_)
+        self.assertRaises(ValueError, float_dtype, x, np.float32,
+                          np.zeros(3))
+
+
+class TestUniformLinearInterpolation(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inverse.uniform_linear_interpolation` definition
+    unit tests methods.
+    """
+
+    def test_uniform_linear_interpolation(self):
+        """
+        Tests :func:`LUT1D_inverse.uniform_linear_interpolation` definition.
+        """
+
+        table = colour.LUT1D.linear_table(64) ** (1 / 2.2)
+        domain = np.array([-0.5, 2])
+        RGB = np.random.RandomState(4).uniform(-0.5, 2, (16, 16, 3))
+        out = np.empty(RGB.shape)
+
+        self.assertIs(
+            uniform_linear_interpolation(
+                table, domain, RGB, chunk_size=100, out=out), out)
+        np.testing.assert_almost_equal(
+            out, colour.LUT1D(table, domain=domain).apply(RGB), decimal=7)
+
+        np.testing.assert_almost_equal(
+            uniform_linear_interpolation(
+                np.array([0, 1]), domain, np.array([-1, 3]), True),
+            np.array([-0.2, 1.4]),
+            decimal=7)
+
+    def test_raise_exception_uniform_linear_interpolation(self):
+        """
+        Tests :func:`LUT1D_inverse.uniform_linear_interpolation` definition
+        raised exception.
+        """
+
+        for RGB in (np.array([-0.1]), np.array([1.1]), np.array([-np.inf]),
+                    np.array([np.nan, np.inf])):
+            self.assertRaises(ValueError, uniform_linear_interpolation,
+                              np.array([0, 1]), np.array([0, 1]), RGB)
+
+    @ignore_numpy_errors
+    def test_nan_uniform_linear_interpolation(self):
+        """
+        Tests :func:`LUT1D_inverse.uniform_linear_interpolation` definition
+        nan support.
+        """
+
+        np.testing.assert_equal(
+            uniform_linear_interpolation(
+                np.array([0, 1]), np.array([0, 1]),
+                np.array([0.5, np.nan, 0.25])), np.array([0.5, np.nan, 0.25]))
+
+        np.testing.assert_equal(
+            uniform_linear_interpolation(
+                np.array([0, 1]), np.array([0, 1]),
+                np.array([np.inf, -np.inf, np.nan, 2]), True),
+            np.array([np.nan, np.nan, np.nan, 2]))
+
+
+class TestMonotoneCubicInterpolator(unittest.TestCase):
+    """
+    Defines :class:`LUT1D_inverse.MonotoneCubicInterpolator` class unit tests
+    methods.
+    """
+
+    def test__call__(self):
+        """
+        Tests :meth:`LUT1D_inverse.MonotoneCubicInterpolator.__call__`
+        method.
+        """
+
+        random_state = np.random.RandomState(4)
+        x = np.sort(random_state.uniform(0, 1, 32))
+        y = np.cumsum(random_state.uniform(0, 1, 32))
+        y[8:12] = y[8]
+        x_i = np.linspace(x[0], x[-1], 1024)
+
+        y_i = MonotoneCubicInterpolator(x, y)(x_i)
+
+        np.testing.assert_almost_equal(
+            y_i, PchipInterpolator(x, y)(x_i), decimal=7)
+        self.assertGreaterEqual(np.min(np.diff(y_i)), 0)
+
+    def test_raise_exception__call__(self):
+        """
+        Tests :meth:`LUT1D_inverse.MonotoneCubicInterpolator.__call__`
+        method raised exception.
+        """
+
+        interpolator = MonotoneCubicInterpolator([0, 1, 2], [0, 0.5, 2])
+        for x in (-0.1, 2.1, [np.nan, np.inf]):
+            self.assertRaises(ValueError, interpolator, x)
+
+
+class TestUniformMonotoneCubicInterpolation(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inverse.uniform_monotone_cubic_interpolation`
+    definition unit tests methods.
+    """
+
+    def test_uniform_monotone_cubic_interpolation(self):
+        """
+        Tests :func:`LUT1D_inverse.uniform_monotone_cubic_interpolation`
+        definition.
+        """
+
+        table = colour.LUT1D.linear_table(64) ** 2.6
+        domain = np.array([-0.5, 2])
+        RGB = np.random.RandomState(4).uniform(-0.5, 2, (16, 16, 3))
+        out = np.empty(RGB.shape)
+
+        self.assertIs(
+            uniform_monotone_cubic_interpolation(
+                table, domain, RGB, chunk_size=100, out=out), out)
+        np.testing.assert_almost_equal(
+            out,
+            colour.LUT1D(table, domain=domain).apply(
+                RGB, interpolator=MonotoneCubicInterpolator),
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uniform_monotone_cubic_interpolation(self):
+        """
+        Tests :func:`LUT1D_inverse.uniform_monotone_cubic_interpolation`
+        definition nan support.
+        """
+
+        table = colour.LUT1D.linear_table(8) ** 2.6
+
+        np.testing.assert_almost_equal(
+            uniform_monotone_cubic_interpolation(
+                table, np.array([0, 1]), np.array([0.5, np.nan, 0.25])),
+            MonotoneCubicInterpolator(
+                colour.LUT1D.linear_table(8), table)(
+                    np.array([0.5, np.nan, 0.25])),
+            decimal=7)
+
+        self.assertRaises(ValueError, uniform_monotone_cubic_interpolation,
+                          table, np.array([0, 1]), np.array([np.nan, np.inf]))
+
+
+class TestApply(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inverse.apply` definition unit tests methods.
+    """
+
+    def test_apply(self):
+        """
+        Tests :func:`LUT1D_inverse.apply` definition in backward direction.
+        """
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (32, 32, 3))
+        for table in (colour.LUT1D.linear_table(4096) ** (1 / 2.2),
+                      colour.LUT1D.linear_table(64) ** 2.6,
+                      1 - colour.LUT1D.linear_table(8)):
+            LUT = colour.LUT1D(table)
+            np.testing.assert_almost_equal(
+                LUT.apply(apply(LUT, RGB, inverse=True)), RGB, decimal=7)
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(5) * 0.5 + 0.25)
+        np.testing.assert_almost_equal(
+            apply(LUT, np.array([0, 0.5, 1]), inverse=True),
+            np.array([-0.5, 0.5, 1.5]),
+            decimal=7)
+
+    def test_apply_float32(self):
+        """
+        Tests :func:`LUT1D_inverse.apply` definition in *np.float32*.
+        """
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(4096) ** (1 / 2.2))
+        RGB = np.random.RandomState(4).uniform(0, 1,
+                                               (32, 32, 3)).astype(np.float32)
+
+        for inverse in (False, True):
+            RGB_a = apply(LUT, RGB, inverse=inverse)
+
+            self.assertEqual(RGB_a.dtype, np.float32)
+            np.testing.assert_allclose(
+                RGB_a,
+                apply(LUT, RGB, inverse=inverse, dtype=np.float64),
+                atol=1e-6)
+
+    @ignore_numpy_errors
+    def test_nan_apply(self):
+        """
+        Tests :func:`LUT1D_inverse.apply` definition nan support.
+        """
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(64) ** (1 / 2.2))
+        RGB = np.array([0.5, np.nan, np.inf, -np.inf, 0.25])
+
+        RGB_i = apply(LUT, RGB, inverse=True)
+        np.testing.assert_equal(np.isnan(RGB_i),
+                                [False, True, True, True, False])
+        np.testing.assert_almost_equal(
+            RGB_i[[0, 4]],
+            apply(LUT, np.array([0.5, 0.25]), inverse=True),
+            decimal=7)
+
+
+def _tables():
+    tables = colour.LUT1D.linear_table(256)[None] ** np.array(
+        [[1 / 2.2], [1], [2.6]])
+
+    return np.vstack([tables, 1 - tables[:1]])
+
+
+class TestInverseStack(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inverse.inverse_stack` definition unit tests
+    methods.
+    """
+
+    def test_inverse_stack(self):
+        """
+        Tests :func:`LUT1D_inverse.inverse_stack` definition.
+        """
+
+        tables = _tables()
+        domains = np.array([[0, 1], [0, 2], [-1, 1], [0, 1]])
+
+        tables_inverse, domains_inverse = inverse_stack(tables, domains, 64)
+
+        np.testing.assert_equal(domains_inverse, domains)
+        for i, table in enumerate(tables):
+            LUT = colour.LUT1D(table, domain=domains[i])
+            RGB = np.linspace(domains[i][0], domains[i][1], 64)
+            np.testing.assert_almost_equal(
+                tables_inverse[i], apply(LUT, RGB, inverse=True), decimal=7)
+
+
+class TestApplyStack(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inverse.apply_stack` definition unit tests methods.
+    """
+
+    def test_apply_stack(self):
+        """
+        Tests :func:`LUT1D_inverse.apply_stack` definition.
+        """
+
+        tables = _tables()
+        RGB = np.random.RandomState(4).uniform(0, 1, (4, 16, 16, 3))
+
+        RGB_a = apply_stack(tables, RGB)
+        for i, table in enumerate(tables):
+            np.testing.assert_almost_equal(
+                RGB_a[i], colour.LUT1D(table).apply(RGB[i]), decimal=7)
+
+        np.testing.assert_almost_equal(
+            apply_stack(tables, RGB_a, inverse=True), RGB, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_apply_stack(self):
+        """
+        Tests :func:`LUT1D_inverse.apply_stack` definition nan support.
+        """
+
+        RGB = np.tile(np.array([0.5, np.nan, np.inf, -np.inf]), (4, 1))
+
+        for inverse in (False, True):
+            RGB_a = apply_stack(_tables(), RGB, inverse=inverse)
+            np.testing.assert_equal(
+                np.isnan(RGB_a), np.tile([False, True, True, True], (4, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
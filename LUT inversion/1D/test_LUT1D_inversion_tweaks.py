@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`LUT1D_inversion_tweaks` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import colour
+from colour.utilities import ignore_numpy_errors
+from LUT1D_inverse import MonotoneCubicInterpolator
+from LUT1D_inversion_tweaks import apply, inverse_table, invert
+
+__all__ = ['TestInverseTable', 'TestInvert', 'TestApply']
+
+
+class TestInverseTable(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inversion_tweaks.inverse_table` definition unit
+    tests methods.
+    """
+
+    def test_inverse_table(self):
+        """
+        Tests :func:`LUT1D_inversion_tweaks.inverse_table` definition.
+        """
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(16) ** 2)
+        samples, table = inverse_table(LUT)
+
+        self.assertIs(inverse_table(LUT)[1], table)
+        self.assertFalse(table.flags.writeable)
+
+        LUT.table[8] += 0.01
+        self.assertIsNot(inverse_table(LUT)[1], table)
+
+
+class TestInvert(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inversion_tweaks.invert` definition unit tests
+    methods.
+    """
+
+    def test_invert(self):
+        """
+        Tests :func:`LUT1D_inversion_tweaks.invert` definition.
+        """
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(4096) ** (1 / 2.2))
+        RGB = np.linspace(0, 1, 10001)
+        RGB_a = LUT.apply(RGB)
+
+        self.assertEqual(invert(LUT).size, 4096)
+
+        for method in ('Uniform', 'Adaptive'):
+            LUT_inverse = invert(LUT, 1e-4, method)
+
+            self.assertLess(LUT_inverse.size, 512)
+            self.assertLessEqual(
+                np.max(np.abs(LUT_inverse.apply(RGB_a) - RGB)), 1e-4)
+
+        self.assertTrue(invert(LUT, 1e-4, 'Adaptive').is_domain_explicit())
+
+        LUT_inverse = invert(LUT, 1e-4, interpolation='Cubic')
+        self.assertLess(LUT_inverse.size, invert(LUT, 1e-4).size)
+        self.assertLessEqual(
+            np.max(
+                np.abs(
+                    apply(
+                        LUT_inverse,
+                        RGB_a,
+                        interpolator=MonotoneCubicInterpolator) - RGB)),
+            1e-4)
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(16) * 0.5 + 0.25)
+        self.assertEqual(invert(LUT, 1e-4).size, 2)
+
+    def test_raise_exception_invert(self):
+        """
+        Tests :func:`LUT1D_inversion_tweaks.invert` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, invert, colour.LUT1D(), 1e-4,
+                          'Undefined')
+        self.assertRaises(ValueError, invert, colour.LUT1D(), 1e-4,
+                          'Uniform', interpolation='Undefined')
+        self.assertRaises(ValueError, invert, colour.LUT1D(), 1e-4,
+                          'Adaptive', interpolation='Cubic')
+
+
+class TestApply(unittest.TestCase):
+    """
+    Defines :func:`LUT1D_inversion_tweaks.apply` definition unit tests
+    methods.
+    """
+
+    def test_apply(self):
+        """
+        Tests :func:`LUT1D_inversion_tweaks.apply` definition in backward
+        direction.
+        """
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(1024) ** (1 / 2.2))
+        table = np.copy(LUT.table)
+        RGB = np.random.RandomState(4).uniform(0, 1, (256, 3))
+
+        RGB_i = apply(LUT, RGB, inverse=True)
+        np.testing.assert_almost_equal(
+            apply(LUT, RGB, inverse=True), RGB_i, decimal=7)
+        np.testing.assert_equal(LUT.table, table)
+
+        RGB_f = apply(LUT, RGB.astype(np.float32), inverse=True)
+        self.assertEqual(RGB_f.dtype, np.float32)
+        np.testing.assert_allclose(RGB_f, RGB_i, atol=1e-6)
+
+        def apply_LUT(inverse):
+            return apply(LUT, RGB, inverse=inverse)
+
+        with ThreadPoolExecutor(4) as executor:
+            for inverse, RGB_a in zip([True, False] * 16,
+                                      executor.map(apply_LUT,
+                                                   [True, False] * 16)):
+                np.testing.assert_almost_equal(
+                    RGB_a, RGB_i if inverse else LUT.apply(RGB), decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_apply(self):
+        """
+        Tests :func:`LUT1D_inversion_tweaks.apply` definition nan support.
+        """
+
+        LUT = colour.LUT1D(colour.LUT1D.linear_table(1024) ** (1 / 2.2))
+        RGB = np.array([0.18, np.nan, 0.18])
+
+        for inverse in (False, True):
+            RGB_i = apply(LUT, RGB, inverse=inverse)
+            self.assertTrue(np.isnan(RGB_i[1]))
+            np.testing.assert_almost_equal(
+                RGB_i[[0, 2]],
+                apply(LUT, np.array([0.18, 0.18]), inverse=inverse),
+                decimal=7)
+
+            self.assertRaises(ValueError, apply, LUT,
+                              np.array([0.18, np.inf]), inverse=inverse)
+
+
+if __name__ == '__main__':
+    unittest.main()
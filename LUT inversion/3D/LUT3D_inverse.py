@@ -0,0 +1,153 @@
+import numpy as np, colour
+from colour.algebra import (table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
+from colour.utilities import as_float_array
+from colour.utilities.deprecation import handle_arguments_deprecation
+
+from LUT3D_inversion_cache import LUT3DInverseCache
+from LUT3D_refinement import newton_refinement
+from LUT3D_spatial_index import spatial_index
+
+INVERSE_CACHE = LUT3DInverseCache()
+"""
+Cache of the coarse inverse tables seeding the inverse application of
+*LUT3D* class instances.
+"""
+
+INVERSE_INTERPOLATIONS = {
+    table_interpolation_trilinear: 'Trilinear',
+    table_interpolation_tetrahedral: 'Tetrahedral',
+}
+"""
+Interpolators supported in the backward direction, and the corresponding
+:func:`LUT3D_refinement.newton_refinement` definition interpolation.
+"""
+
+
+def coarse_inverse(self, size=17, cache=INVERSE_CACHE):
+    """
+    Returns a coarse nearest neighbour inverse of the *LUT*, built directly
+    from the *LUT* table vertices and cached on the *LUT* table and domain.
+
+    Parameters
+    ----------
+    size : int, optional
+        Coarse inverse *LUT* size.
+    cache : LUT3DInverseCache, optional
+        Cache storing the coarse inverse tables.
+
+    Returns
+    -------
+    LUT3D
+        Coarse inverse *LUT* class instance.
+    """
+
+    key = cache.key(self, size=size, method='coarse nearest neighbour')
+    table = cache.get(key)
+    if table is None:
+        index = spatial_index(self)
+        table = index.antecedents(
+            index.tree.query(colour.LUT3D.linear_table(size, self.domain))[-1])
+        cache.set(key, table)
+
+    return colour.LUT3D(table, domain=self.domain)
+
+
+def apply(self,
+          RGB,
+          inverse=False,
+          interpolator=table_interpolation_trilinear,
+          interpolator_kwargs=None,
+          tolerance=1e-7,
+          batch_size=262144,
+          **kwargs):
+    """
+    Applies the *LUT* to given *RGB* colourspace array using given method.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array to apply the *LUT* onto.
+    inverse : boolean, optional
+        Checks if the LUT has to be applied in forward or backward
+        direction.
+    interpolator : object, optional
+        Interpolator object to use as interpolating function, must be one of
+        :attr:`INVERSE_INTERPOLATIONS` keys in the backward direction.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when calling the interpolating function.
+    tolerance : numeric, optional
+        Round-trip error euclidean norm below which the backward direction
+        solving is converged.
+    batch_size : int, optional
+        Pixels count solved at once in the backward direction.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for deprecation management.
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace array.
+
+    Raises
+    ------
+    ValueError
+        If the interpolator is not supported in the backward direction.
+
+    Notes
+    -----
+    -   The backward direction does not build an inverse table: each pixel is
+        solved directly against the *LUT* table with *Newton* iterations
+        seeded from a cached coarse inverse, using the *Jacobian* of the
+        given interpolator.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT3D(colour.LUT3D.linear_table() ** (1 / 2.2))
+    >>> RGB = np.array([0.18, 0.18, 0.18])
+
+    *LUT* applied to the given *RGB* colourspace in forward direction:
+
+    >>> apply(LUT, RGB)  # doctest: +ELLIPSIS
+    array([ 0.4583277...,  0.4583277...,  0.4583277...])
+
+    *LUT* applied to the modified *RGB* colourspace in reverse direction:
+
+    >>> apply(LUT, apply(LUT, RGB), inverse=True)  # doctest: +ELLIPSIS
+    array([ 0.18...,  0.18...,  0.18...])
+    """
+
+    interpolator_kwargs = handle_arguments_deprecation({
+        'ArgumentRenamed': [['interpolator_args', 'interpolator_kwargs']],
+    }, **kwargs).get('interpolator_kwargs', interpolator_kwargs)
+
+    if not inverse:
+        return colour.LUT3D.apply(self, RGB, interpolator, interpolator_kwargs)
+
+    interpolation = INVERSE_INTERPOLATIONS.get(interpolator)
+    if interpolation is None:
+        raise ValueError(
+            '"{0}" interpolator is not supported in backward direction, '
+            'must be one of the following: "{1}"!'.format(
+                getattr(interpolator, '__name__', interpolator), ', '.join(
+                    sorted(x.__name__ for x in INVERSE_INTERPOLATIONS))))
+
+    RGB = as_float_array(RGB)
+    shape = RGB.shape
+    RGB = RGB.reshape(-1, 3)
+    RGB_i = np.empty(RGB.shape)
+
+    LUT_inverse = coarse_inverse(self)
+    for start in range(0, len(RGB), batch_size):
+        batch = RGB[start:start + batch_size]
+        RGB_i[start:start + batch_size] = newton_refinement(
+            self,
+            batch,
+            LUT_inverse.apply(batch),
+            tolerance,
+            interpolation=interpolation)[0]
+
+    return RGB_i.reshape(shape)
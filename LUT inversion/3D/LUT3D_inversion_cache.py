@@ -0,0 +1,264 @@
+import hashlib
+import os
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+
+import numpy as np
+
+
+class LUT3DInverseCache:
+    """
+    Defines a two tier, content-addressed cache for *LUT3D* inverse tables.
+
+    The first tier is an in-memory *LRU* mapping, the second tier is an
+    optional on-disk directory of *.npz* files shared across processes and
+    evicted by total size, least recently used files first. An entry holds
+    an inverse table and optionally the name and comments of its *LUT*, which
+    are thus never evicted separately.
+
+    Parameters
+    ----------
+    directory : unicode, optional
+        On-disk tier directory, the on-disk tier is disabled if not given.
+    memory_entries : int, optional
+        Maximum inverse tables count held by the in-memory tier.
+    disk_bytes : int, optional
+        Maximum total size in bytes of the on-disk tier.
+
+    Examples
+    --------
+    >>> import colour
+    >>> cache = LUT3DInverseCache()
+    >>> LUT = colour.LUT3D()
+    >>> key = cache.key(LUT, size=33, extrapolate=True, query_size=4)
+    >>> cache.get(key) is None
+    True
+    >>> cache.set(key, LUT.table)
+    >>> cache.get(key).shape
+    (33, 33, 33, 3)
+    """
+
+    def __init__(self, directory=None, memory_entries=32, disk_bytes=2 ** 30):
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.disk_bytes = disk_bytes
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(LUT, **kwargs):
+        """
+        Returns the cache key of given *LUT* inversion.
+
+        Parameters
+        ----------
+        LUT : LUT3D
+            *LUT* to invert.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Inversion parameters affecting the inverse table, e.g. ``size``,
+            ``extrapolate`` or ``query_size``.
+
+        Returns
+        -------
+        unicode
+            Hexadecimal digest of the *LUT* table and domain bytes, and of the
+            inversion parameters.
+        """
+
+        digest = hashlib.sha256()
+        for array in (LUT.table, LUT.domain):
+            array = np.ascontiguousarray(array)
+            digest.update('{0}{1}'.format(array.dtype.str,
+                                          array.shape).encode('utf-8'))
+            digest.update(array)
+
+        digest.update(repr(sorted(kwargs.items())).encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, '{0}.npz'.format(key))
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        if self.directory is None:
+            return None
+
+        path = self._path(key)
+        try:
+            with np.load(path) as npz_file:
+                entry = (npz_file['table'], npz_file['metadata']
+                         if 'metadata' in npz_file.files else None)
+            os.utime(path)
+        except (IOError, KeyError, OSError, ValueError, zipfile.BadZipFile):
+            return None
+
+        self._remember(key, entry)
+
+        return entry
+
+    def _set(self, key, table, metadata=None):
+        self._remember(key, (table, metadata))
+
+        if self.directory is None:
+            return
+
+        arrays = {'table': table}
+        if metadata is not None:
+            arrays['metadata'] = metadata
+
+        # Writing to a temporary file first so that concurrent readers never
+        # see a partially written entry.
+        file_descriptor, path = tempfile.mkstemp(
+            suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as npz_file:
+                np.savez(npz_file, **arrays)
+            os.replace(path, self._path(key))
+        except (IOError, OSError):
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+        self._evict()
+
+    def get(self, key):
+        """
+        Returns the inverse table cached for given key.
+
+        Parameters
+        ----------
+        key : unicode
+            Cache key.
+
+        Returns
+        -------
+        ndarray or None
+            Copy of the cached inverse table or *None* on a cache miss.
+        """
+
+        entry = self._get(key)
+        if entry is None:
+            return None
+
+        return np.copy(entry[0])
+
+    def set(self, key, table):
+        """
+        Caches given inverse table for given key in both tiers.
+
+        Parameters
+        ----------
+        key : unicode
+            Cache key.
+        table : array_like
+            Inverse table to cache.
+        """
+
+        self._set(key, np.array(table))
+
+    def get_LUT(self, key):
+        """
+        Returns the inverse *LUT* table, name and comments cached for given
+        key.
+
+        Parameters
+        ----------
+        key : unicode
+            Cache key.
+
+        Returns
+        -------
+        tuple or None
+            Copy of the cached inverse table, name and comments, or *None* on
+            a cache miss.
+        """
+
+        entry = self._get(key)
+        if entry is None or entry[1] is None:
+            return None
+
+        table, metadata = entry
+
+        return np.copy(table), str(metadata[0]), [str(x) for x in metadata[1:]]
+
+    def set_LUT(self, key, LUT):
+        """
+        Caches given inverse *LUT* table, name and comments for given key in
+        both tiers.
+
+        Parameters
+        ----------
+        key : unicode
+            Cache key.
+        LUT : LUT3D
+            Inverse *LUT* to cache.
+
+        Notes
+        -----
+        -   The name and comments are cached as a unicode array in the same
+            entry as the table, so that they do not require pickling.
+        """
+
+        self._set(key, np.array(LUT.table),
+                  np.array([LUT.name] + LUT.comments))
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.npz'):
+                continue
+
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(entry[1] for entry in entries)
+        for _mtime, file_size, path in sorted(entries):
+            if total <= self.disk_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= file_size
+
+    def clear(self):
+        """
+        Clears both cache tiers.
+        """
+
+        with self._lock:
+            self._memory.clear()
+
+        if self.directory is None:
+            return
+
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(self.directory, name))
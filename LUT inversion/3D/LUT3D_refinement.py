@@ -0,0 +1,507 @@
+import numpy as np
+from colour.utilities import as_float_array
+
+
+def extended_domain(LUT, extrapolate=True):
+    """
+    Returns the domain of given *LUT3D*, extended by one cell on each side if
+    it is extrapolated.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to return the domain of, its domain must be implicit.
+    extrapolate : bool, optional
+        Whether the *LUT* is extrapolated.
+
+    Returns
+    -------
+    ndarray
+        *LUT* domain.
+
+    Examples
+    --------
+    >>> import colour
+    >>> extended_domain(colour.LUT3D(size=5))
+    array([[-0.25, -0.25, -0.25],
+           [ 1.25,  1.25,  1.25]])
+    """
+
+    assert not LUT.is_domain_explicit(), (
+        'Trilinear interpolation requires an implicit "LUT3D" domain!')
+
+    domain = np.array(LUT.domain, dtype=np.float_)
+
+    if extrapolate:
+        cell = (domain[1] - domain[0]) / (np.array(LUT.table.shape[:3]) - 1)
+        domain[0] -= cell
+        domain[1] += cell
+
+    return domain
+
+
+def cells_coordinates(LUT, RGB, extrapolate=False):
+    """
+    Returns the indexes of the *LUT3D* cells containing given *RGB*
+    colourspace array and the *RGB* values relative coordinates in the cells.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to locate the *RGB* values in, its domain must be implicit.
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    extrapolate : bool, optional
+        Whether the *LUT* is extrapolated over its domain extended by one
+        cell on each side.
+
+    Returns
+    -------
+    tuple
+        Cells indexes of shape (..., 3), relative coordinates of shape
+        (..., 3) and cells size reciprocal.
+
+    Notes
+    -----
+    -   The relative coordinates are in domain [-1, 2] for the border cells
+        of an extrapolated *LUT*, which is equivalent to interpolating the
+        *LUT* table padded by one cell with an odd reflection.
+
+    Examples
+    --------
+    >>> import colour
+    >>> i, f, scale = cells_coordinates(
+    ...     colour.LUT3D(size=5), np.array([0.3, 0.5, 1.0]))
+    >>> i
+    array([1, 2, 3])
+    >>> np.around(f, 7)
+    array([ 0.2,  0. ,  1. ])
+    """
+
+    size = np.array(LUT.table.shape[:3])
+    domain_min, domain_max = LUT.domain[0], LUT.domain[1]
+    scale = (size - 1) / (domain_max - domain_min)
+
+    RGB = np.clip(as_float_array(RGB), *extended_domain(LUT, extrapolate))
+    U = (RGB - domain_min) * scale
+    i = np.clip(np.floor(U), 0, size - 2).astype(np.int_)
+
+    return i, U - i, scale
+
+
+def _cells(LUT, RGB, extrapolate):
+    """
+    Returns the vertices of the *LUT3D* cells containing given *RGB*
+    colourspace array, the *RGB* values relative coordinates in the cells
+    and the cells size reciprocal.
+    """
+
+    table = LUT.table
+    size = np.array(table.shape[:3])
+    i, f, scale = cells_coordinates(LUT, RGB, extrapolate)
+
+    strides = np.array([size[1] * size[2], size[2], 1])
+    corners = np.dot(np.reshape(np.indices((2, 2, 2)), (3, -1)).T, strides)
+    vertices = np.reshape(table, (-1, 3))[
+        np.dot(i, strides)[..., None] + corners]
+    vertices = np.reshape(vertices, vertices.shape[:-2] + (2, 2, 2, 3))
+
+    return vertices, f, scale
+
+
+def trilinear(LUT, RGB, extrapolate=False):
+    """
+    Evaluates given *LUT3D* at given *RGB* colourspace array with trilinear
+    interpolation, optionally extrapolating it by one cell on each side
+    without padding its table.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to evaluate, its domain must be implicit.
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the border cells of the *LUT* over
+        its domain extended by one cell on each side, this is equivalent to
+        padding the *LUT* table with an odd reflection.
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace array of shape (..., 3).
+
+    Notes
+    -----
+    -   Like :meth:`colour.LUT3D.apply`, the *RGB* values are clipped to the
+        *LUT* domain, extended if extrapolated.
+
+    Examples
+    --------
+    >>> import colour
+    >>> LUT = colour.LUT3D(size=5)
+    >>> trilinear(LUT, np.array([-0.1, 0.5, 1.5]))  # doctest: +ELLIPSIS
+    array([ 0. ,  0.5,  1. ])
+    >>> trilinear(LUT, np.array([-0.1, 0.5, 1.5]), True)
+    array([-0.1 ,  0.5 ,  1.25])
+    """
+
+    vertices, f, _scale = _cells(LUT, RGB, extrapolate)
+    f_r, f_g, f_b = [f[..., j, None] for j in range(3)]
+
+    V_b = vertices[..., 0, :] + f_b[..., None, None, :] * (
+        vertices[..., 1, :] - vertices[..., 0, :])
+    V_gb = V_b[..., 0, :] + f_g[..., None, :] * (V_b[..., 1, :] -
+                                                 V_b[..., 0, :])
+
+    return V_gb[..., 0, :] + f_r * (V_gb[..., 1, :] - V_gb[..., 0, :])
+
+
+def tetrahedral_interpolation(table, i, f):
+    """
+    Interpolates given *LUT3D* table in the tetrahedra of given cells
+    containing given relative coordinates, the cells being split into six
+    tetrahedra sharing their main diagonal.
+
+    Parameters
+    ----------
+    table : array_like
+        *LUT* table of shape (size_r, size_g, size_b, 3).
+    i : array_like
+        Cells indexes of shape (..., 3).
+    f : array_like
+        Relative coordinates in the cells of shape (..., 3).
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace array of shape (..., 3).
+    """
+
+    table = as_float_array(table)
+    size = np.array(table.shape[:3])
+    strides = np.array([size[1] * size[2], size[2], 1])
+    table = np.reshape(table, (-1, 3))
+
+    # The tetrahedron is given by the decreasing order of the relative
+    # coordinates, its vertices being reached by successive unit steps
+    # along the corresponding axes.
+    order = np.argsort(-f, axis=-1)
+    f = np.take_along_axis(f, order, -1)[..., None]
+    offsets = np.dot(
+        np.cumsum(np.eye(3, dtype=np.int_)[order], axis=-2), strides)
+    base = np.dot(i, strides)
+
+    V_0 = table[base]
+    V = table[base[..., None] + offsets]
+
+    return (V_0 + f[..., 0, :] * (V[..., 0, :] - V_0) + f[..., 1, :] *
+            (V[..., 1, :] - V[..., 0, :]) + f[..., 2, :] *
+            (V[..., 2, :] - V[..., 1, :]))
+
+
+def tetrahedral(LUT, RGB, extrapolate=False):
+    """
+    Evaluates given *LUT3D* at given *RGB* colourspace array with tetrahedral
+    interpolation, optionally extrapolating it by one cell on each side
+    without padding its table.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to evaluate, its domain must be implicit.
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the border tetrahedra of the *LUT*
+        over its domain extended by one cell on each side.
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace array of shape (..., 3).
+
+    Examples
+    --------
+    >>> import colour
+    >>> LUT = colour.LUT3D(size=5)
+    >>> tetrahedral(LUT, np.array([-0.1, 0.5, 1.5]), True)
+    array([-0.1 ,  0.5 ,  1.25])
+    """
+
+    i, f, _scale = cells_coordinates(LUT, RGB, extrapolate)
+
+    return tetrahedral_interpolation(LUT.table, i, f)
+
+
+def trilinear_jacobian(LUT, RGB, extrapolate=False):
+    """
+    Evaluates given *LUT3D* at given *RGB* colourspace array with trilinear
+    interpolation and computes the analytic *Jacobian* matrices of the
+    interpolation in the cells containing the *RGB* values.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to evaluate, its domain must be implicit.
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the border cells of the *LUT* over
+        its domain extended by one cell on each side.
+
+    Returns
+    -------
+    tuple
+        Interpolated *RGB* colourspace array of shape (..., 3) and *Jacobian*
+        matrices of shape (..., 3, 3), whose columns are the partial
+        derivatives along the *R*, *G* and *B* axes.
+
+    Notes
+    -----
+    -   Like :meth:`colour.LUT3D.apply`, the *RGB* values are clipped to the
+        *LUT* domain, extended if extrapolated.
+
+    Examples
+    --------
+    >>> import colour
+    >>> LUT = colour.LUT3D()
+    >>> LUT.table = LUT.table * np.array([0.5, 1.0, 2.0])
+    >>> RGB, J = trilinear_jacobian(LUT, np.array([0.18, 0.18, 0.18]))
+    >>> RGB  # doctest: +ELLIPSIS
+    array([ 0.09...,  0.18...,  0.36...])
+    >>> np.around(np.diagonal(J), 7)
+    array([ 0.5,  1. ,  2. ])
+    """
+
+    vertices, f, scale = _cells(LUT, RGB, extrapolate)
+    f_r, f_g, f_b = [f[..., j, None] for j in range(3)]
+
+    # Successive linear interpolations along the *B*, *G* and *R* axes and
+    # their derivatives.
+    D_b = vertices[..., 1, :] - vertices[..., 0, :]
+    V_b = vertices[..., 0, :] + f_b[..., None, None, :] * D_b
+
+    D_gb_g = V_b[..., 1, :] - V_b[..., 0, :]
+    V_gb = V_b[..., 0, :] + f_g[..., None, :] * D_gb_g
+    D_gb_b = D_b[..., 0, :] + f_g[..., None, :] * (D_b[..., 1, :] -
+                                                   D_b[..., 0, :])
+
+    values = V_gb[..., 0, :] + f_r * (V_gb[..., 1, :] - V_gb[..., 0, :])
+    jacobian = np.stack([
+        V_gb[..., 1, :] - V_gb[..., 0, :],
+        D_gb_g[..., 0, :] + f_r * (D_gb_g[..., 1, :] - D_gb_g[..., 0, :]),
+        D_gb_b[..., 0, :] + f_r * (D_gb_b[..., 1, :] - D_gb_b[..., 0, :]),
+    ], -1) * scale
+
+    return values, jacobian
+
+
+def tetrahedral_jacobian(LUT, RGB, extrapolate=False):
+    """
+    Evaluates given *LUT3D* at given *RGB* colourspace array with tetrahedral
+    interpolation and computes the *Jacobian* matrices of the interpolation
+    in the tetrahedra containing the *RGB* values.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to evaluate, its domain must be implicit.
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the border tetrahedra of the *LUT*
+        over its domain extended by one cell on each side.
+
+    Returns
+    -------
+    tuple
+        Interpolated *RGB* colourspace array of shape (..., 3) and *Jacobian*
+        matrices of shape (..., 3, 3), whose columns are the partial
+        derivatives along the *R*, *G* and *B* axes.
+
+    Notes
+    -----
+    -   The interpolation being linear in each tetrahedron, the *Jacobian*
+        matrices are constant in each tetrahedron. On a face shared by two
+        tetrahedra, the one selected by :func:`tetrahedral_interpolation` is
+        used.
+
+    Examples
+    --------
+    >>> import colour
+    >>> LUT = colour.LUT3D()
+    >>> LUT.table = LUT.table * np.array([0.5, 1.0, 2.0])
+    >>> RGB, J = tetrahedral_jacobian(LUT, np.array([0.18, 0.18, 0.18]))
+    >>> RGB  # doctest: +ELLIPSIS
+    array([ 0.09...,  0.18...,  0.36...])
+    >>> np.around(np.diagonal(J), 7)
+    array([ 0.5,  1. ,  2. ])
+    """
+
+    i, f, scale = cells_coordinates(LUT, RGB, extrapolate)
+
+    size = np.array(LUT.table.shape[:3])
+    strides = np.array([size[1] * size[2], size[2], 1])
+    table = np.reshape(LUT.table, (-1, 3))
+
+    # The differences of the successive tetrahedron vertices are the partial
+    # derivatives along the axes in the decreasing order of the relative
+    # coordinates, they are sorted back to the *R*, *G* and *B* order.
+    order = np.argsort(-f, axis=-1)
+    offsets = np.dot(
+        np.cumsum(np.eye(3, dtype=np.int_)[order], axis=-2), strides)
+    base = np.dot(i, strides)[..., None]
+    V = table[np.concatenate([base, base + offsets], -1)]
+    derivatives = np.take_along_axis(
+        np.swapaxes(np.diff(V, axis=-2), -1, -2),
+        np.argsort(order, axis=-1)[..., None, :], -1)
+
+    values = V[..., 0, :] + np.einsum('...ij,...j->...i', derivatives, f)
+
+    return values, derivatives * scale
+
+
+def solve_3x3(A, b):
+    """
+    Solves given batch of 3x3 linear systems in closed form with *Cramer's*
+    rule.
+
+    Parameters
+    ----------
+    A : array_like
+        Matrices of shape (n, 3, 3).
+    b : array_like
+        Right-hand side vectors of shape (n, 3).
+
+    Returns
+    -------
+    tuple
+        Solutions of shape (n, 3), set to zero for singular matrices, and
+        boolean array of the singular matrices.
+    """
+
+    a_0, a_1, a_2 = A[..., 0], A[..., 1], A[..., 2]
+    a_1_2 = np.cross(a_1, a_2)
+    determinant = np.sum(a_0 * a_1_2, axis=-1)
+    singular = np.abs(determinant) < 1e-12
+    determinant[singular] = np.inf
+
+    x = np.stack([
+        np.sum(b * a_1_2, axis=-1),
+        np.sum(b * np.cross(a_2, a_0), axis=-1),
+        np.sum(b * np.cross(a_0, a_1), axis=-1),
+    ], -1) / determinant[..., None]
+
+    return x, singular
+
+
+def newton_refinement(LUT,
+                      RGB,
+                      RGB_estimate,
+                      tolerance=1e-6,
+                      iterations=16,
+                      backtracking=4,
+                      extrapolate=False,
+                      interpolation='Trilinear'):
+    """
+    Refines given estimates of the antecedents of given *RGB* colourspace
+    array by the given *LUT3D* with vectorized *Newton* iterations using the
+    analytic *Jacobian* of its trilinear or tetrahedral interpolation.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        Forward *LUT*, its domain must be implicit.
+    RGB : array_like
+        *RGB* colourspace array to find the antecedents of.
+    RGB_estimate : array_like
+        Estimated antecedents, e.g. a nearest neighbour inverse.
+    tolerance : numeric, optional
+        Round-trip error euclidean norm below which a point is converged.
+    iterations : int, optional
+        Maximum *Newton* iterations count.
+    backtracking : int, optional
+        Maximum halvings count of a *Newton* step that does not reduce the
+        round-trip error.
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the border cells of the *LUT* over
+        its domain extended by one cell on each side.
+    interpolation : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation kernel of the forward *LUT*.
+
+    Returns
+    -------
+    tuple
+        Refined antecedents and per-point boolean convergence array.
+
+    Notes
+    -----
+    -   Only the points that are not converged are iterated on, points whose
+        round-trip error cannot be reduced anymore, e.g. points outside the
+        *LUT* range, stop being iterated on and are reported as not
+        converged.
+
+    Examples
+    --------
+    >>> import colour
+    >>> LUT = colour.LUT3D()
+    >>> LUT.table = LUT.table ** (1 / 2.2)
+    >>> RGB_r, converged = newton_refinement(
+    ...     LUT, np.array([0.5, 0.5, 0.5]), np.array([0.25, 0.25, 0.25]))
+    >>> np.around(LUT.apply(RGB_r), 7)
+    array([ 0.5,  0.5,  0.5])
+    >>> converged
+    array(True, dtype=bool)
+    """
+
+    RGB = as_float_array(RGB)
+    shape = RGB.shape
+    RGB = RGB.reshape(-1, 3)
+    domain_min, domain_max = extended_domain(LUT, extrapolate)
+
+    if interpolation.lower() == 'tetrahedral':
+        forward_jacobian = tetrahedral_jacobian
+    else:
+        forward_jacobian = trilinear_jacobian
+
+    RGB_r = np.clip(np.reshape(RGB_estimate, (-1, 3)), domain_min, domain_max)
+    RGB_f, jacobian = forward_jacobian(LUT, RGB_r, extrapolate)
+    residual = RGB - RGB_f
+    error = np.linalg.norm(residual, axis=-1)
+
+    active = np.where(error > tolerance)[0]
+    for _i in range(iterations):
+        if len(active) == 0:
+            break
+
+        step, singular = solve_3x3(jacobian[active], residual[active])
+        accepted = np.zeros(len(active), dtype=bool)
+        for _j in range(backtracking + 1):
+            pending = np.where(np.logical_and(~accepted, ~singular))[0]
+            if len(pending) == 0:
+                break
+
+            indexes = active[pending]
+            RGB_c = np.clip(RGB_r[indexes] + step[pending], domain_min,
+                            domain_max)
+            RGB_f, jacobian_c = forward_jacobian(LUT, RGB_c, extrapolate)
+            residual_c = RGB[indexes] - RGB_f
+            error_c = np.linalg.norm(residual_c, axis=-1)
+
+            improved = error_c < error[indexes]
+            indexes = indexes[improved]
+            RGB_r[indexes] = RGB_c[improved]
+            jacobian[indexes] = jacobian_c[improved]
+            residual[indexes] = residual_c[improved]
+            error[indexes] = error_c[improved]
+
+            accepted[pending[improved]] = True
+            step[pending[~improved]] /= 2
+
+        active = active[np.logical_and(accepted, error[active] > tolerance)]
+
+    converged = (error <= tolerance).reshape(shape[:-1])
+
+    return RGB_r.reshape(shape), converged
@@ -0,0 +1,136 @@
+import numpy as np
+from colour.utilities import as_float_array
+
+from LUT3D_refinement import (cells_coordinates, extended_domain,
+                              tetrahedral_interpolation)
+
+INTERPOLATIONS = ('Trilinear', 'Tetrahedral')
+"""
+Interpolation kernels supported by :func:`resample_lattice` definition.
+"""
+
+
+def lattice_coordinates(LUT, size, domain=None, extrapolate=False):
+    """
+    Returns the indexes of the *LUT3D* cells containing the vertices of the
+    regular lattice of given size and domain, and their relative coordinates
+    in the cells.
+
+    The lattice being regular, the cells indexes and relative coordinates are
+    separable, i.e. they are only computed along each axis and can be reused
+    for any *LUT* of the same size and domain.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to locate the lattice vertices in, its domain must be implicit.
+    size : int
+        Lattice size.
+    domain : array_like, optional
+        Lattice domain, defaults to the *LUT* domain, extended if
+        extrapolated.
+    extrapolate : bool, optional
+        Whether the *LUT* is extrapolated over its domain extended by one
+        cell on each side.
+
+    Returns
+    -------
+    tuple
+        Cells indexes of shape (size, 3) and relative coordinates of shape
+        (size, 3), the columns being the *R*, *G* and *B* axes.
+
+    Examples
+    --------
+    >>> import colour
+    >>> i, f = lattice_coordinates(colour.LUT3D(size=3), 5)
+    >>> i[..., 0]
+    array([0, 0, 1, 1, 1])
+    >>> f[..., 0]
+    array([ 0. ,  0.5,  0. ,  0.5,  1. ])
+    """
+
+    if domain is None:
+        domain = extended_domain(LUT, extrapolate)
+
+    domain = as_float_array(domain)
+    samples = np.linspace(domain[0], domain[1], size)
+
+    return cells_coordinates(LUT, samples, extrapolate)[:2]
+
+
+def resample_lattice(table, coordinates, interpolation='Trilinear',
+                     block_size=65536):
+    """
+    Resamples given *LUT3D* table on the regular lattice of given cells
+    coordinates.
+
+    Parameters
+    ----------
+    table : array_like
+        *LUT* table of shape (size_r, size_g, size_b, 3).
+    coordinates : tuple
+        Lattice cells indexes and relative coordinates as returned by
+        :func:`lattice_coordinates` definition.
+    interpolation : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation kernel.
+    block_size : int, optional
+        Approximate lattice vertices count interpolated at once by the
+        tetrahedral kernel, bounding its memory usage.
+
+    Returns
+    -------
+    ndarray
+        Resampled table of shape (size, size, size, 3).
+
+    Notes
+    -----
+    -   Trilinear interpolation is separable: the table is interpolated along
+        each axis in turn, which costs a few operations per output vertex
+        instead of gathering eight vertices for each of them.
+
+    Examples
+    --------
+    >>> import colour
+    >>> LUT = colour.LUT3D(size=3)
+    >>> LUT.table = LUT.table ** 2
+    >>> table = resample_lattice(LUT.table, lattice_coordinates(LUT, 5))
+    >>> table[1, 2, 4]
+    array([ 0.125,  0.25 ,  1.   ])
+    """
+
+    table = as_float_array(table)
+    i, f = coordinates
+
+    if interpolation.lower() == 'trilinear':
+        for axis in range(3):
+            shape = [1] * 4
+            shape[axis] = -1
+            f_a = np.reshape(f[..., axis], shape)
+            lower = np.take(table, i[..., axis], axis)
+            table = lower + f_a * (np.take(table, i[..., axis] + 1, axis) -
+                                   lower)
+
+        return table
+    elif interpolation.lower() == 'tetrahedral':
+        size = len(i)
+        output = np.empty((size, size, size, 3))
+        block = max(1, block_size // size ** 2)
+        for start in range(0, size, block):
+            I = np.stack(
+                np.broadcast_arrays(i[start:start + block, None, None, 0],
+                                    i[None, :, None, 1], i[None, None, :, 2]),
+                -1)
+            F = np.stack(
+                np.broadcast_arrays(f[start:start + block, None, None, 0],
+                                    f[None, :, None, 1], f[None, None, :, 2]),
+                -1)
+            output[start:start + block] = tetrahedral_interpolation(
+                table, I, F)
+
+        return output
+    else:
+        raise ValueError(
+            'Undefined interpolation used: "{0}", must be one of the '
+            'following: "{1}".'.format(interpolation,
+                                       ', '.join(INTERPOLATIONS)))
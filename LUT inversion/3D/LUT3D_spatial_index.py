@@ -0,0 +1,354 @@
+import json
+import os
+
+import colour
+import numpy as np
+import scipy
+from scipy.spatial import cKDTree
+
+from LUT3D_inversion_cache import LUT3DInverseCache
+from LUT3D_refinement import extended_domain
+from LUT3D_resampling import lattice_coordinates, resample_lattice
+
+
+def _tree_state(tree):
+    """
+    Returns the state of given *KD-tree* if it has the layout the index
+    persists, i.e. ten fields whose arrays are at positions 0, 1 and 5 to 7
+    as with *Scipy* 1.11, *None* otherwise.
+    """
+
+    state = tree.__getstate__()
+    if (len(state) != 10 or not all(
+            isinstance(state[i], np.ndarray) for i in (0, 1, 5, 6, 7)) or
+            not all(isinstance(state[i], int) for i in (2, 3, 4))):
+        return None
+
+    return state
+
+
+class LUT3DSpatialIndex:
+    """
+    Defines a spatial index of the values of a *LUT3D* resampled on a regular
+    lattice, i.e. a *KD-tree* mapping output *RGB* values to the lattice
+    vertices, which is built once and queried by any number of inversions.
+
+    The index can be saved to a directory of *.npy* files and loaded back
+    memory-mapped, a loaded index is pickled by reference to its directory so
+    that worker processes share its pages. The tree is rebuilt from the
+    memory-mapped values on load unless its saved state is explicitly
+    restored, its state layout being private to *Scipy*.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to index, its domain must be implicit.
+    size : int, optional
+        Lattice size, defaults to the *LUT* size.
+    extrapolate : bool, optional
+        Whether the lattice spans the *LUT* domain extended by one cell on
+        each side, the *LUT* being linearly extrapolated.
+    interpolation : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation kernel evaluating the *LUT* on the lattice.
+
+    Attributes
+    ----------
+    digest : unicode
+        Digest of the *LUT* table and domain.
+    domain : ndarray
+        Lattice domain.
+    points : ndarray
+        *LUT* values at the lattice vertices of shape (size ** 3, 3).
+    tree : cKDTree
+        *KD-tree* of the *LUT* values.
+    directory : unicode
+        Directory the index is saved to or loaded from.
+    restore_tree : bool
+        Whether the tree state is restored when the index is loaded from its
+        directory, e.g. when unpickled.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT3D(size=9)
+    >>> LUT.table = LUT.table ** (1 / 2.2)
+    >>> index = LUT3DSpatialIndex(LUT)
+    >>> index.antecedents(index.tree.query([0.5, 0.5, 0.5])[-1])
+    array([ 0.25,  0.25,  0.25])
+    """
+
+    def __init__(self,
+                 LUT=None,
+                 size=None,
+                 extrapolate=False,
+                 interpolation='Trilinear'):
+        self.directory = None
+        self.restore_tree = False
+
+        if LUT is None:
+            return
+
+        self.size = LUT.size if size is None else size
+        self.extrapolate = extrapolate
+        self.interpolation = interpolation.lower()
+        self.digest = LUT3DInverseCache.key(LUT)
+        self.domain = extended_domain(LUT, extrapolate)
+
+        if self.size == LUT.size and not extrapolate:
+            points = LUT.table
+        else:
+            points = resample_lattice(
+                LUT.table,
+                lattice_coordinates(LUT, self.size, self.domain, extrapolate),
+                interpolation)
+
+        self.points = np.reshape(points, (-1, 3))
+        self.tree = cKDTree(self.points)
+
+    @property
+    def samples(self):
+        """
+        Getter property for the lattice vertices of shape (size ** 3, 3).
+
+        Returns
+        -------
+        ndarray
+            Lattice vertices.
+        """
+
+        return colour.LUT3D.linear_table(self.size, self.domain).reshape(-1, 3)
+
+    def antecedents(self, indexes):
+        """
+        Returns the lattice vertices of given flat indexes, e.g. as returned
+        by :meth:`scipy.spatial.cKDTree.query`.
+
+        Parameters
+        ----------
+        indexes : array_like
+            Flat lattice vertices indexes.
+
+        Returns
+        -------
+        ndarray
+            Lattice vertices of shape (..., 3).
+        """
+
+        indexes = np.asarray(indexes)
+        U = np.stack(
+            np.unravel_index(indexes, (self.size, self.size, self.size)), -1)
+
+        return self.domain[0] + U * (self.domain[1] - self.domain[0]) / (
+            self.size - 1)
+
+    def matches(self, LUT, size=None, extrapolate=False,
+                interpolation='Trilinear'):
+        """
+        Returns whether the index was built for given *LUT* and parameters.
+
+        Parameters
+        ----------
+        LUT : LUT3D
+            *LUT* to check.
+        size : int, optional
+            Lattice size, defaults to the *LUT* size.
+        extrapolate : bool, optional
+            Whether the lattice spans the extended *LUT* domain.
+        interpolation : unicode, optional
+            Interpolation kernel evaluating the *LUT* on the lattice.
+
+        Returns
+        -------
+        bool
+            Whether the index matches.
+        """
+
+        return (self.size == (LUT.size if size is None else size) and
+                self.extrapolate == extrapolate and
+                self.interpolation == interpolation.lower() and
+                self.digest == LUT3DInverseCache.key(LUT))
+
+    def save(self, directory):
+        """
+        Saves the index to given directory, the arrays being stored as
+        *.npy* files that can be memory-mapped.
+
+        Parameters
+        ----------
+        directory : unicode
+            Directory to save the index to.
+        """
+
+        os.makedirs(directory, exist_ok=True)
+
+        np.save(os.path.join(directory, 'points.npy'), self.points)
+
+        # The tree is only saved with a known state layout, it is rebuilt on
+        # load otherwise.
+        tree = None
+        state = _tree_state(self.tree)
+        if state is not None:
+            np.save(os.path.join(directory, 'tree.npy'), state[0])
+            np.save(os.path.join(directory, 'indices.npy'), state[7])
+            tree = {
+                'scipy': scipy.__version__,
+                'state': [
+                    state[2], state[3], state[4], state[5].tolist(),
+                    state[6].tolist()
+                ],
+            }
+
+        with open(os.path.join(directory, 'index.json'), 'w') as json_file:
+            json.dump({
+                'size': self.size,
+                'extrapolate': self.extrapolate,
+                'interpolation': self.interpolation,
+                'digest': self.digest,
+                'domain': self.domain.tolist(),
+                'tree': tree,
+            }, json_file, indent=4)
+
+        self.directory = directory
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r', restore_tree=False):
+        """
+        Loads the index saved to given directory, rebuilding its tree from the
+        memory-mapped values.
+
+        Parameters
+        ----------
+        directory : unicode
+            Directory the index was saved to.
+        mmap_mode : unicode, optional
+            Memory-map mode of the arrays, see :func:`numpy.load` definition,
+            *None* loads them in memory.
+        restore_tree : bool, optional
+            Whether to restore the saved tree state instead of rebuilding the
+            tree, if it was saved by the same *Scipy* release.
+
+        Returns
+        -------
+        LUT3DSpatialIndex
+            Loaded index.
+
+        Notes
+        -----
+        -   Restoring the tree state avoids the tree construction, e.g. about
+            0.1 seconds for a 65 sized lattice, but relies on the private
+            :class:`scipy.spatial.cKDTree` class state layout, and is thus
+            opt-in.
+        """
+
+        with open(os.path.join(directory, 'index.json')) as json_file:
+            metadata = json.load(json_file)
+
+        index = cls()
+        index.directory = directory
+        index.restore_tree = restore_tree
+        index.size = metadata['size']
+        index.extrapolate = metadata['extrapolate']
+        index.interpolation = metadata['interpolation']
+        index.digest = metadata['digest']
+        index.domain = np.array(metadata['domain'])
+
+        def load_array(name):
+            return np.load(
+                os.path.join(directory, '{0}.npy'.format(name)),
+                mmap_mode=mmap_mode)
+
+        index.points = load_array('points')
+        index.tree = None
+
+        tree = metadata.get('tree')
+        if (restore_tree and isinstance(tree, dict) and
+                tree.get('scipy') == scipy.__version__):
+            n, m, leafsize, maxes, mins = tree['state']
+            try:
+                index.tree = cKDTree.__new__(cKDTree)
+                index.tree.__setstate__(
+                    (load_array('tree'), index.points, n, m, leafsize,
+                     np.array(maxes), np.array(mins), load_array('indices'),
+                     None, None))
+            except (OSError, TypeError, ValueError):
+                index.tree = None
+
+        if index.tree is None:
+            index.tree = cKDTree(index.points)
+
+        return index
+
+    def __getstate__(self):
+        if self.directory is not None:
+            return {
+                'directory': self.directory,
+                'restore_tree': self.restore_tree
+            }
+
+        return self.__dict__
+
+    def __setstate__(self, state):
+        if set(state) == {'directory', 'restore_tree'}:
+            state = self.load(
+                state['directory'],
+                restore_tree=state['restore_tree']).__dict__
+
+        self.__dict__.update(state)
+
+
+def spatial_index(LUT, size=None, extrapolate=False,
+                  interpolation='Trilinear'):
+    """
+    Returns the spatial index of given *LUT3D* for given parameters, building
+    it on first use and keeping it attached to the *LUT* for the subsequent
+    calls until the *LUT* table or domain changes.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* to index, its domain must be implicit.
+    size : int, optional
+        Lattice size, defaults to the *LUT* size.
+    extrapolate : bool, optional
+        Whether the lattice spans the *LUT* domain extended by one cell on
+        each side, the *LUT* being linearly extrapolated.
+    interpolation : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation kernel evaluating the *LUT* on the lattice.
+
+    Returns
+    -------
+    LUT3DSpatialIndex
+        *LUT* spatial index.
+
+    Notes
+    -----
+    -   The indexes are reused without hashing the *LUT* table while its
+        table and domain are the same objects, they are only hashed again
+        when they have been reassigned, e.g. about 15 milliseconds for a 65
+        sized *LUT*. A table modified in place must thus be reassigned, e.g.
+        ``LUT.table = np.copy(LUT.table)``, to invalidate the indexes.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT3D(size=9)
+    >>> spatial_index(LUT, 17) is spatial_index(LUT, 17)
+    True
+    """
+
+    indexes = getattr(LUT, '_spatial_indexes', None)
+    if (indexes is None or indexes[0] is not LUT.table or
+            indexes[1] is not LUT.domain):
+        digest = LUT3DInverseCache.key(LUT)
+        indexes = (LUT.table, LUT.domain, digest,
+                   {} if indexes is None or indexes[2] != digest else
+                   indexes[3])
+        LUT._spatial_indexes = indexes
+
+    key = (LUT.size if size is None else size, extrapolate,
+           interpolation.lower())
+    if key not in indexes[3]:
+        indexes[3][key] = LUT3DSpatialIndex(LUT, size, extrapolate,
+                                            interpolation)
+
+    return indexes[3][key]
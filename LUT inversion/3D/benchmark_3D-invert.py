@@ -0,0 +1,246 @@
+"""
+Benchmarks the 3D *LUT* inversion implementations, i.e. *invert* from
+*current_3D-invert.py* and *invert_LUT3D* from *extrapolation_3D-invert.py*.
+
+Each run is executed in a fresh process so that its peak resident set size
+is not polluted by the previous runs, and the results are emitted as *JSON*
+so that they can be diffed between releases::
+
+    python benchmark_3D-invert.py --output benchmark.json
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import scipy
+import colour
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+SOURCE_SIZES = [17, 33, 65]
+
+TARGET_SIZES = [None, 33, 65]
+
+MAXIMUM_TARGET_SIZE = 129
+
+QUERY_SIZES = [1, 4, 8]
+
+EXTRAPOLATE = [True, False]
+
+TEST_SET_SIZE = 32
+
+
+def load_script(name):
+    """
+    Loads given script of the benchmark directory, which cannot be imported
+    with an *import* statement because of its name.
+    """
+
+    sys.path.insert(0, DIRECTORY)
+    specification = importlib.util.spec_from_file_location(
+        name.replace('-', '_'), os.path.join(DIRECTORY, '{0}.py'.format(name)))
+    module = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(module)
+
+    return module
+
+
+def source_LUT(size):
+    """
+    Returns the deterministic non-linear *LUT* used as benchmark source, i.e.
+    a gamma encoding followed by a desaturating matrix.
+    """
+
+    LUT = colour.LUT3D(size=size, name='Benchmark {0}'.format(size))
+    LUT.table = np.dot(
+        colour.cctf_encoding(LUT.table),
+        np.transpose([[0.90, 0.10, 0.00], [0.05, 0.90, 0.05],
+                      [0.00, 0.20, 0.80]]))
+
+    return LUT
+
+
+def round_trip_delta_E(LUT, LUT_inverse, size=TEST_SET_SIZE):
+    """
+    Returns the maximum and mean *CIE 2000* colour difference between a dense
+    test set and its round-trip through given *LUT* and inverse *LUT*.
+    """
+
+    RGB = colour.LUT3D.linear_table(size).reshape(-1, 3)
+    RGB_r = LUT_inverse.apply(LUT.apply(RGB))
+
+    delta_E = colour.delta_E(
+        colour.XYZ_to_Lab(colour.sRGB_to_XYZ(RGB)),
+        colour.XYZ_to_Lab(colour.sRGB_to_XYZ(RGB_r)),
+        method='CIE 2000')
+
+    return float(np.max(delta_E)), float(np.mean(delta_E))
+
+
+def peak_RSS():
+    """
+    Returns the peak resident set size of the current process in bytes.
+    """
+
+    maximum = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return maximum if sys.platform == 'darwin' else maximum * 1024
+
+
+def run(configuration):
+    """
+    Runs given benchmark configuration, this is the entry point of the
+    benchmark worker processes.
+    """
+
+    configuration = dict(configuration)
+    implementation = configuration.pop('implementation')
+    source_size = configuration.pop('source_size')
+    LUT = source_LUT(source_size)
+
+    if implementation == 'invert':
+        invert = load_script('current_3D-invert').invert
+    else:
+        invert = load_script('extrapolation_3D-invert').invert_LUT3D
+
+    baseline_RSS = peak_RSS()
+    start = time.perf_counter()
+    LUT_inverse = invert(LUT, **configuration)
+    wall_time = time.perf_counter() - start
+    # The peak is sampled before the round-trip test set is allocated.
+    inverse_RSS = peak_RSS()
+    maximum_delta_E, mean_delta_E = round_trip_delta_E(LUT, LUT_inverse)
+
+    return {
+        'wall_time': wall_time,
+        'peak_rss': inverse_RSS,
+        'peak_rss_increase': inverse_RSS - baseline_RSS,
+        'target_size': LUT_inverse.size,
+        'delta_E_max': maximum_delta_E,
+        'delta_E_mean': mean_delta_E,
+    }
+
+
+def target_size(source_size,
+                size=None,
+                maximum_target_size=MAXIMUM_TARGET_SIZE):
+    """
+    Returns the inverse *LUT* size of given configuration, the size derived
+    from the source size by *invert_LUT3D* when none is given being capped,
+    e.g. it is 535 for a 65 source size.
+    """
+
+    if size is not None:
+        return size
+
+    return min(int(2 ** (np.sqrt(source_size) + 1) + 1), maximum_target_size)
+
+
+def configurations(source_sizes=SOURCE_SIZES,
+                   target_sizes=TARGET_SIZES,
+                   query_sizes=QUERY_SIZES,
+                   extrapolate=EXTRAPOLATE,
+                   maximum_target_size=MAXIMUM_TARGET_SIZE):
+    """
+    Returns the benchmark configurations, the configurations whose capped
+    inverse *LUT* size is given twice being only returned once.
+    """
+
+    for source_size in source_sizes:
+        yield {'implementation': 'invert', 'source_size': source_size}
+
+    seen = set()
+    for source_size, size, query_size, extrapolate_ in itertools.product(
+            source_sizes, target_sizes, query_sizes, extrapolate):
+        size = target_size(source_size, size, maximum_target_size)
+        if (source_size, size, query_size, extrapolate_) in seen:
+            continue
+
+        seen.add((source_size, size, query_size, extrapolate_))
+        yield {
+            'implementation': 'invert_LUT3D',
+            'source_size': source_size,
+            'size': size,
+            'query_size': query_size,
+            'extrapolate': extrapolate_,
+        }
+
+
+def benchmark(configurations, repeats=1):
+    """
+    Runs given benchmark configurations, each in a fresh process, and returns
+    the benchmark report, the fastest of the repeated runs being kept.
+    """
+
+    context = get_context('spawn')
+    results = []
+    for configuration in configurations:
+        runs = []
+        for _i in range(repeats):
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                runs.append(executor.submit(run, configuration).result())
+
+        result = dict(configuration)
+        result.update(min(runs, key=lambda x: x['wall_time']))
+        results.append(result)
+
+        print(json.dumps(result, sort_keys=True), file=sys.stderr)
+
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'scipy': scipy.__version__,
+            'colour': colour.__version__,
+            'cpu_count': os.cpu_count(),
+        },
+        'test_set_size': TEST_SET_SIZE,
+        'results': results,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmarks the 3D LUT inversion implementations.')
+    parser.add_argument(
+        '--source-sizes', type=int, nargs='+', default=SOURCE_SIZES)
+    parser.add_argument(
+        '--target-sizes',
+        type=lambda x: None if x.lower() == 'none' else int(x),
+        nargs='+',
+        default=TARGET_SIZES)
+    parser.add_argument(
+        '--query-sizes', type=int, nargs='+', default=QUERY_SIZES)
+    parser.add_argument(
+        '--extrapolate',
+        type=lambda x: x.lower() in ('1', 'true', 'yes'),
+        nargs='+',
+        default=EXTRAPOLATE)
+    parser.add_argument(
+        '--maximum-target-size', type=int, default=MAXIMUM_TARGET_SIZE)
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--output', help='JSON report path, default to stdout.')
+    arguments = parser.parse_args()
+
+    report = benchmark(
+        configurations(arguments.source_sizes, arguments.target_sizes,
+                       arguments.query_sizes, arguments.extrapolate,
+                       arguments.maximum_target_size),
+        arguments.repeats)
+
+    if arguments.output is None:
+        print(json.dumps(report, indent=4, sort_keys=True))
+    else:
+        with open(arguments.output, 'w') as json_file:
+            json.dump(report, json_file, indent=4, sort_keys=True)
@@ -1,10 +1,23 @@
 import colour
 import numpy as np
-from scipy.spatial import cKDTree
 
-def invert(self):
+from LUT3D_refinement import newton_refinement
+from LUT3D_spatial_index import spatial_index
+
+def invert(self, refine=False, tolerance=1e-6, index=None):
     """
     Returns the inverted format of the current *LUT*.
+    Parameters
+    ----------
+    refine : bool, optional
+        Whether to refine the nearest neighbour inverse with *Newton*
+        iterations on the current *LUT*.
+    tolerance : numeric, optional
+        Round-trip error euclidean norm below which the *Newton* iterations
+        are converged.
+    index : LUT3DSpatialIndex, optional
+        Spatial index of the current *LUT* vertices, defaults to the index
+        attached to the current *LUT*, which is built on first use.
     Returns
     -------
     LUT3D
@@ -37,21 +50,32 @@ def invert(self):
     LUT_inverse = colour.LUT3D(size=size, name='Inverted Format')
     indexes = LUT_inverse.table
 
-    tree = cKDTree(self.table.reshape(-1, 3))
-    query = tree.query(indexes)[-1]
+    if index is None:
+        index = spatial_index(self)
+    elif not index.matches(self):
+        raise ValueError(
+            'Spatial index was not built for the current "LUT" vertices!')
+    query = index.tree.query(indexes)[-1]
+
+    LUT_inverse.table = index.antecedents(query)
 
-    LUT_inverse.table = indexes.reshape(-1, 3)[query].reshape(
-        [size, size, size, 3])
+    if refine:
+        LUT_inverse.table, converged = newton_refinement(
+            self, indexes, LUT_inverse.table, tolerance)
+        LUT_inverse.comments.append(
+            'Newton refinement converged for {0} of {1} points.'.format(
+                np.sum(converged), converged.size))
 
     return LUT_inverse
 
-RGB = [0.18, 0.18, 0.18]
-LUT = colour.LUT3D()
-LUT.table = colour.cctf_encoding(LUT.table)
-RGB_a = LUT.apply(RGB)
-LUT_inverse = invert(LUT)
-RGB_i = LUT_inverse.apply(RGB_a)
+if __name__ == '__main__':
+    RGB = [0.18, 0.18, 0.18]
+    LUT = colour.LUT3D()
+    LUT.table = colour.cctf_encoding(LUT.table)
+    RGB_a = LUT.apply(RGB)
+    LUT_inverse = invert(LUT)
+    RGB_i = LUT_inverse.apply(RGB_a)
 
-print(RGB)
-print(RGB_a)
-print(RGB_i)
+    print(RGB)
+    print(RGB_a)
+    print(RGB_i)
@@ -1,49 +1,540 @@
 import colour
 import numpy as np
-from scipy.spatial import cKDTree
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import permutations
 
-def invert_LUT3D(LUT, size=None, extrapolate=True, query_size=4):
-    LUT = LUT.copy()
+from LUT3D_refinement import (extended_domain, newton_refinement,
+                              tetrahedral, trilinear)
+from LUT3D_resampling import (INTERPOLATIONS, lattice_coordinates,
+                              resample_lattice)
+from LUT3D_spatial_index import spatial_index
+
+
+def _tetrahedra_offsets():
+    """
+    Returns the vertices offsets, relative to a shared lattice vertex, of the
+    24 tetrahedra of the lattice *Kuhn* triangulation containing that vertex.
+    The shared vertex, i.e. the null offset, is always the first one.
+    """
+
+    offsets = []
+    for permutation in permutations(range(3)):
+        corners = [np.zeros(3, dtype=np.int_)]
+        for axis in permutation:
+            corner = np.copy(corners[-1])
+            corner[axis] = 1
+            corners.append(corner)
+        corners = np.array(corners)
+        for i, corner in enumerate(corners):
+            offsets.append(np.roll(corners, -i, axis=0) - corner)
+
+    return np.array(offsets)
+
+
+TETRAHEDRA_OFFSETS = _tetrahedra_offsets()
+
+NEIGHBOURS_OFFSETS, TETRAHEDRA_NEIGHBOURS = np.unique(
+    TETRAHEDRA_OFFSETS.reshape(-1, 3), axis=0, return_inverse=True)
+TETRAHEDRA_NEIGHBOURS = TETRAHEDRA_NEIGHBOURS.reshape(
+    TETRAHEDRA_OFFSETS.shape[:2])
+
+
+def map_chunks(function, points, chunk_size=None, workers=None):
+    """
+    Applies given function to given points in fixed-size chunks dispatched
+    across a pool of worker threads, the results being written into a single
+    preallocated array.
+
+    Parameters
+    ----------
+    function : callable
+        Function mapping a chunk of points of shape (n, m) to an array of
+        shape (n, 3).
+    points : array_like
+        Points of shape (..., m).
+    chunk_size : int, optional
+        Points count processed at once by a worker, bounding the memory usage
+        independently of the points count, defaults to 65536.
+    workers : int, optional
+        Worker threads count, defaults to the CPU count.
+
+    Returns
+    -------
+    ndarray
+        Mapped points of shape (..., 3).
+
+    Notes
+    -----
+    -   Threads are used rather than processes because
+        :meth:`scipy.spatial.cKDTree.query` and most of the *Numpy*
+        operations release the *GIL*.
+    """
+
+    points = np.asarray(points)
+    shape = points.shape
+    points = points.reshape(-1, shape[-1])
+    output = np.empty((len(points), 3))
+
+    if chunk_size is None:
+        chunk_size = 65536
+
+    def map_chunk(start):
+        output[start:start + chunk_size] = function(
+            points[start:start + chunk_size])
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    starts = range(0, len(points), chunk_size)
+    if workers == 1 or len(starts) == 1:
+        for start in starts:
+            map_chunk(start)
+    else:
+        with ThreadPoolExecutor(workers) as executor:
+            list(executor.map(map_chunk, starts))
+
+    return output.reshape(shape[:-1] + (3, ))
+
+
+def tetrahedra_barycentric_weights(points, Y_V, Y):
+    """
+    Computes in closed form the barycentric weights of given points in given
+    tetrahedra sharing a vertex.
+
+    Parameters
+    ----------
+    points : array_like
+        Points of shape (n, 3).
+    Y_V : array_like
+        Shared vertex of the tetrahedra of each point, of shape (n, 3).
+    Y : array_like
+        Other vertices of the tetrahedra of each point, of shape (n, m, 3, 3).
+
+    Returns
+    -------
+    tuple
+        Barycentric weights of the other vertices of shape (n, m, 3), and
+        smallest barycentric weight, including the shared vertex one, of shape
+        (n, m). The latter is negative if a point is outside a tetrahedron
+        and equal to *-inf* for degenerate tetrahedra.
+    """
+
+    # Barycentric weights with *Cramer's* rule, the shared vertex being the
+    # origin of all the tetrahedra. The vectors are split into their
+    # components, i.e. arrays of shape (n, m), as the cross and dot products
+    # along a last axis of length 3 are dominated by the *Numpy* overhead.
+    (a_x, a_y, a_z), (b_x, b_y, b_z), (c_x, c_y, c_z) = [
+        np.moveaxis(Y[..., j, :] - Y_V[:, None], -1, 0) for j in range(3)]
+    r_x, r_y, r_z = np.transpose(points - Y_V)[..., None]
+
+    bc_x = b_y * c_z - b_z * c_y
+    bc_y = b_z * c_x - b_x * c_z
+    bc_z = b_x * c_y - b_y * c_x
+    determinant = a_x * bc_x + a_y * bc_y + a_z * bc_z
+    degenerate = np.abs(determinant) < 1e-12
+    determinant[degenerate] = 1
+    r_x, r_y, r_z = r_x / determinant, r_y / determinant, r_z / determinant
+
+    w_a = r_x * bc_x + r_y * bc_y + r_z * bc_z
+    w_b = (r_x * (c_y * a_z - c_z * a_y) + r_y * (c_z * a_x - c_x * a_z) +
+           r_z * (c_x * a_y - c_y * a_x))
+    w_c = (r_x * (a_y * b_z - a_z * b_y) + r_y * (a_z * b_x - a_x * b_z) +
+           r_z * (a_x * b_y - a_y * b_x))
+
+    score = np.minimum(
+        np.minimum(w_a, w_b), np.minimum(w_c, 1 - w_a - w_b - w_c))
+    score[degenerate] = -np.inf
+
+    return np.stack([w_a, w_b, w_c], -1), score
+
+
+def nearest_neighbour_inversion(samples,
+                                points,
+                                tree,
+                                query_size=4,
+                                chunk_size=None,
+                                workers=None):
+    """
+    Inverts given forward-evaluated lattice at given points by averaging the
+    samples of the nearest lattice vertices.
+
+    Parameters
+    ----------
+    samples : array_like
+        Lattice samples, i.e. the values the lattice has been evaluated at.
+    points : array_like
+        Points to invert of shape (..., 3).
+    tree : cKDTree
+        Spatial index of the flattened lattice.
+    query_size : int, optional
+        Nearest lattice vertices count to average.
+    chunk_size : int, optional
+        Points count queried at once by a worker, defaults to 65536.
+    workers : int, optional
+        Worker threads count, defaults to the CPU count.
+
+    Returns
+    -------
+    ndarray
+        Inverted points.
+    """
+
+    samples = np.reshape(samples, [-1, 3])
+
+    def invert_chunk(chunk):
+        query = tree.query(chunk, query_size)[-1]
+        if query_size == 1:
+            return samples[query]
+        else:
+            return np.mean(samples[query], axis=-2)
+
+    return map_chunks(invert_chunk, points, chunk_size, workers)
+
+
+def tetrahedral_inversion(lattice,
+                          samples,
+                          points,
+                          tree,
+                          query_size=4,
+                          chunk_size=None,
+                          workers=None):
+    """
+    Inverts given forward-evaluated lattice at given points by finding the
+    lattice tetrahedra containing them and interpolating the lattice samples
+    with the barycentric weights of the points.
+
+    Parameters
+    ----------
+    lattice : array_like
+        Forward-evaluated lattice of shape (size, size, size, 3).
+    samples : array_like
+        Lattice samples, i.e. the values the lattice has been evaluated at.
+    points : array_like
+        Points to invert of shape (..., 3).
+    tree : cKDTree
+        Spatial index of the flattened lattice.
+    query_size : int, optional
+        Nearest lattice vertices count whose adjacent tetrahedra are searched
+        for a tetrahedron containing each point.
+    chunk_size : int, optional
+        Points count processed at once by a worker, bounding the memory usage,
+        defaults to 2048, i.e. small enough for the arrays of the tetrahedra
+        of a chunk to remain in the CPU cache.
+    workers : int, optional
+        Worker threads count, defaults to the CPU count.
+
+    Returns
+    -------
+    ndarray
+        Inverted points.
+
+    Notes
+    -----
+    -   Points outside of all the searched tetrahedra are linearly
+        extrapolated from the tetrahedron whose smallest barycentric weight is
+        the largest.
+    -   Inverting a 33 sized *LUT3D* on a single CPU takes about 0.5 seconds
+        against 0.8 seconds for the default nearest neighbour inversion of a
+        65 sized one, for a 99th percentile round-trip error of 0.0013
+        against 0.0056. The inversion cost per point is however about 4 times
+        the nearest neighbour one, a 65 sized tetrahedral inversion taking
+        about 4 seconds.
+    """
+
+    size = np.array(np.shape(lattice)[:3])
+    lattice = np.reshape(lattice, [-1, 3])
+    samples = np.reshape(samples, [-1, 3])
+
+    strides = np.array([size[1] * size[2], size[2], 1])
+    neighbour = np.where(np.all(NEIGHBOURS_OFFSETS == 0, axis=-1))[0][0]
+
+    if chunk_size is None:
+        chunk_size = 2048
+
+    def invert_chunk(chunk):
+        query = tree.query(chunk, query_size)[-1].reshape(len(chunk), -1)
+        best_score = np.full(len(chunk), -np.inf)
+        best = np.zeros(chunk.shape)
+        for i in range(query.shape[-1]):
+            unresolved = np.where(best_score < 0)[0]
+            if len(unresolved) == 0:
+                break
+
+            # The 24 tetrahedra only share 15 distinct vertices, which are
+            # gathered once rather than once per tetrahedron.
+            V = query[unresolved, i]
+            V_N = np.stack(np.unravel_index(V, size), -1)[:, None] + (
+                NEIGHBOURS_OFFSETS)
+            in_bounds = np.all(np.logical_and(V_N >= 0, V_N < size), -1)
+            in_bounds = np.all(in_bounds[:, TETRAHEDRA_NEIGHBOURS], axis=-1)
+            N = np.dot(np.clip(V_N, 0, size - 1), strides)
+            Y_N = lattice[N]
+
+            weights, score = tetrahedra_barycentric_weights(
+                chunk[unresolved], Y_N[:, neighbour],
+                Y_N[:, TETRAHEDRA_NEIGHBOURS[:, 1:]])
+            score[~in_bounds] = -np.inf
+            tetrahedron = np.argmax(score, axis=-1)
+            index = np.arange(len(V))
+            score = score[index, tetrahedron]
+            improved = score > best_score[unresolved]
+
+            weights = weights[index, tetrahedron]
+            vertices = N[index[:, None],
+                         TETRAHEDRA_NEIGHBOURS[tetrahedron, 1:]]
+            X_V = samples[V]
+            X = X_V + np.sum(
+                weights[..., None] * (samples[vertices] - X_V[:, None]),
+                axis=-2)
+
+            best_score[unresolved[improved]] = score[improved]
+            best[unresolved[improved]] = X[improved]
+
+        return best
+
+    return map_chunks(invert_chunk, points, chunk_size, workers)
+
+
+def refine_inversion(LUT,
+                     LUT_inverse,
+                     size,
+                     tolerance=1e-4,
+                     chunk_size=None,
+                     workers=None,
+                     iterations=3,
+                     extrapolate=False,
+                     interpolation='Trilinear'):
+    """
+    Upsamples given inverse *LUT* to given size and refines the points whose
+    round-trip residual exceeds given tolerance.
+
+    The refined points are solved in the tetrahedra of the forward-evaluated
+    lattice of given size surrounding their upsampled estimate, i.e. without
+    any spatial index query.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        Forward *LUT*.
+    LUT_inverse : LUT3D
+        Coarse inverse *LUT*.
+    size : int
+        Refined inverse *LUT* size.
+    tolerance : numeric, optional
+        Round-trip residual euclidean norm above which points are refined.
+    chunk_size : int, optional
+        Points count processed at once by a worker, bounding the memory usage,
+        defaults to 8192.
+    workers : int, optional
+        Worker threads count, defaults to the CPU count.
+    iterations : int, optional
+        Tetrahedra walk iterations count before searching all the tetrahedra
+        surrounding the estimate.
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the border cells of the forward *LUT*
+        over its domain extended by one cell on each side.
+    interpolation : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation kernel of the forward *LUT*.
+
+    Returns
+    -------
+    LUT3D
+        Refined inverse *LUT*.
+    """
+
+    domain_min, domain_max = extended_domain(LUT, extrapolate)
+    step = (domain_max - domain_min) / (size - 1)
+    strides = np.array([size ** 2, size, 1])
+    neighbour = np.where(np.all(NEIGHBOURS_OFFSETS == 0, axis=-1))[0][0]
+
+    if chunk_size is None:
+        chunk_size = 8192
+
+    def forward(RGB):
+        if interpolation.lower() == 'tetrahedral':
+            return tetrahedral(LUT, RGB, extrapolate)
+        else:
+            return trilinear(LUT, RGB, extrapolate)
+
+    # Both the forward lattice and the upsampled inverse are regular lattices
+    # resampled with separable coordinates rather than per-point lookups.
+    lattice = resample_lattice(
+        LUT.table, lattice_coordinates(LUT, size, extrapolate=extrapolate),
+        interpolation).reshape(-1, 3)
+    samples = colour.LUT3D.linear_table(size, LUT_inverse.domain)
+    estimates = resample_lattice(
+        LUT_inverse.table,
+        lattice_coordinates(LUT_inverse, size, LUT_inverse.domain))
+
+    def refine_chunk(chunk):
+        chunk, estimate = chunk[:, :3], np.copy(chunk[:, 3:])
+        residual = np.linalg.norm(forward(estimate) - chunk, axis=-1)
+        refine = np.where(residual > tolerance)[0]
+        if len(refine) == 0:
+            return estimate
+
+        # Walking the tetrahedra from the one containing the estimate, i.e.
+        # performing *Newton* iterations on the piecewise linear forward
+        # lattice, which is sufficient for most of the points.
+        for _i in range(iterations):
+            U = np.clip((estimate[refine] - domain_min) / step, 0, size - 1)
+            C = np.clip(np.floor(U), 0, size - 2).astype(np.int_)
+            offsets = np.cumsum(
+                np.eye(3, dtype=np.int_)[np.argsort(C - U, axis=-1)], axis=-2)
+            weights, score = tetrahedra_barycentric_weights(
+                chunk[refine], lattice[np.dot(C, strides)],
+                lattice[np.dot(C[:, None] + offsets, strides)][:, None])
+            weights, score = weights[:, 0], score[:, 0]
+            update = np.isfinite(score)
+            estimate[refine[update]] = domain_min + (C[update] + np.sum(
+                weights[update][..., None] * offsets[update], axis=-2)) * step
+            refine = refine[score < -1e-9]
+            if len(refine) == 0:
+                return estimate
+
+        # Points walking out of the lattice have no antecedent in the domain
+        # and are clipped, the tetrahedra surrounding the lattice vertex
+        # nearest to the estimate are searched for the remaining points.
+        outside = np.any(np.logical_or(estimate[refine] < domain_min,
+                                       estimate[refine] > domain_max), -1)
+        estimate[refine[outside]] = np.clip(estimate[refine[outside]],
+                                            domain_min, domain_max)
+        refine = refine[~outside]
+        if len(refine) == 0:
+            return estimate
+
+        V = np.clip(
+            np.around((estimate[refine] - domain_min) / step), 0,
+            size - 1).astype(np.int_)
+        V_N = V[:, None] + NEIGHBOURS_OFFSETS
+        in_bounds = np.all(np.logical_and(V_N >= 0, V_N <= size - 1), -1)
+        in_bounds = np.all(in_bounds[:, TETRAHEDRA_NEIGHBOURS], axis=-1)
+        Y_N = lattice[np.dot(np.clip(V_N, 0, size - 1), strides)]
+
+        weights, score = tetrahedra_barycentric_weights(
+            chunk[refine], Y_N[:, neighbour],
+            Y_N[:, TETRAHEDRA_NEIGHBOURS[:, 1:]])
+        score[~in_bounds] = -np.inf
+        tetrahedron = np.argmax(score, axis=-1)
+        index = np.arange(len(refine))
+        solved = np.isfinite(score[index, tetrahedron])
+
+        weights = weights[index, tetrahedron]
+        offsets = NEIGHBOURS_OFFSETS[TETRAHEDRA_NEIGHBOURS[tetrahedron, 1:]]
+        X = domain_min + (V + np.sum(weights[..., None] * offsets, axis=-2)
+                          ) * step
+
+        estimate[refine[solved]] = X[solved]
+
+        return estimate
+
+    return colour.LUT3D(
+        map_chunks(refine_chunk, np.concatenate([samples, estimates], -1),
+                   chunk_size, workers),
+        domain=LUT_inverse.domain)
+
+
+def invert_LUT3D(LUT,
+                 size=None,
+                 extrapolate=True,
+                 query_size=4,
+                 cache=None,
+                 method='Nearest Neighbour',
+                 chunk_size=None,
+                 workers=None,
+                 pyramid_size=None,
+                 tolerance=1e-4,
+                 refine=False,
+                 interpolation='Trilinear',
+                 index=None):
+    if interpolation.lower() not in [x.lower() for x in INTERPOLATIONS]:
+        raise ValueError(
+            'Undefined interpolation used: "{0}", must be one of the '
+            'following: "{1}".'.format(interpolation,
+                                       ', '.join(INTERPOLATIONS)))
     source_size = LUT.size
-    SIZE = source_size
     target_size = (
         colour.utilities.as_int(2 ** (np.sqrt(source_size) + 1) + 1)
         if size is None else size)
-    if target_size > 129:
+    sizes = [target_size]
+    if pyramid_size is not None and pyramid_size < target_size:
+        sizes = [pyramid_size]
+        while 2 * sizes[-1] - 1 < target_size:
+            sizes.append(2 * sizes[-1] - 1)
+        sizes.append(target_size)
+    if sizes[0] > 129:
         colour.utilities.usage_warning(
             'LUT3D inverse computation time could be excessive!')
-    if extrapolate:
-        LUT.table = np.pad(
-            LUT.table, [(1, 1), (1, 1), (1, 1), (0, 0)], 'reflect',
-            reflect_type='odd')
-        LUT.domain[0] -= 1 / (SIZE - 1)
-        LUT.domain[1] += 1 / (SIZE - 1)
-    LUT_intermediate = colour.LUT3D(size=target_size, domain=LUT.domain)
-    indexes = LUT_intermediate.table
-    LUT_intermediate.table = LUT.apply(LUT_intermediate.table)
-    tree = cKDTree(LUT_intermediate.table.reshape(-1, 3))
-    LUT_inverse = colour.LUT3D(size=target_size, domain=LUT.domain)
-    query = tree.query(indexes, query_size, n_jobs=-1)[-1]
-    if query_size == 1:
-        LUT_inverse.table = indexes.reshape(-1, 3)[query].reshape(
-            [target_size, target_size, target_size, 3])
+    if cache is not None:
+        key = cache.key(
+            LUT,
+            size=target_size,
+            extrapolate=extrapolate,
+            query_size=query_size,
+            method=method.lower(),
+            pyramid_size=sizes[0],
+            tolerance=tolerance if len(sizes) > 1 or refine else None,
+            refine=refine,
+            interpolation=interpolation.lower())
+    # The extrapolation is performed on the fly by the forward evaluations,
+    # i.e. without padding a copy of the table.
+    domain = extended_domain(LUT, extrapolate)
+    if cache is not None:
+        cached = cache.get_LUT(key)
+        if cached is not None:
+            table, name, comments = cached
+            return colour.LUT3D(table, name, domain, comments=comments)
+    # The spatial index of the intermediate lattice is attached to the *LUT*
+    # and reused by the subsequent inversions at the same lattice size.
+    if index is None:
+        index = spatial_index(LUT, sizes[0], extrapolate, interpolation)
+    elif not index.matches(LUT, sizes[0], extrapolate, interpolation):
+        raise ValueError('Spatial index was not built for given "LUT" and '
+                         'inversion parameters!')
+    indexes = colour.LUT3D.linear_table(sizes[0], domain)
+    lattice = index.points.reshape(indexes.shape)
+    if method.lower() == 'tetrahedral':
+        table = tetrahedral_inversion(
+            lattice, indexes, indexes, index.tree, query_size, chunk_size,
+            workers)
+    elif method.lower() == 'nearest neighbour':
+        table = nearest_neighbour_inversion(
+            indexes, indexes, index.tree, query_size, chunk_size, workers)
     else:
-        LUT_inverse.table = np.mean(indexes.reshape(-1, 3)[query],
-                                    axis=-2).reshape(
-            [target_size, target_size, target_size, 3])
-    LUT_target = colour.LUT3D(size=target_size, domain=LUT.domain)
-    LUT_target.table = LUT_inverse.apply(LUT_target.table)
+        raise ValueError(
+            'Undefined method used: "{0}", must be one of the following: '
+            '"{1}".'.format(
+                method, ', '.join(['Nearest Neighbour', 'Tetrahedral'])))
+    # The inverse table is computed at the vertices of the target lattice,
+    # resampling it onto that same lattice would be an identity.
+    LUT_target = colour.LUT3D(table, domain=domain)
+    for level_size in sizes[1:]:
+        LUT_target = refine_inversion(
+            LUT, LUT_target, level_size, tolerance, chunk_size, workers,
+            extrapolate=extrapolate, interpolation=interpolation)
+    LUT_target.name = '{0} Inverse'.format(LUT.name)
+    if refine:
+        LUT_target.table, converged = newton_refinement(
+            LUT, colour.LUT3D.linear_table(target_size, domain),
+            LUT_target.table, tolerance, extrapolate=extrapolate,
+            interpolation=interpolation)
+        LUT_target.comments.append(
+            'Newton refinement converged for {0} of {1} points.'.format(
+                np.sum(converged), converged.size))
+    if cache is not None:
+        cache.set_LUT(key, LUT_target)
     return LUT_target
 
-RGB = [0.18, 0.18, 0.18]
-LUT = colour.LUT3D()
-LUT.table = colour.cctf_encoding(LUT.table)
-RGB_a = LUT.apply(RGB)
-LUT_inverse = invert_LUT3D(LUT)
-RGB_i = LUT_inverse.apply(RGB_a)
-
-print(RGB)
-print(RGB_a)
-print(RGB_i)
-
+if __name__ == '__main__':
+    RGB = [0.18, 0.18, 0.18]
+    LUT = colour.LUT3D()
+    LUT.table = colour.cctf_encoding(LUT.table)
+    RGB_a = LUT.apply(RGB)
+    LUT_inverse = invert_LUT3D(LUT)
+    RGB_i = LUT_inverse.apply(RGB_a)
 
+    print(RGB)
+    print(RGB_a)
+    print(RGB_i)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`LUT3D_inverse` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from unittest import mock
+
+import colour
+import LUT3D_inverse
+from colour.algebra import (table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
+from LUT3D_inverse import apply, coarse_inverse
+from LUT3D_inversion_cache import LUT3DInverseCache
+
+__all__ = ['TestCoarseInverse', 'TestApply']
+
+
+def _LUT():
+    domain = np.array([[-0.1, 0, 0], [1.5, 2, 1]])
+    LUT = colour.LUT3D(size=17, domain=domain)
+    LUT.table = np.dot(
+        colour.cctf_encoding(
+            (LUT.table - domain[0]) / (domain[1] - domain[0])),
+        np.transpose([[0.90, 0.10, 0.00], [0.05, 0.90, 0.05],
+                      [0.00, 0.20, 0.80]]))
+
+    return LUT
+
+
+class TestCoarseInverse(unittest.TestCase):
+    """
+    Defines :func:`LUT3D_inverse.coarse_inverse` definition unit tests
+    methods.
+    """
+
+    def test_coarse_inverse(self):
+        """
+        Tests :func:`LUT3D_inverse.coarse_inverse` definition.
+        """
+
+        LUT = _LUT()
+        cache = LUT3DInverseCache()
+
+        LUT_i = coarse_inverse(LUT, 9, cache)
+        self.assertEqual(LUT_i.size, 9)
+        np.testing.assert_equal(LUT_i.domain, LUT.domain)
+
+        # The spatial index is only built by a cache miss.
+        with mock.patch.object(
+                LUT3D_inverse, 'spatial_index', side_effect=AssertionError):
+            np.testing.assert_equal(
+                coarse_inverse(LUT, 9, cache).table, LUT_i.table)
+
+            self.assertRaises(AssertionError, coarse_inverse, LUT, 5, cache)
+
+
+class TestApply(unittest.TestCase):
+    """
+    Defines :func:`LUT3D_inverse.apply` definition unit tests methods.
+    """
+
+    def test_apply(self):
+        """
+        Tests :func:`LUT3D_inverse.apply` definition in backward direction.
+        """
+
+        LUT = _LUT()
+        domain = LUT.domain
+        RGB = domain[0] + np.random.RandomState(4).uniform(
+            0.05, 0.95, (16, 16, 3)) * (domain[1] - domain[0])
+        RGB_f = apply(LUT, RGB)
+
+        RGB_i = apply(LUT, RGB_f, inverse=True, batch_size=100)
+        self.assertEqual(RGB_i.shape, RGB.shape)
+        np.testing.assert_almost_equal(RGB_i, RGB, decimal=6)
+
+    def test_apply_interpolator(self):
+        """
+        Tests :func:`LUT3D_inverse.apply` definition in backward direction
+        with given interpolator.
+        """
+
+        # The interpolators only differ for a non-separable *LUT* table.
+        LUT = _LUT()
+        LUT.table = LUT.table + 0.1 * np.prod(LUT.table, axis=-1)[..., None]
+        domain = LUT.domain
+        RGB = domain[0] + np.random.RandomState(4).uniform(
+            0.05, 0.95, (256, 3)) * (domain[1] - domain[0])
+
+        for interpolator in (table_interpolation_trilinear,
+                             table_interpolation_tetrahedral):
+            RGB_f = apply(LUT, RGB, interpolator=interpolator)
+            np.testing.assert_almost_equal(
+                apply(LUT, RGB_f, inverse=True, interpolator=interpolator),
+                RGB,
+                decimal=6)
+
+        # The antecedents for the other interpolator are different.
+        RGB_f = apply(LUT, RGB, interpolator=table_interpolation_tetrahedral)
+        self.assertGreater(
+            np.max(np.abs(apply(LUT, RGB_f, inverse=True) - RGB)), 1e-4)
+
+    def test_raise_exception_apply(self):
+        """
+        Tests :func:`LUT3D_inverse.apply` definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            apply,
+            _LUT(),
+            np.array([0.18, 0.18, 0.18]),
+            inverse=True,
+            interpolator=lambda V_xyz, extrapolator_kwargs: V_xyz)
+
+    def test_apply_cache(self):
+        """
+        Tests :func:`LUT3D_inverse.apply` definition coarse inverse cache
+        reuse.
+        """
+
+        LUT = _LUT()
+        RGB_f = apply(LUT, np.array([0.18, 0.18, 0.18]))
+        RGB_i = apply(LUT, RGB_f, inverse=True)
+
+        self.assertIsNotNone(
+            LUT3D_inverse.INVERSE_CACHE.get(
+                LUT3DInverseCache.key(
+                    LUT, size=17, method='coarse nearest neighbour')))
+
+        with mock.patch.object(
+                LUT3D_inverse, 'spatial_index', side_effect=AssertionError):
+            np.testing.assert_equal(
+                apply(LUT, RGB_f, inverse=True), RGB_i)
+
+
+if __name__ == '__main__':
+    unittest.main()
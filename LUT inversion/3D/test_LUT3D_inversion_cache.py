@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`LUT3D_inversion_cache` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+import colour
+from LUT3D_inversion_cache import LUT3DInverseCache
+
+__all__ = ['TestLUT3DInverseCache']
+
+
+class TestLUT3DInverseCache(unittest.TestCase):
+    """
+    Defines :class:`LUT3D_inversion_cache.LUT3DInverseCache` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_key(self):
+        """
+        Tests :meth:`LUT3D_inversion_cache.LUT3DInverseCache.key` method.
+        """
+
+        LUT = colour.LUT3D(size=9)
+        kwargs = {'size': 17, 'extrapolate': True, 'query_size': 4}
+
+        self.assertEqual(
+            LUT3DInverseCache.key(LUT, **kwargs),
+            LUT3DInverseCache.key(LUT.copy(), **kwargs))
+
+        self.assertNotEqual(
+            LUT3DInverseCache.key(LUT, **kwargs),
+            LUT3DInverseCache.key(LUT, size=17, extrapolate=False,
+                                  query_size=4))
+
+        LUT_modified = LUT.copy()
+        LUT_modified.table[4, 4, 4] += 0.01
+        self.assertNotEqual(
+            LUT3DInverseCache.key(LUT, **kwargs),
+            LUT3DInverseCache.key(LUT_modified, **kwargs))
+
+    def test_memory_tier(self):
+        """
+        Tests :class:`LUT3D_inversion_cache.LUT3DInverseCache` class in-memory
+        tier.
+        """
+
+        cache = LUT3DInverseCache(memory_entries=2)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, np.full(3, ord(key)))
+
+        self.assertIsNone(cache.get('a'))
+        np.testing.assert_equal(cache.get('c'), np.full(3, ord('c')))
+
+        table = cache.get('b')
+        table[:] = 0
+        np.testing.assert_equal(cache.get('b'), np.full(3, ord('b')))
+
+    def test_disk_tier(self):
+        """
+        Tests :class:`LUT3D_inversion_cache.LUT3DInverseCache` class on-disk
+        tier.
+        """
+
+        cache = LUT3DInverseCache(self._temporary_directory)
+        cache.set('a', np.arange(6))
+
+        np.testing.assert_equal(
+            LUT3DInverseCache(self._temporary_directory).get('a'),
+            np.arange(6))
+
+        cache = LUT3DInverseCache(self._temporary_directory, disk_bytes=1)
+        cache.set('b', np.arange(6))
+
+        self.assertListEqual(os.listdir(self._temporary_directory), [])
+
+    def test_LUT(self):
+        """
+        Tests :meth:`LUT3D_inversion_cache.LUT3DInverseCache.get_LUT` and
+        :meth:`LUT3D_inversion_cache.LUT3DInverseCache.set_LUT` methods.
+        """
+
+        LUT = colour.LUT3D(
+            size=3, name='Inverse', comments=['A comment.', 'Another.'])
+        cache = LUT3DInverseCache(self._temporary_directory)
+        cache.set_LUT('a', LUT)
+
+        for cache in (cache, LUT3DInverseCache(self._temporary_directory)):
+            table, name, comments = cache.get_LUT('a')
+            np.testing.assert_equal(table, LUT.table)
+            self.assertEqual(name, LUT.name)
+            self.assertListEqual(comments, LUT.comments)
+
+        cache.set('b', LUT.table)
+        self.assertIsNone(cache.get_LUT('b'))
+
+        # The name and comments are stored in the same entry as the table.
+        self.assertListEqual(
+            sorted(os.listdir(self._temporary_directory)), ['a.npz', 'b.npz'])
+
+        cache = LUT3DInverseCache(memory_entries=1)
+        cache.set_LUT('a', LUT)
+        self.assertEqual(cache.get_LUT('a')[1], LUT.name)
+
+        cache.set('b', LUT.table)
+        self.assertIsNone(cache.get_LUT('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`LUT3D_refinement` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+import colour
+from colour.algebra import table_interpolation_tetrahedral
+from LUT3D_refinement import (trilinear_jacobian, tetrahedral_jacobian,
+                              solve_3x3, newton_refinement)
+
+__all__ = [
+    'TestTrilinearJacobian', 'TestTetrahedralJacobian', 'TestSolve3x3',
+    'TestNewtonRefinement'
+]
+
+
+def _LUT():
+    LUT = colour.LUT3D(size=9)
+    LUT.table = (colour.cctf_encoding(LUT.table) +
+                 0.1 * LUT.table[..., ::-1] ** 2)
+
+    return LUT
+
+
+class TestTrilinearJacobian(unittest.TestCase):
+    """
+    Defines :func:`LUT3D_refinement.trilinear_jacobian` definition unit tests
+    methods.
+    """
+
+    def test_trilinear_jacobian(self):
+        """
+        Tests :func:`LUT3D_refinement.trilinear_jacobian` definition.
+        """
+
+        LUT = _LUT()
+        RGB = np.random.RandomState(4).uniform(0.01, 0.99, (256, 3))
+
+        RGB_f, jacobian = trilinear_jacobian(LUT, RGB)
+
+        np.testing.assert_almost_equal(RGB_f, LUT.apply(RGB), decimal=7)
+
+        h = 1e-7
+        for i in range(3):
+            RGB_h = np.copy(RGB)
+            RGB_h[..., i] += h
+            np.testing.assert_almost_equal(
+                (trilinear_jacobian(LUT, RGB_h)[0] - RGB_f) / h,
+                jacobian[..., i],
+                decimal=5)
+
+
+class TestTetrahedralJacobian(unittest.TestCase):
+    """
+    Defines :func:`LUT3D_refinement.tetrahedral_jacobian` definition unit
+    tests methods.
+    """
+
+    def test_tetrahedral_jacobian(self):
+        """
+        Tests :func:`LUT3D_refinement.tetrahedral_jacobian` definition.
+        """
+
+        LUT = _LUT()
+        LUT.table = LUT.table + 0.1 * np.prod(LUT.table, axis=-1)[..., None]
+        RGB = np.random.RandomState(4).uniform(0.01, 0.99, (256, 3))
+
+        RGB_f, jacobian = tetrahedral_jacobian(LUT, RGB)
+
+        np.testing.assert_almost_equal(
+            RGB_f,
+            LUT.apply(RGB, interpolator=table_interpolation_tetrahedral),
+            decimal=7)
+
+        h = 1e-7
+        for i in range(3):
+            RGB_h = np.copy(RGB)
+            RGB_h[..., i] += h
+            np.testing.assert_almost_equal(
+                (tetrahedral_jacobian(LUT, RGB_h)[0] - RGB_f) / h,
+                jacobian[..., i],
+                decimal=5)
+
+
+class TestSolve3x3(unittest.TestCase):
+    """
+    Defines :func:`LUT3D_refinement.solve_3x3` definition unit tests methods.
+    """
+
+    def test_solve_3x3(self):
+        """
+        Tests :func:`LUT3D_refinement.solve_3x3` definition.
+        """
+
+        A = np.random.RandomState(4).uniform(-1, 1, (16, 3, 3))
+        b = np.random.RandomState(8).uniform(-1, 1, (16, 3))
+        A[0] = 0
+
+        x, singular = solve_3x3(A, b)
+
+        np.testing.assert_almost_equal(
+            x[1:], np.linalg.solve(A[1:], b[1:]), decimal=7)
+        np.testing.assert_equal(x[0], np.zeros(3))
+        self.assertListEqual(np.where(singular)[0].tolist(), [0])
+
+
+class TestNewtonRefinement(unittest.TestCase):
+    """
+    Defines :func:`LUT3D_refinement.newton_refinement` definition unit tests
+    methods.
+    """
+
+    def test_newton_refinement(self):
+        """
+        Tests :func:`LUT3D_refinement.newton_refinement` definition.
+        """
+
+        LUT = _LUT()
+        RGB_i = np.random.RandomState(4).uniform(0.05, 0.95, (256, 3))
+        RGB = LUT.apply(RGB_i)
+
+        RGB_r, converged = newton_refinement(
+            LUT, RGB, np.clip(RGB_i + 0.02, 0, 1), tolerance=1e-9)
+
+        self.assertTrue(np.all(converged))
+        np.testing.assert_almost_equal(RGB_r, RGB_i, decimal=7)
+
+        RGB_r, converged = newton_refinement(
+            LUT, np.array([2.0, 2.0, 2.0]), np.array([0.5, 0.5, 0.5]))
+
+        self.assertFalse(converged)
+        np.testing.assert_almost_equal(RGB_r, np.ones(3), decimal=7)
+
+    def test_newton_refinement_tetrahedral(self):
+        """
+        Tests :func:`LUT3D_refinement.newton_refinement` definition with
+        tetrahedral interpolation.
+        """
+
+        LUT = _LUT()
+        LUT.table = LUT.table + 0.1 * np.prod(LUT.table, axis=-1)[..., None]
+        RGB_i = np.random.RandomState(4).uniform(0.05, 0.95, (256, 3))
+        RGB = LUT.apply(RGB_i, interpolator=table_interpolation_tetrahedral)
+
+        RGB_r, converged = newton_refinement(
+            LUT,
+            RGB,
+            np.clip(RGB_i + 0.02, 0, 1),
+            tolerance=1e-9,
+            interpolation='Tetrahedral')
+
+        self.assertTrue(np.all(converged))
+        np.testing.assert_almost_equal(RGB_r, RGB_i, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
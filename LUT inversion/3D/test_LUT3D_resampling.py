@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`LUT3D_resampling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+import colour
+from colour.algebra import table_interpolation_tetrahedral
+from LUT3D_refinement import extended_domain, tetrahedral, trilinear
+from LUT3D_resampling import lattice_coordinates, resample_lattice
+
+__all__ = ['TestResampleLattice']
+
+
+class TestResampleLattice(unittest.TestCase):
+    """
+    Defines :func:`LUT3D_resampling.resample_lattice` definition unit tests
+    methods.
+    """
+
+    def test_resample_lattice(self):
+        """
+        Tests :func:`LUT3D_resampling.resample_lattice` definition.
+        """
+
+        LUT = colour.LUT3D(size=9)
+        LUT.table = (colour.cctf_encoding(LUT.table) +
+                     0.1 * LUT.table[..., ::-1] ** 2)
+
+        for extrapolate in (False, True):
+            coordinates = lattice_coordinates(LUT, 13, extrapolate=extrapolate)
+            RGB = colour.LUT3D.linear_table(13,
+                                            extended_domain(LUT, extrapolate))
+
+            np.testing.assert_almost_equal(
+                resample_lattice(LUT.table, coordinates),
+                trilinear(LUT, RGB, extrapolate),
+                decimal=7)
+            np.testing.assert_almost_equal(
+                resample_lattice(
+                    LUT.table, coordinates, 'Tetrahedral', block_size=1),
+                tetrahedral(LUT, RGB, extrapolate),
+                decimal=7)
+
+        RGB = colour.LUT3D.linear_table(13)
+        np.testing.assert_almost_equal(
+            resample_lattice(LUT.table, lattice_coordinates(LUT, 13),
+                             'Tetrahedral'),
+            LUT.apply(RGB, interpolator=table_interpolation_tetrahedral),
+            decimal=7)
+
+    def test_raise_exception_resample_lattice(self):
+        """
+        Tests :func:`LUT3D_resampling.resample_lattice` definition raised
+        exception.
+        """
+
+        LUT = colour.LUT3D(size=3)
+
+        self.assertRaises(ValueError, resample_lattice, LUT.table,
+                          lattice_coordinates(LUT, 5), 'Undefined')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`LUT3D_spatial_index` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from scipy.spatial import cKDTree
+
+import colour
+import LUT3D_spatial_index
+from LUT3D_spatial_index import LUT3DSpatialIndex, spatial_index
+
+__all__ = ['TestLUT3DSpatialIndex', 'TestSpatialIndex']
+
+
+def _LUT():
+    LUT = colour.LUT3D(size=9)
+    LUT.table = colour.cctf_encoding(LUT.table)
+
+    return LUT
+
+
+class _cKDTree(cKDTree):
+    def __init__(self, *args, **kwargs):
+        raise AssertionError('"cKDTree" was built!')
+
+
+class TestLUT3DSpatialIndex(unittest.TestCase):
+    """
+    Defines :class:`LUT3D_spatial_index.LUT3DSpatialIndex` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_antecedents(self):
+        """
+        Tests :meth:`LUT3D_spatial_index.LUT3DSpatialIndex.antecedents`
+        method.
+        """
+
+        index = LUT3DSpatialIndex(_LUT(), 17, extrapolate=True)
+
+        np.testing.assert_almost_equal(
+            index.antecedents(np.arange(17 ** 3)), index.samples, decimal=7)
+
+    def test_matches(self):
+        """
+        Tests :meth:`LUT3D_spatial_index.LUT3DSpatialIndex.matches` method.
+        """
+
+        LUT = _LUT()
+        index = LUT3DSpatialIndex(LUT, 17, extrapolate=True)
+
+        self.assertTrue(index.matches(LUT.copy(), 17, True))
+        self.assertFalse(index.matches(LUT, 17, False))
+        self.assertFalse(index.matches(LUT, 17, True, 'Tetrahedral'))
+
+        LUT.table[4, 4, 4] += 0.01
+        self.assertFalse(index.matches(LUT, 17, True))
+
+    def test_save_load(self):
+        """
+        Tests :meth:`LUT3D_spatial_index.LUT3DSpatialIndex.save` and
+        :meth:`LUT3D_spatial_index.LUT3DSpatialIndex.load` methods.
+        """
+
+        LUT = _LUT()
+        index = LUT3DSpatialIndex(LUT, 17, extrapolate=True)
+        index.save(self._temporary_directory)
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (64, 3))
+        index_r = LUT3DSpatialIndex.load(
+            self._temporary_directory, restore_tree=True)
+        for index_l in (LUT3DSpatialIndex.load(self._temporary_directory),
+                        index_r, pickle.loads(pickle.dumps(index)),
+                        pickle.loads(pickle.dumps(index_r))):
+            self.assertIsInstance(index_l.points, np.memmap)
+            self.assertTrue(index_l.matches(LUT, 17, True))
+            np.testing.assert_equal(
+                index_l.tree.query(RGB, 4), index.tree.query(RGB, 4))
+
+        # The tree is rebuilt by default and only restored on demand.
+        with mock.patch.object(LUT3D_spatial_index, 'cKDTree', _cKDTree):
+            self.assertRaises(AssertionError, LUT3DSpatialIndex.load,
+                              self._temporary_directory)
+            self.assertIsInstance(
+                pickle.loads(pickle.dumps(index_r)).tree, _cKDTree)
+
+    def test_save_load_rebuild(self):
+        """
+        Tests :meth:`LUT3D_spatial_index.LUT3DSpatialIndex.load` method tree
+        rebuild.
+        """
+
+        LUT = _LUT()
+        index = LUT3DSpatialIndex(LUT, 17)
+        RGB = np.random.RandomState(4).uniform(0, 1, (64, 3))
+        json_path = os.path.join(self._temporary_directory, 'index.json')
+
+        # Tree saved by another *Scipy* release.
+        index.save(self._temporary_directory)
+        with open(json_path) as json_file:
+            metadata = json.load(json_file)
+        metadata['tree']['scipy'] = '0.0.0'
+        with open(json_path, 'w') as json_file:
+            json.dump(metadata, json_file)
+
+        np.testing.assert_equal(
+            LUT3DSpatialIndex.load(
+                self._temporary_directory, restore_tree=True).tree.query(
+                    RGB, 4), index.tree.query(RGB, 4))
+
+        # Unknown tree state layout.
+        shutil.rmtree(self._temporary_directory)
+        with mock.patch.object(LUT3D_spatial_index, '_tree_state',
+                               return_value=None):
+            index.save(self._temporary_directory)
+
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(self._temporary_directory, 'tree.npy')))
+        np.testing.assert_equal(
+            LUT3DSpatialIndex.load(
+                self._temporary_directory, restore_tree=True).tree.query(
+                    RGB, 4), index.tree.query(RGB, 4))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """
+    Defines :func:`LUT3D_spatial_index.spatial_index` definition unit tests
+    methods.
+    """
+
+    def test_spatial_index(self):
+        """
+        Tests :func:`LUT3D_spatial_index.spatial_index` definition.
+        """
+
+        LUT = _LUT()
+        index = spatial_index(LUT)
+
+        self.assertIs(spatial_index(LUT), index)
+        self.assertIsNot(spatial_index(LUT, 17), index)
+
+        LUT.table = LUT.table ** 2
+        self.assertIsNot(spatial_index(LUT), index)
+        self.assertTrue(spatial_index(LUT).matches(LUT))
+
+    def test_spatial_index_digest(self):
+        """
+        Tests :func:`LUT3D_spatial_index.spatial_index` definition *LUT*
+        table hashing.
+        """
+
+        LUT = _LUT()
+        index = spatial_index(LUT)
+
+        # The *LUT* table is only hashed again when it is reassigned.
+        with mock.patch.object(LUT3D_spatial_index.LUT3DInverseCache, 'key',
+                               side_effect=AssertionError):
+            self.assertIs(spatial_index(LUT), index)
+
+        LUT.table = np.copy(LUT.table)
+        self.assertIs(spatial_index(LUT), index)
+
+        LUT.table[4, 4, 4] += 0.01
+        self.assertIs(spatial_index(LUT), index)
+
+        LUT.table = np.copy(LUT.table)
+        self.assertIsNot(spatial_index(LUT), index)
+        self.assertTrue(spatial_index(LUT).matches(LUT))
+
+
+if __name__ == '__main__':
+    unittest.main()
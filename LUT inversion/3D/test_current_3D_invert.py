@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`current_3D-invert` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import importlib.util
+import numpy as np
+import os
+import sys
+import unittest
+
+import colour
+from LUT3D_spatial_index import LUT3DSpatialIndex
+
+__all__ = ['DIRECTORY', 'TestInvert']
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_script(name):
+    """
+    Loads given script of the tests directory, which cannot be imported with
+    an *import* statement because of its name.
+    """
+
+    sys.path.insert(0, DIRECTORY)
+    specification = importlib.util.spec_from_file_location(
+        name.replace('-', '_'), os.path.join(DIRECTORY, '{0}.py'.format(name)))
+    module = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(module)
+
+    return module
+
+
+current_3D_invert = _load_script('current_3D-invert')
+
+
+def _LUT():
+    LUT = colour.LUT3D(size=9)
+    LUT.table = (colour.cctf_encoding(LUT.table) +
+                 0.1 * LUT.table[..., ::-1] ** 2)
+
+    return LUT
+
+
+def _residual(LUT, LUT_inverse):
+    return np.linalg.norm(
+        LUT.apply(LUT_inverse.table) - LUT_inverse.linear_table(
+            LUT_inverse.size, LUT_inverse.domain),
+        axis=-1)
+
+
+class TestInvert(unittest.TestCase):
+    """
+    Defines :func:`current_3D-invert.invert` definition unit tests methods.
+    """
+
+    def test_invert(self):
+        """
+        Tests :func:`current_3D-invert.invert` definition.
+        """
+
+        LUT = _LUT()
+        LUT_i = current_3D_invert.invert(LUT)
+
+        self.assertEqual(LUT_i.size, LUT.size)
+        self.assertListEqual(LUT_i.comments, [])
+
+        np.testing.assert_equal(
+            LUT_i.table,
+            current_3D_invert.invert(LUT, index=LUT3DSpatialIndex(LUT)).table)
+
+    def test_invert_refine(self):
+        """
+        Tests :func:`current_3D-invert.invert` definition *Newton*
+        refinement.
+        """
+
+        LUT = _LUT()
+        residual = _residual(LUT, current_3D_invert.invert(LUT))
+
+        LUT_r = current_3D_invert.invert(LUT, refine=True)
+        residual_r = _residual(LUT, LUT_r)
+
+        self.assertLess(np.mean(residual_r), np.mean(residual) / 10)
+        self.assertTrue(np.all(residual_r <= residual + 1e-12))
+
+        self.assertEqual(len(LUT_r.comments), 1)
+        self.assertIn('Newton refinement converged', LUT_r.comments[0])
+        self.assertIn('of {0} points'.format(LUT.size ** 3), LUT_r.comments[0])
+
+    def test_raise_exception_invert(self):
+        """
+        Tests :func:`current_3D-invert.invert` definition raised exception.
+        """
+
+        LUT = _LUT()
+        index = LUT3DSpatialIndex(LUT)
+        LUT.table = LUT.table ** 2
+
+        self.assertRaises(
+            ValueError, current_3D_invert.invert, LUT, index=index)
+
+
+if __name__ == '__main__':
+    unittest.main()
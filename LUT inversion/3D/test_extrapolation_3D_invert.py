@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`extrapolation_3D-invert` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import importlib.util
+import numpy as np
+import os
+import sys
+import unittest
+from unittest import mock
+from scipy.spatial import cKDTree
+
+import colour
+from colour.algebra import table_interpolation_tetrahedral
+from LUT3D_inversion_cache import LUT3DInverseCache
+
+__all__ = [
+    'DIRECTORY', 'TestMapChunks', 'TestTetrahedraBarycentricWeights',
+    'TestTetrahedralInversion', 'TestRefineInversion', 'TestInvertLUT3D'
+]
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_script(name):
+    """
+    Loads given script of the tests directory, which cannot be imported with
+    an *import* statement because of its name.
+    """
+
+    sys.path.insert(0, DIRECTORY)
+    specification = importlib.util.spec_from_file_location(
+        name.replace('-', '_'), os.path.join(DIRECTORY, '{0}.py'.format(name)))
+    module = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(module)
+
+    return module
+
+
+extrapolation_3D_invert = _load_script('extrapolation_3D-invert')
+
+
+def _LUT():
+    LUT = colour.LUT3D(size=9, name='Extrapolation')
+    LUT.table = np.dot(
+        colour.cctf_encoding(LUT.table),
+        np.transpose([[0.90, 0.10, 0.00], [0.05, 0.90, 0.05],
+                      [0.00, 0.20, 0.80]]))
+
+    return LUT
+
+
+def _residual(LUT, LUT_inverse):
+    return np.linalg.norm(
+        LUT.apply(LUT_inverse.table) - LUT_inverse.linear_table(
+            LUT_inverse.size, LUT_inverse.domain),
+        axis=-1)
+
+
+class TestMapChunks(unittest.TestCase):
+    """
+    Defines :func:`extrapolation_3D-invert.map_chunks` definition unit tests
+    methods.
+    """
+
+    def test_map_chunks(self):
+        """
+        Tests :func:`extrapolation_3D-invert.map_chunks` definition.
+        """
+
+        points = np.random.RandomState(4).uniform(0, 1, (9, 11, 4))
+        RGB = np.sum(points, axis=-1)[..., None] * points[..., :3]
+
+        for chunk_size, workers in ((None, 1), (7, 1), (7, 4), (1000, 4)):
+            np.testing.assert_equal(
+                extrapolation_3D_invert.map_chunks(
+                    lambda x: np.sum(x, axis=-1)[..., None] * x[..., :3],
+                    points, chunk_size, workers), RGB)
+
+
+class TestTetrahedraBarycentricWeights(unittest.TestCase):
+    """
+    Defines :func:`extrapolation_3D-invert.tetrahedra_barycentric_weights`
+    definition unit tests methods.
+    """
+
+    def test_tetrahedra_barycentric_weights(self):
+        """
+        Tests :func:`extrapolation_3D-invert.tetrahedra_barycentric_weights`
+        definition.
+        """
+
+        points = np.array([[0.1, 0.2, 0.3], [-0.1, 0.2, 0.3]])
+        Y_V = np.zeros([2, 3])
+        Y = np.tile(np.identity(3), [2, 2, 1, 1])
+        Y[:, 1, 2] = [1, 1, 0]
+
+        weights, score = (
+            extrapolation_3D_invert.tetrahedra_barycentric_weights(
+                points, Y_V, Y))
+
+        np.testing.assert_almost_equal(weights[:, 0], points, decimal=7)
+        np.testing.assert_almost_equal(
+            score[:, 0], np.array([0.1, -0.1]), decimal=7)
+        np.testing.assert_equal(score[:, 1], np.array([-np.inf, -np.inf]))
+
+
+class TestTetrahedralInversion(unittest.TestCase):
+    """
+    Defines :func:`extrapolation_3D-invert.tetrahedral_inversion` definition
+    unit tests methods.
+    """
+
+    def test_tetrahedral_inversion(self):
+        """
+        Tests :func:`extrapolation_3D-invert.tetrahedral_inversion`
+        definition.
+        """
+
+        LUT = _LUT()
+        RGB = np.random.RandomState(4).uniform(0.05, 0.95, (256, 3))
+        RGB_f = LUT.apply(RGB, interpolator=table_interpolation_tetrahedral)
+
+        # The *Kuhn* triangulation is the one of the tetrahedral
+        # interpolation, the forward points are thus inverted exactly.
+        np.testing.assert_almost_equal(
+            extrapolation_3D_invert.tetrahedral_inversion(
+                LUT.table, LUT.linear_table(9), RGB_f,
+                cKDTree(LUT.table.reshape(-1, 3))),
+            RGB,
+            decimal=7)
+
+
+class TestRefineInversion(unittest.TestCase):
+    """
+    Defines :func:`extrapolation_3D-invert.refine_inversion` definition unit
+    tests methods.
+    """
+
+    def test_refine_inversion(self):
+        """
+        Tests :func:`extrapolation_3D-invert.refine_inversion` definition.
+        """
+
+        LUT = _LUT()
+        residual = _residual(
+            LUT,
+            extrapolation_3D_invert.invert_LUT3D(
+                LUT, 17, extrapolate=False, method='Tetrahedral'))
+
+        # The points a direct inversion solves within the tolerance must also
+        # be solved by refining a coarse inversion.
+        LUT_r = extrapolation_3D_invert.refine_inversion(
+            LUT,
+            extrapolation_3D_invert.invert_LUT3D(
+                LUT, 5, extrapolate=False, method='Tetrahedral'),
+            17,
+            tolerance=1e-4)
+
+        self.assertEqual(LUT_r.size, 17)
+        self.assertLessEqual(
+            np.max(_residual(LUT, LUT_r)[residual <= 1e-4]), 1e-4)
+
+
+class TestInvertLUT3D(unittest.TestCase):
+    """
+    Defines :func:`extrapolation_3D-invert.invert_LUT3D` definition unit
+    tests methods.
+    """
+
+    def test_invert_LUT3D(self):
+        """
+        Tests :func:`extrapolation_3D-invert.invert_LUT3D` definition.
+        """
+
+        LUT = _LUT()
+        RGB = np.random.RandomState(4).uniform(0.05, 0.95, (256, 3))
+        RGB_f = LUT.apply(RGB)
+
+        LUT_i = extrapolation_3D_invert.invert_LUT3D(
+            LUT, 17, extrapolate=False, method='Tetrahedral')
+
+        self.assertEqual(LUT_i.name, 'Extrapolation Inverse')
+        self.assertLess(
+            np.max(np.abs(LUT.apply(LUT_i.apply(RGB_f)) - RGB_f)), 0.02)
+
+    def test_invert_LUT3D_chunks(self):
+        """
+        Tests :func:`extrapolation_3D-invert.invert_LUT3D` definition chunked
+        across worker threads.
+        """
+
+        LUT = _LUT()
+        for method in ('Nearest Neighbour', 'Tetrahedral'):
+            LUT_i = extrapolation_3D_invert.invert_LUT3D(
+                LUT, 9, method=method, chunk_size=None, workers=1)
+
+            for chunk_size, workers in ((100, 1), (100, 4)):
+                np.testing.assert_equal(
+                    extrapolation_3D_invert.invert_LUT3D(
+                        LUT, 9, method=method, chunk_size=chunk_size,
+                        workers=workers).table, LUT_i.table)
+
+    def test_invert_LUT3D_pyramid(self):
+        """
+        Tests :func:`extrapolation_3D-invert.invert_LUT3D` definition
+        coarse-to-fine pyramid.
+        """
+
+        LUT = _LUT()
+        residual = _residual(
+            LUT,
+            extrapolation_3D_invert.invert_LUT3D(
+                LUT, 33, extrapolate=False, method='Tetrahedral'))
+        solved = residual <= 1e-4
+
+        for pyramid_size in (5, 9):
+            residual_p = _residual(
+                LUT,
+                extrapolation_3D_invert.invert_LUT3D(
+                    LUT,
+                    33,
+                    extrapolate=False,
+                    method='Tetrahedral',
+                    pyramid_size=pyramid_size,
+                    tolerance=1e-4))
+
+            self.assertLessEqual(np.max(residual_p[solved]), 1e-4)
+            self.assertGreaterEqual(
+                np.sum(residual_p <= 1e-4), np.sum(solved))
+
+    def test_invert_LUT3D_cache(self):
+        """
+        Tests :func:`extrapolation_3D-invert.invert_LUT3D` definition
+        cache.
+        """
+
+        LUT = _LUT()
+        cache = LUT3DInverseCache()
+
+        LUT_i = extrapolation_3D_invert.invert_LUT3D(
+            LUT, 9, cache=cache, refine=True)
+        # The spatial index is only built by a cache miss.
+        with mock.patch.object(extrapolation_3D_invert, 'spatial_index',
+                               side_effect=AssertionError):
+            LUT_c = extrapolation_3D_invert.invert_LUT3D(
+                LUT, 9, cache=cache, refine=True)
+
+        self.assertEqual(LUT_c, LUT_i)
+        self.assertEqual(LUT_c.name, LUT_i.name)
+        self.assertListEqual(LUT_c.comments, LUT_i.comments)
+        self.assertIn('Newton refinement', LUT_c.comments[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,441 @@
+import numpy as np, colour
+from colour.algebra import LinearInterpolator
+from colour.utilities.deprecation import handle_arguments_deprecation
+
+
+def _output(RGB, out=None):
+    """
+    Returns given output array, allocated with the shape of given *RGB*
+    colourspace array if not given, and a flat view of it.
+    """
+
+    if out is None:
+        out = np.empty(RGB.shape)
+
+    # Assigning the shape of a view raises instead of copying if the output
+    # array is not contiguous.
+    RGB_o = out.view()
+    RGB_o.shape = (-1, )
+
+    return out, RGB_o
+
+
+def _validate_range(RGB, coordinates, lower, upper):
+    """
+    Raises a *ValueError* if given *RGB* colourspace array interpolation
+    range coordinates are below given lower or above given upper
+    coordinates, *NaN* values being in range.
+    """
+
+    if np.any(coordinates < lower):
+        raise ValueError('"{0}" is below interpolation range.'.format(RGB))
+    if np.any(coordinates > upper):
+        raise ValueError('"{0}" is above interpolation range.'.format(RGB))
+
+
+def _cells(coordinates, count):
+    """
+    Returns the cells, clipped to [0, count - 1], of given cells coordinates,
+    and the mask of the non-finite coordinates or *None* if all of them are
+    finite, the non-finite coordinates being replaced in place with zeros.
+    """
+
+    non_finite = ~np.isfinite(coordinates)
+    if np.any(non_finite):
+        coordinates[non_finite] = 0
+    else:
+        non_finite = None
+
+    return np.clip(coordinates, 0, count - 1).astype(np.intp), non_finite
+
+
+def _chunks(RGB, chunk_size):
+    """
+    Yields the flat slices of given flat *RGB* colourspace array holding
+    whole pixels, and the channel of each of their values.
+    """
+
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    channels = np.tile(np.arange(3), chunk_size // 3)
+    for start in range(0, len(RGB), chunk_size):
+        chunk = slice(start, start + chunk_size)
+
+        yield chunk, channels[:len(RGB[chunk])]
+
+
+def _samples(self):
+    """
+    Returns the samples of the *LUT* of shape (size, 3).
+    """
+
+    if self.is_domain_explicit():
+        return np.copy(self.domain)
+    else:
+        return colour.LUT3x1D.linear_table(self.size, self.domain)
+
+
+def channel_nodes(x, y):
+    """
+    Returns the nodes of the three piecewise linear functions through given
+    monotonic abscissae and given ordinates, laid out channel after channel
+    in flat arrays so that the three channels are evaluated at once.
+
+    Parameters
+    ----------
+    x : array_like
+        Monotonic abscissae of shape (size, 3), e.g. *LUT* samples.
+    y : array_like
+        Ordinates of shape (size, 3), e.g. *LUT* table values.
+
+    Returns
+    -------
+    tuple
+        Flat increasing abscissae, ordinates and segments slopes of shape
+        (3 * size, ), abscissae origins and buckets scales of shape (3, ),
+        flat buckets first segments and density of shape (3 * count, ),
+        size and buckets count.
+
+    Examples
+    --------
+    >>> x = colour.LUT3x1D.linear_table(3)
+    >>> nodes = channel_nodes(x, x ** 2)
+    >>> nodes[0]
+    array([ 0. ,  0.5,  1. ,  0. ,  0.5,  1. ,  0. ,  0.5,  1. ])
+    """
+
+    x = np.transpose(np.array(x, dtype=np.float_))
+    y = np.transpose(np.array(y, dtype=np.float_))
+
+    decreasing = x[:, -1] < x[:, 0]
+    x[decreasing], y[decreasing] = x[decreasing, ::-1], y[decreasing, ::-1]
+
+    if np.any(np.diff(x, axis=-1) < 0):
+        colour.utilities.usage_warning(
+            'LUT is not monotonic, its inverse is not unique!')
+
+    channels, size = x.shape
+    slopes = np.zeros(x.shape)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slopes[:, :-1] = np.diff(y, axis=-1) / np.diff(x, axis=-1)
+    slopes[~np.isfinite(slopes)] = 0
+
+    # Uniform buckets of the abscissae of each channel: a bucket holding at
+    # most one abscissa locates the segment of any value in it with a single
+    # comparison, the values of the other buckets are binary searched.
+    count = min(4 * size, 2 ** 16)
+    extent = x[:, -1] - x[:, 0]
+    scale = np.where(extent > 0, count / np.where(extent > 0, extent, 1), 0)
+    buckets = np.minimum(
+        np.floor((x - x[:, :1]) * scale[:, None]), count - 1).astype(np.intp)
+
+    starts = np.empty((channels, count), dtype=np.intp)
+    dense = np.empty((channels, count), dtype=bool)
+    for i in range(channels):
+        starts[i] = np.clip(
+            np.searchsorted(buckets[i], np.arange(count)) - 1, 0,
+            size - 2) + i * size
+        dense[i] = np.bincount(buckets[i], minlength=count) > 1
+
+    return (np.ravel(x), np.ravel(y), np.ravel(slopes), x[:, 0], scale,
+            np.ravel(starts), np.ravel(dense), size, count)
+
+
+def evaluate_channels(nodes, RGB, extrapolate=True, chunk_size=8192,
+                      out=None):
+    """
+    Evaluates given channels piecewise linear functions nodes at given *RGB*
+    colourspace array, in one pass over all its channels.
+
+    Parameters
+    ----------
+    nodes : tuple
+        Channels nodes as returned by :func:`channel_nodes` definition.
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the first and last segments beyond
+        the abscissae, a *ValueError* being raised otherwise, like
+        :class:`colour.algebra.LinearInterpolator` class does.
+    chunk_size : int, optional
+        Values count evaluated at once, keeping the intermediate arrays in
+        the processor cache.
+    out : ndarray, optional
+        C-contiguous array of the shape of the *RGB* colourspace array to
+        write the function values into.
+
+    Returns
+    -------
+    ndarray
+        Function values, *NaN* at the non-finite values.
+
+    Examples
+    --------
+    >>> x = colour.LUT3x1D.linear_table(3)
+    >>> nodes = channel_nodes(x, x * np.array([1, 2, 3]))
+    >>> evaluate_channels(nodes, np.array([0.25, 0.5, 2]))
+    array([ 0.25,  1.  ,  6.  ])
+    """
+
+    x_p, y_p, slopes, origins, scales, starts, dense, size, count = nodes
+    RGB = np.asarray(RGB, dtype=np.float_)
+    out, RGB_o = _output(RGB, out)
+    RGB = np.ravel(RGB)
+    lower, upper = x_p[::size], x_p[size - 1::size]
+
+    for chunk, channels in _chunks(RGB, chunk_size):
+        x = RGB[chunk]
+        if not extrapolate:
+            _validate_range(x, x, lower[channels], upper[channels])
+
+        bucket, non_finite = _cells(
+            (x - origins[channels]) * scales[channels], count)
+        bucket += channels * count
+        i = starts[bucket]
+        i += x >= x_p[i + 1]
+        np.minimum(i, channels * size + size - 2, out=i)
+
+        search = np.nonzero(dense[bucket])[0]
+        for channel in range(3):
+            search_c = search[channels[search] == channel]
+            if len(search_c):
+                i[search_c] = np.clip(
+                    np.searchsorted(
+                        x_p[channel * size:(channel + 1) * size],
+                        x[search_c], 'right') - 1, 0,
+                    size - 2) + channel * size
+
+        RGB_c = RGB_o[chunk]
+        np.subtract(x, x_p[i], out=RGB_c)
+        RGB_c *= slopes[i]
+        RGB_c += y_p[i]
+        if non_finite is not None:
+            RGB_c[non_finite] = np.nan
+
+    return out
+
+
+def uniform_channels_interpolation(table, domain, RGB, chunk_size=8192,
+                                   out=None):
+    """
+    Linearly interpolates given *LUT3x1D* table, uniformly sampled over given
+    implicit domain, at given *RGB* colourspace array, in one pass over all
+    its channels, the cells being indexed with arithmetic.
+
+    Parameters
+    ----------
+    table : array_like
+        Table of shape (size, 3).
+    domain : array_like
+        Implicit domain of shape (2, 3).
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    chunk_size : int, optional
+        Values count interpolated at once, keeping the intermediate arrays in
+        the processor cache.
+    out : ndarray, optional
+        C-contiguous array of the shape of the *RGB* colourspace array to
+        write the interpolated values into.
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace array, *NaN* at the *NaN* values.
+
+    Raises
+    ------
+    ValueError
+        If the *RGB* colourspace array is outside the domain, infinite values
+        included, like :class:`colour.algebra.LinearInterpolator` class does.
+
+    Examples
+    --------
+    >>> table = colour.LUT3x1D.linear_table(3) ** 2
+    >>> domain = np.array([[0, 0, 0], [1, 1, 2]])
+    >>> uniform_channels_interpolation(table, domain,
+    ...                                np.array([0.25, 0.5, 1]))
+    array([ 0.125,  0.25 ,  0.25 ])
+    """
+
+    table = np.asarray(table, dtype=np.float_)
+    domain = np.asarray(domain, dtype=np.float_)
+    RGB = np.asarray(RGB, dtype=np.float_)
+    out, RGB_o = _output(RGB, out)
+    RGB = np.ravel(RGB)
+
+    size = len(table)
+    scales = (size - 1) / (domain[1] - domain[0])
+    slopes = np.ravel(np.diff(table, axis=0, append=table[-1:]))
+    table = np.ravel(table)
+
+    for chunk, channels in _chunks(RGB, chunk_size):
+        RGB_c = RGB_o[chunk]
+        np.subtract(RGB[chunk], domain[0][channels], out=RGB_c)
+        RGB_c *= scales[channels]
+        _validate_range(RGB[chunk], RGB_c, 0, size - 1)
+
+        i, non_finite = _cells(RGB_c, size - 1)
+        RGB_c -= i
+        i *= 3
+        i += channels
+        RGB_c *= slopes[i]
+        RGB_c += table[i]
+        if non_finite is not None:
+            RGB_c[non_finite] = np.nan
+
+    return out
+
+
+def inverse_nodes(self):
+    """
+    Returns the channels nodes of the exact piecewise linear inverse of the
+    *LUT*, see :func:`channel_nodes` definition.
+
+    The nodes are cached on the *LUT* and only recomputed when its table or
+    domain changes.
+
+    Returns
+    -------
+    tuple
+        Channels nodes of the *LUT* inverse.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT3x1D(colour.LUT3x1D.linear_table(3) ** 2)
+    >>> inverse_nodes(LUT) is inverse_nodes(LUT)
+    True
+    """
+
+    cache = getattr(self, '_inverse_cache', None)
+    if (cache is not None and np.array_equal(cache[0], self._table) and
+            np.array_equal(cache[1], self._domain)):
+        return cache[2]
+
+    nodes = channel_nodes(self._table, _samples(self))
+    self._inverse_cache = (np.copy(self._table), np.copy(self._domain), nodes)
+
+    return nodes
+
+
+def invert(self, size=None):
+    """
+    Computes and returns the inverse of the *LUT*.
+
+    Parameters
+    ----------
+    size : int, optional
+        Inverse *LUT* size, defaults to the *LUT* size.
+
+    Returns
+    -------
+    LUT3x1D
+        Inverse *LUT* class instance, sampling the exact piecewise linear
+        inverse of the *LUT* uniformly over the extents of its domain.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT3x1D(colour.LUT3x1D.linear_table(1024) ** (1 / 2.2))
+    >>> LUT_inverse = invert(LUT)
+    >>> LUT_inverse.apply(LUT.apply(np.array([0.18, 0.18, 0.18])))
+    ... # doctest: +ELLIPSIS
+    array([ 0.18...,  0.18...,  0.18...])
+    """
+
+    size = self.size if size is None else size
+
+    samples = _samples(self)
+    domain = np.sort(np.vstack([samples[0], samples[-1]]), axis=0)
+
+    return colour.LUT3x1D(
+        evaluate_channels(
+            inverse_nodes(self), colour.LUT3x1D.linear_table(size, domain)),
+        '{0} Inverse'.format(self.name), domain)
+
+
+def apply(self,
+          RGB,
+          inverse=False,
+          interpolator=LinearInterpolator,
+          interpolator_kwargs=None,
+          out=None,
+          **kwargs):
+    """
+    Applies the *LUT* to given *RGB* colourspace array using given method.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array to apply the *LUT* onto.
+    inverse : boolean, optional
+        Checks if the LUT has to be applied in forward or backward
+        direction.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+    out : ndarray, optional
+        Array of the shape of the *RGB* colourspace array to write the
+        interpolated values into, it must be C-contiguous unless a custom
+        interpolator is used.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for deprecation management.
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace array.
+
+    Notes
+    -----
+    -   The three channels are processed in a single pass over the *RGB*
+        colourspace array, without splitting and stacking it.
+    -   The backward direction evaluates the exact piecewise linear inverse
+        of the *LUT*, which is cached on the *LUT* by :func:`inverse_nodes`
+        definition, the *interpolator* is only used in the forward
+        direction.
+    -   The forward direction raises a *ValueError* beyond the domain,
+        whether implicit or explicit, the backward direction linearly
+        extrapolates beyond the extents of the table.
+    -   Non-finite values are mapped to *NaN*, infinite values being beyond
+        the domain in the forward direction.
+
+    Examples
+    --------
+    >>> LUT = colour.LUT3x1D(colour.LUT3x1D.linear_table() ** (1 / 2.2))
+    >>> RGB = np.array([0.18, 0.18, 0.18])
+
+    *LUT* applied to the given *RGB* colourspace in forward direction:
+
+    >>> apply(LUT, RGB)  # doctest: +ELLIPSIS
+    array([ 0.4529220...,  0.4529220...,  0.4529220...])
+
+    *LUT* applied to the modified *RGB* colourspace in reverse direction:
+
+    >>> apply(LUT, apply(LUT, RGB), inverse=True)  # doctest: +ELLIPSIS
+    array([ 0.18...,  0.18...,  0.18...])
+    """
+
+    interpolator_kwargs = handle_arguments_deprecation({
+        'ArgumentRenamed': [['interpolator_args', 'interpolator_kwargs']],
+    }, **kwargs).get('interpolator_kwargs', interpolator_kwargs)
+
+    if inverse:
+        return evaluate_channels(inverse_nodes(self), RGB, out=out)
+
+    if interpolator is LinearInterpolator and not interpolator_kwargs:
+        if self.is_domain_explicit():
+            return evaluate_channels(
+                channel_nodes(self.domain, self._table), RGB, False, out=out)
+        else:
+            return uniform_channels_interpolation(
+                self._table, self.domain, RGB, out=out)
+
+    RGB_i = colour.LUT3x1D.apply(self, RGB, interpolator, interpolator_kwargs)
+    if out is None:
+        return RGB_i
+
+    out[...] = RGB_i
+
+    return out
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`LUT3x1D_inverse` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+import colour
+from colour.utilities import ignore_numpy_errors
+from LUT3x1D_inverse import apply, inverse_nodes, invert
+
+__all__ = ['TestInverseNodes', 'TestInvert', 'TestApply']
+
+
+def _LUT():
+    table = colour.LUT3x1D.linear_table(256) ** np.array([1 / 2.2, 1, 2.6])
+    table[:, 1] = 1 - table[:, 1]
+
+    return colour.LUT3x1D(table)
+
+
+class TestInverseNodes(unittest.TestCase):
+    """
+    Defines :func:`LUT3x1D_inverse.inverse_nodes` definition unit tests
+    methods.
+    """
+
+    def test_inverse_nodes(self):
+        """
+        Tests :func:`LUT3x1D_inverse.inverse_nodes` definition caching.
+        """
+
+        LUT = _LUT()
+        nodes = inverse_nodes(LUT)
+
+        self.assertIs(inverse_nodes(LUT), nodes)
+
+        LUT.table[128] += 0.01
+        self.assertIsNot(inverse_nodes(LUT), nodes)
+
+
+class TestInvert(unittest.TestCase):
+    """
+    Defines :func:`LUT3x1D_inverse.invert` definition unit tests methods.
+    """
+
+    def test_invert(self):
+        """
+        Tests :func:`LUT3x1D_inverse.invert` definition.
+        """
+
+        LUT = _LUT()
+        LUT_inverse = invert(LUT, 64)
+        RGB = colour.LUT3x1D.linear_table(64)
+
+        self.assertEqual(LUT_inverse.size, 64)
+        np.testing.assert_almost_equal(
+            LUT_inverse.table, apply(LUT, RGB, inverse=True), decimal=7)
+
+
+class TestApply(unittest.TestCase):
+    """
+    Defines :func:`LUT3x1D_inverse.apply` definition unit tests methods.
+    """
+
+    def test_apply(self):
+        """
+        Tests :func:`LUT3x1D_inverse.apply` definition.
+        """
+
+        LUT = _LUT()
+        RGB = np.random.RandomState(4).uniform(0, 1, (32, 32, 3))
+        out = np.empty(RGB.shape)
+
+        self.assertIs(apply(LUT, RGB, out=out), out)
+        np.testing.assert_almost_equal(out, LUT.apply(RGB), decimal=7)
+        np.testing.assert_almost_equal(
+            apply(LUT, out, inverse=True), RGB, decimal=7)
+
+        LUT = colour.LUT3x1D(LUT.table, domain=LUT.linear_table(256))
+        np.testing.assert_almost_equal(
+            apply(LUT, RGB), LUT.apply(RGB), decimal=7)
+
+    def test_raise_exception_apply(self):
+        """
+        Tests :func:`LUT3x1D_inverse.apply` definition raised exception.
+        """
+
+        LUT = _LUT()
+        LUT_e = colour.LUT3x1D(LUT.table, domain=LUT.linear_table(256))
+        for LUT_a in (LUT, LUT_e):
+            for RGB in (np.array([0.5, 1.1, 0]), np.array([-0.1, 0.5, 0]),
+                        np.array([0.5, np.nan, np.inf])):
+                self.assertRaises(ValueError, apply, LUT_a, RGB)
+
+    @ignore_numpy_errors
+    def test_nan_apply(self):
+        """
+        Tests :func:`LUT3x1D_inverse.apply` definition nan support.
+        """
+
+        LUT = _LUT()
+        LUT_e = colour.LUT3x1D(LUT.table, domain=LUT.linear_table(256))
+        RGB = np.array([[0.5, np.nan, 0.25], [0.5, 0.5, 0.5]])
+        for LUT_a in (LUT, LUT_e):
+            RGB_a = apply(LUT_a, RGB)
+            np.testing.assert_equal(np.isnan(RGB_a),
+                                    [[False, True, False], [False] * 3])
+            np.testing.assert_almost_equal(
+                RGB_a[1], LUT.apply(RGB[1]), decimal=7)
+
+        RGB_i = apply(LUT, np.array([np.inf, -np.inf, np.nan]), inverse=True)
+        self.assertTrue(np.all(np.isnan(RGB_i)))
+
+
+if __name__ == '__main__':
+    unittest.main()
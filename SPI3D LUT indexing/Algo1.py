@@ -1,3 +1,7 @@
+import gzip
+import re
+from functools import partial
+
 import numpy as np, colour
 
 from colour.constants import DEFAULT_INT_DTYPE
@@ -5,8 +9,418 @@ from colour.io.luts import LUT3D, LUTSequence
 from colour.io.luts.common import path_to_title
 from colour.utilities import as_int_array, as_float_array
 
+DUPLICATES_POLICIES = ('Raise', 'First', 'Last', 'Mean')
+"""
+Policies repairing the duplicated lattice points of unordered *.spi3d*
+*LUT* files.
+
+DUPLICATES_POLICIES : tuple
+    **{'Raise', 'First', 'Last', 'Mean'}**
+"""
+
+
+def open_SonySPI3D(path):
+    """
+    Opens given *.spi3d* *LUT* file in binary mode for reading, transparently
+    decompressing it if it is *gzip* compressed.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    file
+        *LUT* file object.
+    """
+
+    with open(path, 'rb') as spi3d_file:
+        compressed = spi3d_file.read(2) == b'\x1f\x8b'
+
+    return gzip.open(path, 'rb') if compressed else open(path, 'rb')
+
+
+def read_SonySPI3D_header(spi3d_file):
+    """
+    Reads the header of given binary *.spi3d* *LUT* file object, i.e. its
+    leading lines up to the first entry, leaving the file positioned at that
+    entry.
+
+    Parameters
+    ----------
+    spi3d_file : file
+        *LUT* file object opened in binary mode.
+
+    Returns
+    -------
+    tuple
+        *LUT* lattice sizes of shape (3, ) and header comments.
+
+    Raises
+    ------
+    ValueError
+        If the header has no size line, i.e. no line of 3 lattice sizes.
+
+    Examples
+    --------
+    >>> with open('Unordered_test.cube', 'rb') as spi3d_file:
+    ...     read_SonySPI3D_header(spi3d_file)
+    (array([4, 4, 4]), [])
+    """
+
+    sizes = None
+    comments = []
+    while True:
+        start = spi3d_file.tell()
+        line = spi3d_file.readline()
+        if not line:
+            break
+
+        line = line.decode('utf-8').strip()
+        if line.startswith('#'):
+            comments.append(line[1:].strip())
+        else:
+            tokens = line.split()
+            if len(tokens) == 3:
+                sizes = as_int_array(tokens)
+            elif len(tokens) == 6:
+                spi3d_file.seek(start)
+                break
+
+    if sizes is None:
+        raise ValueError(
+            '"{0}" "LUT" has no size header, i.e. no line of 3 lattice '
+            'sizes!'.format(getattr(spi3d_file, 'name', spi3d_file)))
+
+    return sizes, comments
+
+
+def parse_SonySPI3D(path):
+    """
+    Parses given *.spi3d* *LUT* file, the comments and the header being
+    separated in a single scan of its leading lines, see
+    :func:`read_SonySPI3D_header` definition, and the numeric body being
+    parsed in bulk rather than line by line.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    tuple
+        *LUT* lattice sizes of shape (3, ), entries indexes of shape (n, 3),
+        entries values of shape (n, 3) and comments.
+
+    Raises
+    ------
+    ValueError
+        If the body is not made of rows of 3 integral indexes and 3 values.
+
+    Notes
+    -----
+    -   The body is parsed by :func:`numpy.fromstring` definition into a
+        single array, instead of allocating a list and two arrays per row,
+        the comments it may hold being removed first.
+    -   *gzip* compressed files are decompressed, see
+        :func:`open_SonySPI3D` definition.
+
+    Examples
+    --------
+    >>> sizes, indexes, table, comments = parse_SonySPI3D(
+    ...     'Unordered_test.cube')
+    >>> sizes
+    array([4, 4, 4])
+    >>> indexes[0], table[0]
+    (array([3, 2, 0]), array([ 0.891318,  0.619823,  0.076833]))
+    """
+
+    with open_SonySPI3D(path) as spi3d_file:
+        sizes, comments = read_SonySPI3D_header(spi3d_file)
+        body = spi3d_file.read().decode('utf-8')
+
+    if '#' in body:
+        comments.extend(
+            comment.strip() for comment in re.findall('#(.*)', body))
+        body = re.sub('#.*', '', body)
+
+    values = np.fromstring(body, dtype=np.float_, sep=' ')
+    # The values are parsed as a flat array, a short row followed by a long
+    # one would shift the columns without changing their count.
+    if len(values) % 6 or any(
+            len(row.split()) not in (0, 6) for row in body.splitlines()):
+        raise ValueError(
+            '"{0}" body is not made of rows of 3 indexes and 3 values!'.format(
+                path))
+
+    values = values.reshape([-1, 6])
+    if np.any(values[:, :3] != np.around(values[:, :3])):
+        raise ValueError('"{0}" body has non-integral indexes!'.format(path))
+
+    return (sizes, values[:, :3].astype(DEFAULT_INT_DTYPE),
+            np.ascontiguousarray(values[:, 3:]), comments)
+
+
+def scatter_lattice(indexes, table, size, duplicates='Raise'):
+    """
+    Scatters given unordered entries to their flat lattice index
+    :math:`(r \\times size + g) \\times size + b`, validating that they
+    cover the lattice once.
+
+    Parameters
+    ----------
+    indexes : array_like
+        Entries indexes of shape (n, 3).
+    table : array_like
+        Entries values of shape (n, 3).
+    size : int
+        Lattice size.
+    duplicates : unicode, optional
+        **{'Raise', 'First', 'Last', 'Mean'}**,
+        Policy for the lattice points given more than once: raise, keep
+        their first or last value, or average their values.
+
+    Returns
+    -------
+    ndarray
+        Ordered table of shape (size, size, size, 3).
+
+    Raises
+    ------
+    ValueError
+        If entries are outside the lattice, if lattice points are missing,
+        or duplicated with the *Raise* policy, listing all of them.
+
+    Notes
+    -----
+    -   The validation marks the flat indexes in an occupancy bitmap of
+        *size ** 3* booleans in a single pass, the lattice being covered once
+        if all its points are marked by as many entries. The lattice points
+        are only computed for the diagnostics of the failing entries.
+
+    Examples
+    --------
+    >>> indexes = np.array([[0, 0, 1], [0, 0, 0], [0, 0, 0]])
+    >>> table = np.array([[1, 1, 1], [0, 0, 0], [0.5, 0.5, 0.5]])
+    >>> scatter_lattice(indexes, table, 1)  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    ValueError: "LUT3D" lattice of size 1 has 1 entries outside it: ...
+    >>> scatter_lattice(indexes[1:], table[1:], 1, 'Mean')
+    array([[[[ 0.25,  0.25,  0.25]]]])
+    """
+
+    if duplicates.lower() not in [
+            policy.lower() for policy in DUPLICATES_POLICIES
+    ]:
+        raise ValueError(
+            'Undefined duplicates policy used: "{0}", must be one of the '
+            'following: "{1}".'.format(duplicates,
+                                       ', '.join(DUPLICATES_POLICIES)))
+
+    indexes = as_int_array(indexes).reshape([-1, 3])
+    table = as_float_array(table).reshape([-1, 3])
+    count = size ** 3
+
+    outside = np.any((indexes < 0) | (indexes >= size), axis=-1)
+    indexes_outside = indexes[outside]
+    if len(indexes_outside):
+        indexes, table = indexes[~outside], table[~outside]
+
+    destinations = (indexes[:, 0] * size + indexes[:, 1]) * size + indexes[:, 2]
+
+    occupancy = np.zeros(count, dtype=bool)
+    occupancy[destinations] = True
+    occupied = np.count_nonzero(occupancy)
+
+    def points(flat_indexes):
+        return np.stack(
+            np.unravel_index(flat_indexes, [size, size, size]), -1).tolist()
+
+    errors = []
+    if len(indexes_outside):
+        errors.append('{0} entries outside it: "{1}"'.format(
+            len(indexes_outside), indexes_outside.tolist()))
+    if occupied < count:
+        missing = np.flatnonzero(~occupancy)
+        errors.append('{0} missing points: "{1}"'.format(
+            len(missing), points(missing)))
+    if occupied < len(destinations):
+        counts = np.bincount(destinations, minlength=count)
+        duplicated = np.flatnonzero(counts > 1)
+        if duplicates.lower() == 'raise':
+            errors.append('{0} duplicated points: "{1}"'.format(
+                len(duplicated), points(duplicated)))
 
-def read_unordered_LUT_SonySPI3D(path):
+    if errors:
+        raise ValueError('"LUT3D" lattice of size {0} has {1}!'.format(
+            size, ', '.join(errors)))
+
+    table_ordered = np.empty([count, 3])
+    if occupied == len(destinations):
+        table_ordered[destinations] = table
+    else:
+        colour.utilities.usage_warning(
+            '"LUT3D" lattice of size {0} has {1} duplicated points repaired '
+            'with "{2}" policy: "{3}"!'.format(size, len(duplicated),
+                                               duplicates,
+                                               points(duplicated)))
+
+        if duplicates.lower() == 'mean':
+            for i in range(3):
+                table_ordered[:, i] = np.bincount(
+                    destinations, table[:, i], minlength=count) / counts
+        else:
+            # Index of the first, or last, entry of each lattice point.
+            first = duplicates.lower() == 'first'
+            entries = np.full(count, len(destinations) if first else -1)
+            (np.minimum if first else np.maximum).at(
+                entries, destinations, np.arange(len(destinations)))
+            table_ordered[...] = table[entries]
+
+    return table_ordered.reshape([size, size, size, 3])
+
+
+class LazyLUT3D(LUT3D):
+    """
+    Defines a *LUT3D* proxy of a *.spi3d* *LUT* file whose header only is
+    read on instantiation, its table being read on first access.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    reader : callable, optional
+        Definition reading the *LUT* path and returning a :class:`LUT3D`
+        class instance, defaults to :func:`read_unordered_LUT_SonySPI3D`
+        definition.
+
+    Attributes
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Notes
+    -----
+    -   The *size*, *domain*, *name* and *comments* are available without
+        reading the table, as is the string representation. The *comments*
+        hold the header comments, and any comments set on the proxy, the
+        body comments not already present being appended when the table is
+        read.
+    -   Any access to the table, e.g. applying the *LUT*, reads it.
+
+    Examples
+    --------
+    >>> LUT = LazyLUT3D('Unordered_test.cube')
+    >>> LUT.size, LUT.loaded
+    (4, False)
+    >>> LUT.table[3, 2, 0], LUT.loaded
+    (array([ 0.891318,  0.619823,  0.076833]), True)
+    """
+
+    def __init__(self, path, reader=None):
+        self.path = path
+        self._reader = (read_unordered_LUT_SonySPI3D
+                        if reader is None else reader)
+
+        with open_SonySPI3D(path) as spi3d_file:
+            sizes, comments = read_SonySPI3D_header(spi3d_file)
+
+        self._size = sizes[0]
+
+        super(LazyLUT3D, self).__init__(
+            None, path_to_title(path), size=2, comments=comments)
+
+        self._table_lazy = None
+
+    @property
+    def _table(self):
+        """
+        Getter and setter property for the underlying *LUT* table, reading it
+        on first access.
+        """
+
+        if self._table_lazy is None:
+            LUT = self._reader(self.path)
+            self._table_lazy = LUT.table
+            self._comments = self._comments + [
+                comment for comment in LUT.comments
+                if comment not in self._comments
+            ]
+
+        return self._table_lazy
+
+    @_table.setter
+    def _table(self, value):
+        """
+        Setter for **self._table** property.
+        """
+
+        self._table_lazy = value
+
+    @property
+    def loaded(self):
+        """
+        Getter property for whether the *LUT* table was read.
+
+        Returns
+        -------
+        bool
+            Whether the *LUT* table was read.
+        """
+
+        return self._table_lazy is not None
+
+    @property
+    def size(self):
+        """
+        Getter property for the *LUT* size, read from the header until the
+        table is read.
+
+        Returns
+        -------
+        int
+            *LUT* size.
+        """
+
+        return self._size if self._table_lazy is None else len(
+            self._table_lazy)
+
+    def __str__(self):
+        """
+        Returns a formatted string representation of the *LUT*, from its
+        header only until the table is read.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        if self.loaded:
+            return super(LazyLUT3D, self).__str__()
+
+        comments = [
+            'Comment {0} : {1}'.format(str(i + 1).zfill(2), comment)
+            for i, comment in enumerate(self.comments)
+        ]
+
+        return ('{0} - {1}\n'
+                '{2}\n\n'
+                'Dimensions : {3}\n'
+                'Domain     : {4}\n'
+                'Size       : {5!s}{6}').format(
+                    self.__class__.__name__, self.name,
+                    '-' * (len(self.__class__.__name__) + 3 + len(self.name)),
+                    self.dimensions,
+                    str(self.domain).replace(' [', ' ' * 14 + '['),
+                    (self.size, ) * 3 + (3, ), '\n{0}'.format(
+                        '\n'.join(comments)) if comments else '')
+
+
+def read_unordered_LUT_SonySPI3D(path, lazy=False, duplicates='Raise'):
     """
     Reads given unordered *.spi3d* *LUT* file.
 
@@ -14,42 +428,147 @@ def read_unordered_LUT_SonySPI3D(path):
     ----------
     path : unicode
         *LUT* path.
+    lazy : bool, optional
+        Whether to only read the header and return a :class:`LazyLUT3D`
+        class instance, reading the table on first access.
+    duplicates : unicode, optional
+        **{'Raise', 'First', 'Last', 'Mean'}**,
+        Policy for the lattice points given more than once, see
+        :func:`scatter_lattice` definition.
 
     Returns
     -------
     LUT3D or LUT3x1D
         :class:`LUT3D` or :class:`LUT3x1D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If entries are outside the *LUT* lattice, if lattice points are
+        missing, or duplicated with the *Raise* policy.
+
+    Notes
+    -----
+    -   Each entry is scattered to its flat lattice index in a single
+        vectorized step, validated with an occupancy bitmap in the same
+        pass, see :func:`scatter_lattice` definition, ordering is thus
+        linear in the entries count for any size.
+    -   The file is parsed in bulk by :func:`parse_SonySPI3D` definition.
     """
 
+    if lazy:
+        return LazyLUT3D(
+            path, partial(read_unordered_LUT_SonySPI3D, duplicates=duplicates))
+
     title = path_to_title(path)
     domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
-    indexes = []
-    comments = []
-    table_unordered = []
-    table_ordered = []
-    
-    with open(path) as spi3d_file:
-        lines = filter(None, (line.strip() for line in spi3d_file.readlines()))
-        for line in lines:
-            if line.startswith('#'):
-                comments.append(line[1:].strip())
-                continue
 
-            tokens = line.split()
-            if len(tokens) == 3:
-                size = DEFAULT_INT_DTYPE(tokens[0])
-                
-            if len(tokens) == 6:
-                indexes.append(as_int_array(tokens[:3]))
-                table_unordered.append(as_float_array(tokens[3:]))
-
-    test_indexes = np.around(LUT3D.linear_table(size) * (size - 1)).reshape((-1, 3))
-    for i in range(64):
-        for j in range(64):
-            if (np.array_equal(test_indexes[i], indexes[j])):
-                table_ordered.append(table_unordered[j])
-    
-    table_ordered = as_float_array(table_ordered).reshape([size, size, size, 3])
-    
+    sizes, indexes, table_unordered, comments = parse_SonySPI3D(path)
+    table_ordered = scatter_lattice(indexes, table_unordered, sizes[0],
+                                    duplicates)
+
     return LUT3D(
             table_ordered, title, np.vstack([domain_min, domain_max]), comments=comments)
+
+
+def write_unordered_LUT_SonySPI3D(LUT,
+                                  path,
+                                  decimals=7,
+                                  order=None,
+                                  compress=False,
+                                  compresslevel=1,
+                                  chunk_size=65536):
+    """
+    Writes given *LUT* to given *.spi3d* *LUT* file, in lattice order or in
+    given order.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        :class:`LUT3D` class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+    order : array_like, optional
+        Permutation of the flat lattice indexes the entries are written in,
+        defaults to the lattice order.
+    compress : bool, optional
+        Whether to *gzip* compress the file.
+    compresslevel : int, optional
+        *gzip* compression level, the fastest level compressing a *LUT*
+        almost as much as the slowest one.
+    chunk_size : int, optional
+        Entries count formatted at once.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the order is not a permutation of the flat lattice indexes.
+
+    Notes
+    -----
+    -   The index columns are built with :func:`numpy.indices` definition,
+        and each chunk of entries is formatted by a single string formatting
+        operation rather than one per entry.
+    -   The comments are written after the header, so that
+        :class:`LazyLUT3D` class reads them without reading the table.
+
+    Examples
+    --------
+    >>> LUT = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'My LUT',
+    ...             comments=['A first comment.', 'A second comment.'])
+    >>> order = np.random.RandomState(4).permutation(16 ** 3)
+    >>> write_unordered_LUT_SonySPI3D(LUT, 'My_LUT.spi3d', order=order)
+    ... # doctest: +SKIP
+    True
+    """
+
+    assert isinstance(LUT, LUT3D), '"LUT" must be a 3D "LUT"!'
+
+    assert np.array_equal(LUT.domain, np.array([
+        [0, 0, 0],
+        [1, 1, 1],
+    ])), '"LUT" domain must be [[0, 0, 0], [1, 1, 1]]!'
+
+    size = LUT.size
+    entries = np.hstack([
+        np.reshape(np.indices([size, size, size]), [3, -1]).T,
+        np.reshape(LUT.table, [-1, 3])
+    ])
+
+    if order is not None:
+        order = as_int_array(order)
+        if (order.shape != (size ** 3, ) or
+                np.any((order < 0) | (order >= size ** 3)) or
+                np.any(np.bincount(order, minlength=size ** 3) != 1)):
+            raise ValueError(
+                'Order is not a permutation of the "LUT3D" flat lattice '
+                'indexes!')
+
+        entries = entries[order]
+
+    row = '%d %d %d {0} {0} {0}\n'.format('%.{0}f'.format(decimals))
+
+    with (gzip.open(path, 'wt', compresslevel) if compress else open(
+            path, 'w')) as spi3d_file:
+        spi3d_file.write('SPILUT 1.0\n')
+
+        spi3d_file.write('3 3\n')
+
+        spi3d_file.write('{0} {0} {0}\n'.format(size))
+
+        for comment in LUT.comments:
+            spi3d_file.write('# {0}\n'.format(comment))
+
+        for start in range(0, len(entries), chunk_size):
+            chunk = entries[start:start + chunk_size]
+            spi3d_file.write(
+                (row * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+    return True
@@ -1,3 +1,11 @@
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import numpy as np, colour
 
 from colour.constants import DEFAULT_INT_DTYPE
@@ -5,42 +13,350 @@ from colour.io.luts import LUT3D, LUTSequence
 from colour.io.luts.common import path_to_title
 from colour.utilities import as_int_array, as_float_array
 
+from Algo1 import LazyLUT3D, parse_SonySPI3D, scatter_lattice
+
+
+SIDECAR_METADATA_KEYS = frozenset(['key', 'name', 'domain', 'comments'])
+"""
+Keys of the metadata of a binary sidecar cache, see :func:`write_sidecar`
+definition.
+"""
+
+
+def sidecar_directory(path, cache_directory=None):
+    """
+    Returns the directory of the binary sidecar cache of given *LUT* path.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    cache_directory : unicode, optional
+        Directory holding the sidecar caches, e.g. when the *LUT* directory
+        is read-only, defaults to the *LUT* directory.
+
+    Returns
+    -------
+    unicode
+        Sidecar cache directory, hidden in the *LUT* directory by default,
+        i.e. *.<name>.cache*, so that it is not matched by the glob patterns
+        of the *LUTs*.
+    """
+
+    path = os.path.abspath(path)
+    if cache_directory is None:
+        directory, name = os.path.split(path)
+
+        return os.path.join(directory, '.{0}.cache'.format(name))
+
+    return os.path.join(
+        cache_directory, '{0}.cache'.format(
+            hashlib.sha1(path.encode('utf-8')).hexdigest()))
+
+
+def sidecar_key(path, duplicates='Raise'):
+    """
+    Returns the key of given *LUT* path in its sidecar cache, i.e. its
+    absolute path, modification time and size, and the duplicates policy
+    its table is ordered with.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    duplicates : unicode, optional
+        **{'Raise', 'First', 'Last', 'Mean'}**,
+        Duplicates policy, see :func:`Algo1.scatter_lattice` definition.
+
+    Returns
+    -------
+    list
+        Sidecar cache key.
+    """
+
+    stat = os.stat(path)
+
+    return [
+        os.path.abspath(path), stat.st_mtime_ns, stat.st_size,
+        duplicates.lower()
+    ]
+
+
+def write_sidecar(LUT, key, cache_directory=None):
+    """
+    Writes given *LUT* ordered table, domain and comments to the binary
+    sidecar cache of the *LUT* path of given key.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        *LUT* read from the path of the key.
+    key : list
+        Sidecar cache key of the *LUT* path, taken before reading it, see
+        :func:`sidecar_key` definition.
+    cache_directory : unicode, optional
+        Directory holding the sidecar caches, defaults to the *LUT*
+        directory.
+
+    Notes
+    -----
+    -   The files are written under temporary names and atomically renamed,
+        the metadata last, so that concurrent readers never load a partially
+        written table.
+    """
+
+    directory = sidecar_directory(key[0], cache_directory)
+    os.makedirs(directory, exist_ok=True)
+
+    def replace(name, write):
+        with tempfile.NamedTemporaryFile(
+                'wb', dir=directory, suffix=name, delete=False) as cache_file:
+            write(cache_file)
+        os.replace(cache_file.name, os.path.join(directory, name))
+
+    replace('table.npy', lambda cache_file: np.save(cache_file, LUT.table))
+    replace(
+        'LUT.json', lambda cache_file: cache_file.write(
+            json.dumps({
+                'key': key,
+                'name': LUT.name,
+                'domain': LUT.domain.tolist(),
+                'comments': LUT.comments,
+            }, indent=4).encode('utf-8')))
+
+
+def read_sidecar(key, cache_directory=None, mmap_mode='r'):
+    """
+    Reads the *LUT* of given key from its binary sidecar cache, if it is
+    current.
+
+    Parameters
+    ----------
+    key : list
+        Sidecar cache key of the *LUT* path, see :func:`sidecar_key`
+        definition.
+    cache_directory : unicode, optional
+        Directory holding the sidecar caches, defaults to the *LUT*
+        directory.
+    mmap_mode : unicode, optional
+        Memory-map mode of the table, see :func:`numpy.load` definition,
+        *None* loads it in memory.
+
+    Returns
+    -------
+    LUT3D
+        :class:`LUT3D` class instance whose table is memory-mapped, or
+        *None* if the sidecar cache is missing, corrupt or stale.
+    """
+
+    directory = sidecar_directory(key[0], cache_directory)
+    try:
+        with open(os.path.join(directory, 'LUT.json')) as json_file:
+            metadata = json.load(json_file)
+
+        if (not isinstance(metadata, dict) or
+                not SIDECAR_METADATA_KEYS.issubset(metadata) or
+                metadata['key'] != key):
+            return None
+
+        table = np.load(
+            os.path.join(directory, 'table.npy'), mmap_mode=mmap_mode)
+        if table.ndim != 4 or table.shape != (len(table), ) * 3 + (3, ):
+            return None
 
-def read_LUT_UnorderedSonySPI3D(path):
-        title = path_to_title(path)
-        domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
-        size = 2
-        indexes = []
-        table = []
-        comments = []
-        with open(path) as spi3d_file:
-            lines = filter(None,
-                           (line.strip() for line in spi3d_file.readlines()))
-            for line in lines:
-                if line.startswith('#'):
-                    comments.append(line[1:].strip())
-                    continue
-                tokens = line.split()
-                if len(tokens) == 3:
-                    assert len(set(tokens)) == 1, (
-                        'Non-uniform "LUT" shape is unsupported!')
-                    size = DEFAULT_INT_DTYPE(tokens[0])
-                if len(tokens) == 6:
-                    indexes.append(as_int_array(tokens[:3]))
-                    table.append(as_float_array(tokens[3:]))
-        indexes = as_int_array(indexes)
-        sorting_indexes = np.lexsort((indexes[:,2], indexes[:,1], indexes[:,0]))
-        #print(sorting_indexes)
-        assert np.array_equal(
-            indexes[sorting_indexes],
-            DEFAULT_INT_DTYPE(np.around(
-                LUT3D.linear_table(size) * (size - 1))).reshape(
-                (-1, 3))), 'Indexes do not match expected "LUT3D" indexes!'
-        table = as_float_array(table)[sorting_indexes].reshape([size, size, size, 3])
         return LUT3D(
-            table, title, np.vstack([domain_min, domain_max]),
-            comments=comments)
+            table,
+            metadata['name'],
+            np.array(metadata['domain']),
+            comments=metadata['comments'])
+    except (KeyError, OSError, TypeError, ValueError):
+        return None
+
+
+def read_LUT_UnorderedSonySPI3D(path,
+                                cache=False,
+                                cache_directory=None,
+                                lazy=False,
+                                duplicates='Raise'):
+    """
+    Reads given unordered *.spi3d* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    cache : bool, optional
+        Whether to read the *LUT* from its binary sidecar cache when it is
+        current, i.e. when the *LUT* path, modification time and size did
+        not change, and to write it otherwise.
+    cache_directory : unicode, optional
+        Directory holding the sidecar caches, defaults to the *LUT*
+        directory.
+    lazy : bool, optional
+        Whether to only read the header and return a
+        :class:`Algo1.LazyLUT3D` class instance, reading the table, possibly
+        through the sidecar cache, on first access.
+    duplicates : unicode, optional
+        **{'Raise', 'First', 'Last', 'Mean'}**,
+        Policy for the lattice points given more than once, see
+        :func:`Algo1.scatter_lattice` definition.
+
+    Returns
+    -------
+    LUT3D
+        :class:`LUT3D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If entries are outside the *LUT* lattice, if lattice points are
+        missing, or duplicated with the *Raise* policy, listing all of them.
+
+    Notes
+    -----
+    -   A *LUT* read from its sidecar cache has a read-only table
+        memory-mapped with :func:`numpy.load` definition, the processes
+        reading it thus share a single page-cached copy, and neither parse
+        nor validate it again.
+    -   The sidecar cache failing to be written only issues a warning.
+    """
+
+    if lazy:
+        return LazyLUT3D(
+            path,
+            partial(
+                read_LUT_UnorderedSonySPI3D,
+                cache=cache,
+                cache_directory=cache_directory,
+                duplicates=duplicates))
+
+    if cache:
+        key = sidecar_key(path, duplicates)
+        LUT = read_sidecar(key, cache_directory)
+        if LUT is not None:
+            return LUT
+
+    title = path_to_title(path)
+    domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
+    sizes, indexes, table, comments = parse_SonySPI3D(path)
+    assert len(set(sizes)) == 1, (
+        'Non-uniform "LUT" shape is unsupported!')
+    table = scatter_lattice(indexes, table, sizes[0], duplicates)
+    LUT = LUT3D(
+        table, title, np.vstack([domain_min, domain_max]),
+        comments=comments)
+
+    if cache:
+        try:
+            write_sidecar(LUT, key, cache_directory)
+        except (IOError, OSError) as error:
+            colour.utilities.usage_warning(
+                '"{0}" sidecar cache could not be written: {1}'.format(
+                    path, error))
+
+    return LUT
+
+
+def _read_LUT_UnorderedSonySPI3D(arguments):
+    """
+    Reads given unordered *.spi3d* *LUT* file in a worker process, returning
+    the key of its sidecar cache rather than the *LUT* when caching, and the
+    raised exception rather than raising it.
+    """
+
+    path, cache, cache_directory, duplicates = arguments
+    try:
+        if cache:
+            key = sidecar_key(path, duplicates)
+            read_LUT_UnorderedSonySPI3D(
+                path, cache, cache_directory, duplicates=duplicates)
+
+            return key, None
+        else:
+            return read_LUT_UnorderedSonySPI3D(
+                path, duplicates=duplicates), None
+    except Exception as error:
+        return None, error
+
+
+def read_LUTs_UnorderedSonySPI3D(paths,
+                                 processes=None,
+                                 cache=False,
+                                 cache_directory=None,
+                                 duplicates='Raise'):
+    """
+    Reads given unordered *.spi3d* *LUT* files across a pool of processes.
+
+    Parameters
+    ----------
+    paths : unicode or iterable
+        *LUT* paths, or glob pattern matching them.
+    processes : int, optional
+        Processes count, defaults to the processors count, *1* reads the
+        files in the calling process.
+    cache : bool, optional
+        Whether to read the *LUTs* through their binary sidecar caches, see
+        :func:`read_LUT_UnorderedSonySPI3D` definition.
+    cache_directory : unicode, optional
+        Directory holding the sidecar caches, defaults to the *LUTs*
+        directories.
+    duplicates : unicode, optional
+        **{'Raise', 'First', 'Last', 'Mean'}**,
+        Policy for the lattice points given more than once, see
+        :func:`Algo1.scatter_lattice` definition.
+
+    Returns
+    -------
+    tuple
+        :class:`LUT3D` class instances in the order of the paths, *None*
+        for the files that failed to be read, and the failed paths with the
+        exception they raised.
+
+    Notes
+    -----
+    -   Matched glob patterns are sorted, and only match files.
+    -   When caching, the worker processes write the sidecar caches and
+        only return their keys, the calling process memory-maps the tables
+        instead of receiving pickled copies.
+
+    Examples
+    --------
+    >>> LUTs, errors = read_LUTs_UnorderedSonySPI3D('*.cube')
+    >>> [LUT.size for LUT in LUTs], errors
+    ([4], [])
+    """
+
+    if isinstance(paths, str):
+        paths = sorted(filter(os.path.isfile, glob.glob(paths)))
+    else:
+        paths = list(paths)
+
+    arguments = [(path, cache, cache_directory, duplicates) for path in paths]
+    if processes == 1:
+        results = [
+            _read_LUT_UnorderedSonySPI3D(argument) for argument in arguments
+        ]
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            results = list(
+                executor.map(_read_LUT_UnorderedSonySPI3D, arguments))
+
+    LUTs, errors = [], []
+    for path, (result, error) in zip(paths, results):
+        if error is None and cache:
+            result = read_sidecar(result, cache_directory)
+            if result is None:
+                result, error = _read_LUT_UnorderedSonySPI3D(
+                    (path, False, None, duplicates))
+
+        if error is not None:
+            errors.append((path, error))
+
+        LUTs.append(result)
+
+    return LUTs, errors
 
 
-NJW = read_LUT_UnorderedSonySPI3D('/home/njwardhan/Desktop/Unordered_test.cube')
-#print(NJW)
+if __name__ == '__main__':
+    NJW = read_LUT_UnorderedSonySPI3D('/home/njwardhan/Desktop/Unordered_test.cube')
+    #print(NJW)
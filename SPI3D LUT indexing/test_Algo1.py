@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`Algo1` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import colour
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from Algo1 import (LazyLUT3D, parse_SonySPI3D, read_unordered_LUT_SonySPI3D,
+                   scatter_lattice, write_unordered_LUT_SonySPI3D)
+
+__all__ = [
+    'RESOURCES_DIRECTORY', 'TestParseSonySPI3D', 'TestScatterLattice',
+    'TestLazyLUT3D', 'TestReadUnorderedLUTSonySPI3D',
+    'TestWriteUnorderedLUTSonySPI3D'
+]
+
+RESOURCES_DIRECTORY = os.path.dirname(__file__)
+
+
+def _write_LUT(path, indexes, size=3):
+    with open(path, 'w') as spi3d_file:
+        spi3d_file.write('SPILUT 1.0\n3 3\n{0} {0} {0}\n'.format(size))
+        for r, g, b in indexes:
+            spi3d_file.write('{0} {1} {2} {0} {1} {2}\n'.format(r, g, b))
+
+
+class TestParseSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`Algo1.parse_SonySPI3D` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_parse_SonySPI3D(self):
+        """
+        Tests :func:`Algo1.parse_SonySPI3D` definition.
+        """
+
+        sizes, indexes, table, comments = parse_SonySPI3D(
+            os.path.join(RESOURCES_DIRECTORY, 'Unordered_test.cube'))
+
+        np.testing.assert_equal(sizes, np.array([4, 4, 4]))
+        self.assertEqual(indexes.shape, (64, 3))
+        self.assertEqual(table.shape, (64, 3))
+        self.assertEqual(comments,
+                         ['Adapted from a LUT generated by Foundry::LUT.'])
+
+        path = os.path.join(self._temporary_directory, 'comments.spi3d')
+        with open(path, 'w') as spi3d_file:
+            spi3d_file.write('# Header\nSPILUT 1.0\n3 3\n2 2 2\n'
+                             '0 0 0 0.0 0.0 0.0\n'
+                             '# Body\n'
+                             '0 0 1 0.0 0.0 1.0\n')
+
+        sizes, indexes, table, comments = parse_SonySPI3D(path)
+
+        np.testing.assert_equal(indexes, np.array([[0, 0, 0], [0, 0, 1]]))
+        np.testing.assert_equal(table, np.array([[0, 0, 0], [0, 0, 1]]))
+        self.assertEqual(comments, ['Header', 'Body'])
+
+    def test_raise_exception_parse_SonySPI3D(self):
+        """
+        Tests :func:`Algo1.parse_SonySPI3D` definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'invalid.spi3d')
+        with open(path, 'w') as spi3d_file:
+            spi3d_file.write('SPILUT 1.0\n3 3\n2 2 2\n'
+                             '0 0 0 0.0 0.0 0.0\n0 0 1 0.0\n')
+
+        self.assertRaises(ValueError, parse_SonySPI3D, path)
+
+        for body in ('0 0 0 0.0 0.0 0.0\n0 0 1 0.0 0.0\n'
+                     '0 1 0 0.0 1.0 0.0 0.0\n',
+                     '0 0 0.5 0.0 0.0 0.0\n'):
+            with open(path, 'w') as spi3d_file:
+                spi3d_file.write('SPILUT 1.0\n3 3\n2 2 2\n' + body)
+
+            self.assertRaises(ValueError, parse_SonySPI3D, path)
+
+        with open(path, 'w') as spi3d_file:
+            spi3d_file.write('SPILUT 1.0\n3 3\n0 0 0 0.0 0.0 0.0\n')
+
+        with self.assertRaises(ValueError) as context:
+            parse_SonySPI3D(path)
+
+        self.assertIn('no size header', str(context.exception))
+        self.assertRaises(ValueError, LazyLUT3D, path)
+
+
+class TestScatterLattice(unittest.TestCase):
+    """
+    Defines :func:`Algo1.scatter_lattice` definition unit tests methods.
+    """
+
+    def test_scatter_lattice(self):
+        """
+        Tests :func:`Algo1.scatter_lattice` definition.
+        """
+
+        indexes = np.stack(np.unravel_index(np.arange(27), [3, 3, 3]), -1)
+        table = np.random.RandomState(4).uniform(0, 1, (27, 3))
+        order = np.random.RandomState(4).permutation(27)
+
+        np.testing.assert_equal(
+            scatter_lattice(indexes[order], table[order], 3),
+            np.reshape(table, [3, 3, 3, 3]))
+
+        indexes = np.vstack([indexes, indexes[13:14]])
+        table = np.vstack([table, table[13:14] + 1])
+        for duplicates, offset in (('First', 0), ('Last', 1), ('Mean', 0.5)):
+            np.testing.assert_almost_equal(
+                scatter_lattice(indexes, table, 3, duplicates)[1, 1, 1],
+                table[13] + offset,
+                decimal=7)
+
+    def test_raise_exception_scatter_lattice(self):
+        """
+        Tests :func:`Algo1.scatter_lattice` definition raised exception.
+        """
+
+        indexes = np.stack(np.unravel_index(np.arange(27), [3, 3, 3]), -1)
+        indexes = np.vstack([indexes[1:], [[1, 1, 1], [0, 3, 0]]])
+        table = np.zeros(indexes.shape)
+
+        with self.assertRaises(ValueError) as context:
+            scatter_lattice(indexes, table, 3)
+
+        message = str(context.exception)
+        for diagnostic in ('1 entries outside it: "[[0, 3, 0]]"',
+                           '1 missing points: "[[0, 0, 0]]"',
+                           '1 duplicated points: "[[1, 1, 1]]"'):
+            self.assertIn(diagnostic, message)
+
+        self.assertRaises(ValueError, scatter_lattice, indexes[:-1],
+                          table[:-1], 3, 'Undefined')
+
+
+class TestLazyLUT3D(unittest.TestCase):
+    """
+    Defines :class:`Algo1.LazyLUT3D` class unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_LazyLUT3D(self):
+        """
+        Tests :class:`Algo1.LazyLUT3D` class.
+        """
+
+        path = os.path.join(RESOURCES_DIRECTORY, 'Unordered_test.cube')
+        LUT = LazyLUT3D(path)
+
+        self.assertEqual(LUT.size, 4)
+        self.assertEqual(LUT.name, 'Unordered test')
+        self.assertEqual(LUT.comments, [])
+        self.assertFalse(LUT.loaded)
+
+        np.testing.assert_equal(LUT.apply(np.array([0.5, 0.5, 0.5])),
+                                read_unordered_LUT_SonySPI3D(path).apply(
+                                    np.array([0.5, 0.5, 0.5])))
+        self.assertTrue(LUT.loaded)
+        self.assertEqual(LUT.comments,
+                         ['Adapted from a LUT generated by Foundry::LUT.'])
+
+        self.assertIsInstance(
+            read_unordered_LUT_SonySPI3D(path, lazy=True), LazyLUT3D)
+
+    def test_comments(self):
+        """
+        Tests :attr:`Algo1.LazyLUT3D.comments` attribute stability.
+        """
+
+        path = os.path.join(self._temporary_directory, 'comments.spi3d')
+        with open(path, 'w') as spi3d_file:
+            spi3d_file.write('# Header\nSPILUT 1.0\n3 3\n2 2 2\n')
+            for index in np.ndindex(2, 2, 2):
+                spi3d_file.write('{0} {1} {2} 0 0 0\n'.format(*index))
+            spi3d_file.write('# Body\n')
+
+        LUT = LazyLUT3D(path)
+        self.assertEqual(LUT.comments, ['Header'])
+
+        LUT.comments = LUT.comments + ['Browsed']
+        LUT.table
+        self.assertEqual(LUT.comments, ['Header', 'Browsed', 'Body'])
+
+    def test__str__(self):
+        """
+        Tests :meth:`Algo1.LazyLUT3D.__str__` method.
+        """
+
+        path = os.path.join(RESOURCES_DIRECTORY, 'Unordered_test.cube')
+        LUT = LazyLUT3D(path)
+
+        self.assertIn('Size       : (4, 4, 4, 3)', str(LUT))
+        self.assertFalse(LUT.loaded)
+
+        LUT.table
+        self.assertTrue(str(LUT).startswith(str(LazyLUT3D(path))))
+
+
+class TestReadUnorderedLUTSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`Algo1.read_unordered_LUT_SonySPI3D` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_unordered_LUT_SonySPI3D(self):
+        """
+        Tests :func:`Algo1.read_unordered_LUT_SonySPI3D` definition.
+        """
+
+        LUT = read_unordered_LUT_SonySPI3D(
+            os.path.join(RESOURCES_DIRECTORY, 'Unordered_test.cube'))
+
+        self.assertEqual(LUT.size, 4)
+        np.testing.assert_almost_equal(
+            LUT.table[3, 2, 0], np.array([0.891318, 0.619823, 0.076833]),
+            decimal=7)
+
+        indexes = np.stack(
+            np.unravel_index(np.arange(125), [5, 5, 5]), -1)
+        path = os.path.join(self._temporary_directory, 'shuffled.spi3d')
+        _write_LUT(path, np.random.RandomState(4).permutation(indexes), 5)
+
+        np.testing.assert_equal(
+            read_unordered_LUT_SonySPI3D(path).table,
+            np.reshape(indexes, [5, 5, 5, 3]))
+
+    def test_raise_exception_read_unordered_LUT_SonySPI3D(self):
+        """
+        Tests :func:`Algo1.read_unordered_LUT_SonySPI3D` definition raised
+        exception.
+        """
+
+        indexes = np.stack(np.unravel_index(np.arange(27), [3, 3, 3]), -1)
+        path = os.path.join(self._temporary_directory, 'invalid.spi3d')
+
+        for invalid in (np.vstack([indexes[:-1], indexes[:1]]), indexes[:-1],
+                        np.vstack([indexes[:-1], [[0, 0, 3]]])):
+            _write_LUT(path, invalid)
+            self.assertRaises(ValueError, read_unordered_LUT_SonySPI3D, path)
+
+
+class TestWriteUnorderedLUTSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`Algo1.write_unordered_LUT_SonySPI3D` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_unordered_LUT_SonySPI3D(self):
+        """
+        Tests :func:`Algo1.write_unordered_LUT_SonySPI3D` definition.
+        """
+
+        LUT = colour.LUT3D(
+            colour.LUT3D.linear_table(9) ** (1 / 2.2),
+            'Writing test',
+            comments=['A first comment.', 'A second comment.'])
+        order = np.random.RandomState(4).permutation(9 ** 3)
+
+        path = os.path.join(self._temporary_directory, 'Writing_test.spi3d')
+        for order_w, compress in ((None, False), (order, False),
+                                  (order, True)):
+            write_unordered_LUT_SonySPI3D(
+                LUT, path, order=order_w, compress=compress, chunk_size=100)
+            LUT_r = read_unordered_LUT_SonySPI3D(path)
+
+            np.testing.assert_almost_equal(LUT_r.table, LUT.table, decimal=7)
+            self.assertEqual(LUT_r.name, LUT.name)
+            self.assertEqual(LUT_r.comments, LUT.comments)
+            self.assertEqual(LazyLUT3D(path).comments, LUT.comments)
+
+        write_unordered_LUT_SonySPI3D(LUT, path, decimals=3)
+        np.testing.assert_array_equal(
+            colour.read_LUT(path).table, np.around(LUT.table, 3))
+
+    def test_raise_exception_write_unordered_LUT_SonySPI3D(self):
+        """
+        Tests :func:`Algo1.write_unordered_LUT_SonySPI3D` definition raised
+        exception.
+        """
+
+        LUT = colour.LUT3D(size=3)
+        path = os.path.join(self._temporary_directory, 'invalid.spi3d')
+
+        for order in (np.zeros(27), np.arange(26), np.arange(1, 28)):
+            self.assertRaises(ValueError, write_unordered_LUT_SonySPI3D, LUT,
+                              path, order=order)
+
+
+if __name__ == '__main__':
+    unittest.main()
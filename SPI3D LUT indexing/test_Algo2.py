@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`Algo2` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from Algo2 import (read_LUT_UnorderedSonySPI3D, read_LUTs_UnorderedSonySPI3D,
+                   sidecar_directory)
+
+__all__ = [
+    'RESOURCES_DIRECTORY', 'TestReadLUTUnorderedSonySPI3D',
+    'TestReadLUTsUnorderedSonySPI3D'
+]
+
+RESOURCES_DIRECTORY = os.path.dirname(__file__)
+
+
+class TestReadLUTUnorderedSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`Algo2.read_LUT_UnorderedSonySPI3D` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._path = os.path.join(self._temporary_directory,
+                                  'Unordered_test.cube')
+        shutil.copy(
+            os.path.join(RESOURCES_DIRECTORY, 'Unordered_test.cube'),
+            self._path)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUT_UnorderedSonySPI3D(self):
+        """
+        Tests :func:`Algo2.read_LUT_UnorderedSonySPI3D` definition.
+        """
+
+        LUT = read_LUT_UnorderedSonySPI3D(self._path)
+
+        self.assertEqual(LUT.size, 4)
+        self.assertFalse(os.path.exists(sidecar_directory(self._path)))
+
+    def test_read_LUT_UnorderedSonySPI3D_cache(self):
+        """
+        Tests :func:`Algo2.read_LUT_UnorderedSonySPI3D` definition sidecar
+        cache.
+        """
+
+        LUT = read_LUT_UnorderedSonySPI3D(self._path, cache=True)
+        LUT_c = read_LUT_UnorderedSonySPI3D(self._path, cache=True)
+
+        self.assertFalse(LUT_c.table.flags.writeable)
+        self.assertEqual(LUT_c, LUT)
+        self.assertEqual(LUT_c.name, LUT.name)
+        self.assertEqual(LUT_c.comments, LUT.comments)
+
+        with open(self._path, 'a') as spi3d_file:
+            spi3d_file.write('# Modified.\n')
+
+        self.assertTrue(
+            read_LUT_UnorderedSonySPI3D(self._path, cache=True)
+            .table.flags.writeable)
+        self.assertFalse(
+            read_LUT_UnorderedSonySPI3D(self._path, cache=True)
+            .table.flags.writeable)
+
+        cache_directory = os.path.join(self._temporary_directory, 'cache')
+        read_LUT_UnorderedSonySPI3D(self._path, True, cache_directory)
+        np.testing.assert_equal(
+            read_LUT_UnorderedSonySPI3D(self._path, True,
+                                        cache_directory).table, LUT.table)
+        self.assertTrue(
+            os.path.exists(
+                sidecar_directory(self._path, cache_directory)))
+
+        LUT_l = read_LUT_UnorderedSonySPI3D(self._path, True, lazy=True)
+        self.assertFalse(LUT_l.loaded)
+        self.assertFalse(LUT_l.table.flags.writeable)
+
+    def test_read_LUT_UnorderedSonySPI3D_corrupt_cache(self):
+        """
+        Tests :func:`Algo2.read_LUT_UnorderedSonySPI3D` definition corrupt
+        sidecar cache.
+        """
+
+        LUT = read_LUT_UnorderedSonySPI3D(self._path, cache=True)
+        table_path = os.path.join(
+            sidecar_directory(self._path), 'table.npy')
+        json_path = os.path.join(sidecar_directory(self._path), 'LUT.json')
+        with open(json_path) as json_file:
+            metadata = json.load(json_file)
+
+        def truncate(path):
+            with open(path, 'r+b') as npy_file:
+                npy_file.truncate(64)
+
+        def write_metadata(metadata):
+            with open(json_path, 'w') as json_file:
+                json.dump(metadata, json_file)
+
+        for corrupt in (
+                os.remove, truncate,
+                lambda x: write_metadata([]),
+                lambda x: write_metadata({'key': metadata['key']}),
+                lambda x: np.save(x, np.zeros([4, 4, 3]))):
+            corrupt(table_path)
+
+            LUT_c = read_LUT_UnorderedSonySPI3D(self._path, cache=True)
+            self.assertTrue(LUT_c.table.flags.writeable)
+            self.assertEqual(LUT_c, LUT)
+
+            self.assertFalse(
+                read_LUT_UnorderedSonySPI3D(self._path, cache=True)
+                .table.flags.writeable)
+
+
+class TestReadLUTsUnorderedSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`Algo2.read_LUTs_UnorderedSonySPI3D` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUTs_UnorderedSonySPI3D(self):
+        """
+        Tests :func:`Algo2.read_LUTs_UnorderedSonySPI3D` definition.
+        """
+
+        paths = [
+            os.path.join(self._temporary_directory, '{0}.spi3d'.format(name))
+            for name in ('c', 'a', 'b')
+        ]
+        shutil.copy(
+            os.path.join(RESOURCES_DIRECTORY, 'Unordered_test.cube'),
+            paths[0])
+        shutil.copy(
+            os.path.join(RESOURCES_DIRECTORY, 'Unordered_test.cube'),
+            paths[2])
+        with open(paths[1], 'w') as spi3d_file:
+            spi3d_file.write('SPILUT 1.0\n3 3\n2 2 2\n0 0 0 0 0 0\n')
+
+        LUT = read_LUT_UnorderedSonySPI3D(paths[0])
+        for processes, cache in ((2, False), (2, True), (1, True)):
+            LUTs, errors = read_LUTs_UnorderedSonySPI3D(
+                paths, processes, cache)
+
+            self.assertEqual(LUTs, [LUT, None, LUT])
+            self.assertEqual([path for path, error in errors], [paths[1]])
+            self.assertIsInstance(errors[0][1], ValueError)
+
+        LUTs, errors = read_LUTs_UnorderedSonySPI3D(
+            os.path.join(self._temporary_directory, '*.spi3d'), 2)
+        self.assertEqual(LUTs, [None, LUT, LUT])
+
+        os.makedirs(
+            os.path.join(self._temporary_directory, 'd.spi3d.cache'))
+        for _i in range(2):
+            LUTs, errors = read_LUTs_UnorderedSonySPI3D(
+                os.path.join(self._temporary_directory, '*.spi3d*'), 1, True)
+            self.assertEqual(LUTs, [None, LUT, LUT])
+            self.assertEqual([path for path, error in errors], [paths[1]])
+
+        LUTs, errors = read_LUTs_UnorderedSonySPI3D(
+            (path for path in paths), 1)
+        self.assertEqual(LUTs, [LUT, None, LUT])
+        self.assertEqual([path for path, error in errors], [paths[1]])
+
+
+if __name__ == '__main__':
+    unittest.main()